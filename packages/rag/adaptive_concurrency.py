@@ -0,0 +1,112 @@
+"""적응형 동시성 모듈 - AIMD(가산 증가 / 승산 감소) 동시 요청 한도 제어
+
+외부 API 한도(429)와 응답 지연을 관찰하여 동시 요청 수를 조절합니다.
+- 성공 응답이 현재 한도만큼 쌓이면 한도 +increase (가산 증가)
+- 429 응답 또는 지연 시간이 latency_target을 넘으면 한도 ×decrease_factor (승산 감소)
+- 같은 혼잡 구간에서 여러 요청이 동시에 실패해도 cooldown 동안은 한 번만 감소
+
+AIMDController는 스레드 안전한 상태만 보관하므로 여러 이벤트 루프(asyncio.run 호출)에
+걸쳐 재사용할 수 있고, 실제 대기는 루프마다 만드는 AdaptiveSemaphore가 담당합니다.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Optional
+
+from config import config
+
+
+class AIMDController:
+    """AIMD 방식 동시 요청 한도 (스레드 안전)"""
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_target: Optional[float] = None,
+        cooldown: float = 1.0,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._successes = 0
+        self._decreased_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 요청 한도"""
+        return int(self._limit)
+
+    def on_success(self, latency: float) -> None:
+        """성공 응답 반영 (지연 시간이 목표를 넘으면 감소로 처리)"""
+        if self.latency_target and latency > self.latency_target:
+            self._decrease()
+            return
+
+        with self._lock:
+            self._successes += 1
+            # 현재 한도만큼 성공하면 (= 한 라운드) 한도 증가
+            if self._successes >= self._limit:
+                self._successes = 0
+                self._limit = min(self.max_limit, self._limit + self.increase)
+
+    def on_overload(self) -> None:
+        """429 (한도 초과) 응답 반영"""
+        self._decrease()
+
+    def _decrease(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._decreased_at < self.cooldown:
+                return
+            self._decreased_at = now
+            self._successes = 0
+            self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+
+
+class AdaptiveSemaphore:
+    """AIMDController의 현재 한도만큼만 동시 진입을 허용하는 asyncio 세마포어
+
+    이벤트 루프마다 새로 만들어 사용합니다.
+    """
+
+    def __init__(self, controller: AIMDController):
+        self.controller = controller
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        """한도 안에서 실행 슬롯 점유"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.controller.limit)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                # 한도가 늘었을 수 있으므로 대기 중인 작업을 모두 깨워 다시 확인
+                self._condition.notify_all()
+
+
+@lru_cache(maxsize=1)
+def get_postprocess_concurrency() -> AIMDController:
+    """프로세스 단위 후처리(Gemini) 동시성 컨트롤러 (카테고리 간에 학습한 한도 유지)"""
+    return AIMDController(
+        initial_limit=config.POSTPROCESS_INITIAL_CONCURRENCY,
+        max_limit=config.POSTPROCESS_MAX_CONCURRENCY,
+        latency_target=config.POSTPROCESS_LATENCY_TARGET_SECONDS or None,
+    )
@@ -0,0 +1,198 @@
+"""SQLite 기반 영속 캐시 모듈 - 크기 제한 LRU 제거, TTL, 적중률 통계"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+# SQLite 바인딩 변수 수 제한(기본 999)을 넘지 않도록 나눠서 조회
+_QUERY_BATCH_SIZE = 500
+
+
+def make_cache_key(*parts: str) -> str:
+    """여러 값을 묶어 콘텐츠 기반 캐시 키(sha256) 생성"""
+    joined = "\x1f".join(parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중 통계"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self) -> str:
+        return f"적중 {self.hits}회, 미스 {self.misses}회 (적중률 {self.hit_rate:.1%}), 제거 {self.evictions}개"
+
+
+class SqliteCache:
+    """키 → BLOB 값을 저장하는 영속 캐시
+
+    - max_entries를 넘으면 가장 오래 접근하지 않은 항목부터 제거 (LRU)
+    - ttl_seconds가 지난 항목은 조회 시 미스로 처리
+    - tag로 항목을 묶어 일괄 무효화 (예: 카테고리 ID, 코퍼스 버전)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "cache",
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        if not table.isidentifier():
+            raise ValueError(f"잘못된 테이블 이름: {table}")
+
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        # 여러 프로세스가 같은 캐시 파일을 읽고 쓸 수 있도록 WAL 모드 사용
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                tag TEXT NOT NULL DEFAULT '',
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed_idx ON {table} (accessed_at)")
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_tag_idx ON {table} (tag)")
+        self._conn.commit()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[bytes]:
+        """단일 키 조회 (없거나 만료되면 None)"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        """여러 키 일괄 조회
+
+        Returns:
+            적중한 키만 포함하는 {키: 값} 딕셔너리
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, bytes] = {}
+        expired: list[str] = []
+        now = time.time()
+
+        with self._lock:
+            for start in range(0, len(unique_keys), _QUERY_BATCH_SIZE):
+                batch = unique_keys[start:start + _QUERY_BATCH_SIZE]
+                placeholders = ",".join(["?"] * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value, created_at FROM {self.table} WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, value, created_at in rows:
+                    if self._is_expired(created_at, now):
+                        expired.append(key)
+                    else:
+                        found[key] = value
+
+            if found:
+                self._conn.executemany(
+                    f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+            if expired:
+                self._conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", [(key,) for key in expired])
+            if found or expired:
+                self._conn.commit()
+
+            self.stats.hits += len(found)
+            self.stats.misses += len(unique_keys) - len(found)
+
+        return found
+
+    def put(self, key: str, value: bytes, tag: str = "") -> None:
+        """단일 항목 저장"""
+        self.put_many({key: value}, tag)
+
+    def put_many(self, items: dict[str, bytes], tag: str = "") -> None:
+        """여러 항목 일괄 저장 후 크기 제한 초과분 제거"""
+        if not items:
+            return
+        now = time.time()
+
+        with self._lock:
+            self._conn.executemany(
+                f"""
+                INSERT INTO {self.table} (key, value, tag, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    tag = excluded.tag,
+                    created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                [(key, sqlite3.Binary(value), tag, now, now) for key, value in items.items()],
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """max_entries 초과 시 가장 오래 접근하지 않은 항목부터 제거 (lock 보유 상태에서 호출)"""
+        if not self.max_entries:
+            return
+        count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                f"""
+                DELETE FROM {self.table} WHERE key IN (
+                    SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            self.stats.evictions += overflow
+
+    def invalidate(self, tag: Optional[str] = None) -> int:
+        """tag에 해당하는 항목 삭제 (tag가 None이면 전체 삭제)
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if tag is None:
+                cursor = self._conn.execute(f"DELETE FROM {self.table}")
+            else:
+                cursor = self._conn.execute(f"DELETE FROM {self.table} WHERE tag = ?", (tag,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def invalidate_except(self, tag: str) -> int:
+        """tag가 다른 항목을 모두 삭제 (예: 현재 코퍼스 버전 외 항목 정리)
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            cursor = self._conn.execute(f"DELETE FROM {self.table} WHERE tag != ?", (tag,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
@@ -0,0 +1,57 @@
+"""캐시 임베딩 모듈 - LangChain Embeddings를 영속 임베딩 캐시(EmbeddingCache)로 감싸기
+
+RAGAS AnswerRelevancy는 평가할 때마다 user_input과 생성 질문들을 임베딩합니다.
+같은 문제를 다시 평가하거나 탈락 후 재시도할 때 API를 다시 호출하지 않도록
+(모델, 용도, 텍스트) 해시를 키로 캐시합니다.
+
+- 쿼리/문서 임베딩은 task type이 다를 수 있으므로 "<모델>:query", "<모델>:document"로 키를 분리
+- embed_documents는 중복 텍스트를 합치고 캐시에 없는 텍스트만 한 번의 배치 호출로 임베딩
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from langchain_core.embeddings import Embeddings
+
+from clients import get_gemini_embeddings
+from embedding_cache import EmbeddingCache, get_embedding_cache
+
+
+class CachedEmbeddings(Embeddings):
+    """EmbeddingCache를 거치는 LangChain Embeddings 래퍼"""
+
+    def __init__(self, embeddings: Embeddings, model: str, cache: Optional[EmbeddingCache] = None):
+        self.embeddings = embeddings
+        self.model = model
+        self.cache = cache or get_embedding_cache()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """문서 임베딩 (캐시 미스만 한 번에 배치 호출)"""
+        cache_model = f"{self.model}:document"
+        unique_texts = list(dict.fromkeys(texts))
+        found = self.cache.get_many(cache_model, unique_texts)
+
+        missing = [text for text in unique_texts if text not in found]
+        if missing:
+            computed = dict(zip(missing, self.embeddings.embed_documents(missing)))
+            self.cache.put_many(cache_model, computed)
+            found.update(computed)
+
+        return [found[text] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        """쿼리 임베딩 (캐시 적중 시 API 호출 없음)"""
+        cache_model = f"{self.model}:query"
+        cached = self.cache.get(cache_model, text)
+        if cached is not None:
+            return cached
+
+        embedding = self.embeddings.embed_query(text)
+        self.cache.put(cache_model, text, embedding)
+        return embedding
+
+
+@lru_cache(maxsize=None)
+def get_cached_gemini_embeddings(model: str = "models/gemini-embedding-001") -> CachedEmbeddings:
+    """캐시를 거치는 Gemini 임베딩 클라이언트 (모델별 1개)"""
+    return CachedEmbeddings(get_gemini_embeddings(model), model)
@@ -143,6 +143,30 @@ def get_categories_for_generation() -> list[CategoryInfo]:
             return categories
 
 
+def get_active_leaf_categories() -> list[CategoryInfo]:
+    """모든 활성 leaf 카테고리 조회 (경로 포함)"""
+    query = """
+    SELECT id, name, question_count
+    FROM categories
+    WHERE is_leaf = TRUE AND status = 'active'
+    ORDER BY id ASC
+    """
+    with get_connection() as conn:
+        with get_cursor(conn) as cursor:
+            cursor.execute(query)
+            results = cursor.fetchall()
+
+            return [
+                CategoryInfo(
+                    id=row["id"],
+                    name=row["name"],
+                    path=get_category_path(row["id"]),
+                    question_count=row["question_count"]
+                )
+                for row in results
+            ]
+
+
 def get_all_leaf_categories_stats() -> list[dict]:
     """모든 leaf 카테고리의 문제 수 통계 조회 (검증용)"""
     query = """
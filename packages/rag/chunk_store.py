@@ -0,0 +1,82 @@
+"""청크 본문 저장소 모듈 - 검색 단계에서 읽은 청크 본문을 프로세스 메모리에 보관
+
+검색(retriever)이 가져온 청크 본문을 청크 ID 기준으로 저장해 두고,
+평가(evaluator)처럼 같은 청크를 다시 읽는 단계는 여기서 먼저 찾습니다.
+저장소에 없는 청크만 한 번의 쿼리로 모아서 조회합니다.
+
+- max_entries를 넘으면 가장 오래 사용하지 않은 청크부터 제거 (LRU)
+"""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from config import config
+from cache_store import CacheStats
+from db import get_cursor
+from vector_index import TABLE_NAME
+
+
+class ChunkStore:
+    """청크 ID → 본문 LRU 저장소 (스레드 안전)"""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or config.CHUNK_STORE_MAX_ENTRIES
+        self.stats = CacheStats()
+        self._contents: OrderedDict[int, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def put_many(self, chunks: Iterable[tuple[int, str]]) -> None:
+        """(청크 ID, 본문) 저장 (이미 있으면 최근 사용으로 갱신)"""
+        with self._lock:
+            for chunk_id, content in chunks:
+                self._contents[chunk_id] = content
+                self._contents.move_to_end(chunk_id)
+
+            while len(self._contents) > self.max_entries:
+                self._contents.popitem(last=False)
+                self.stats.evictions += 1
+
+    def get_many(self, chunk_ids: Iterable[int]) -> dict[int, str]:
+        """저장된 청크만 반환 (없는 ID는 결과에서 제외)"""
+        found = {}
+        with self._lock:
+            for chunk_id in chunk_ids:
+                content = self._contents.get(chunk_id)
+                if content is None:
+                    self.stats.misses += 1
+                    continue
+                self._contents.move_to_end(chunk_id)
+                self.stats.hits += 1
+                found[chunk_id] = content
+        return found
+
+    def fetch(self, chunk_ids: Iterable[int]) -> dict[int, str]:
+        """청크 본문 조회 (저장소에 없는 청크는 DB에서 한 번에 조회 후 저장)
+
+        Returns:
+            {청크 ID: 본문} (DB에도 없는 ID는 제외)
+        """
+        chunk_ids = list(dict.fromkeys(chunk_ids))
+        found = self.get_many(chunk_ids)
+        missing = [chunk_id for chunk_id in chunk_ids if chunk_id not in found]
+        if not missing:
+            return found
+
+        with get_cursor() as cursor:
+            cursor.execute(f"SELECT id, content FROM {TABLE_NAME} WHERE id = ANY(%s)", (missing,))
+            fetched = {row["id"]: row["content"] for row in cursor.fetchall()}
+
+        self.put_many(fetched.items())
+        found.update(fetched)
+        return found
+
+
+@lru_cache(maxsize=1)
+def get_chunk_store() -> ChunkStore:
+    """프로세스 단위 청크 본문 저장소"""
+    return ChunkStore()
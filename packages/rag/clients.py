@@ -0,0 +1,59 @@
+"""공용 클라이언트 모듈 - HTTP 세션과 LLM/임베딩 클라이언트를 프로세스 단위로 재사용
+
+매 호출마다 클라이언트를 새로 만들면 TLS 핸드셰이크와 객체 생성 비용이 반복되므로,
+설정값(모델, temperature 등)별로 한 번만 생성하고 keep-alive 연결 풀을 공유합니다.
+"""
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from langchain_naver import ChatClovaX
+from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+
+from config import config
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Clova API 호출용 keep-alive HTTP 세션
+
+    스레드에서 동시에 호출해도 연결을 재사용할 수 있도록
+    HTTP_POOL_MAXSIZE 크기의 연결 풀을 사용합니다.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config.HTTP_POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def get_clova_chat(model: str = config.LLM_MODEL, temperature: float = config.TEMPERATURE) -> ChatClovaX:
+    """ChatClovaX 클라이언트 (모델, temperature별 1개)"""
+    return ChatClovaX(
+        model=model,
+        temperature=temperature,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_gemini_chat(model: str = config.GEMINI_MODEL, temperature: float = 0.0) -> ChatGoogleGenerativeAI:
+    """ChatGoogleGenerativeAI 클라이언트 (모델, temperature별 1개)"""
+    return ChatGoogleGenerativeAI(
+        model=model,
+        google_api_key=config.GEMINI_API_KEY,
+        temperature=temperature,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_gemini_embeddings(model: str = "models/gemini-embedding-001") -> GoogleGenerativeAIEmbeddings:
+    """GoogleGenerativeAIEmbeddings 클라이언트 (모델별 1개)"""
+    return GoogleGenerativeAIEmbeddings(
+        model=model,
+        google_api_key=config.GEMINI_API_KEY,
+    )
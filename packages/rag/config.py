@@ -29,6 +29,83 @@ class Config:
     TOP_K_CHUNKS: int = 5
     QUESTIONS_PER_TOPIC: int = 10
     UNSOLVED_THRESHOLD: int = int(os.getenv("UNSOLVED_THRESHOLD", "30"))
+    GENERATION_STREAMING: bool = os.getenv("GENERATION_STREAMING", "true").lower() == "true"
+    POSTPROCESS_MAX_WORKERS: int = int(os.getenv("POSTPROCESS_MAX_WORKERS", "4"))
+    POSTPROCESS_RULE_CLEANER_ENABLED: bool = os.getenv("POSTPROCESS_RULE_CLEANER_ENABLED", "true").lower() == "true"
+    POSTPROCESS_MODE: str = os.getenv("POSTPROCESS_MODE", "batch")  # batch: 카테고리당 1회 호출, single: 해설당 1회 호출, async: 해설별 동시 호출
+    POSTPROCESS_STREAM_BATCH_SIZE: int = int(os.getenv("POSTPROCESS_STREAM_BATCH_SIZE", "4"))  # 스트리밍 중 batch 모드 일괄 호출 크기
+    POSTPROCESS_INITIAL_CONCURRENCY: int = int(os.getenv("POSTPROCESS_INITIAL_CONCURRENCY", "4"))
+    POSTPROCESS_MAX_CONCURRENCY: int = int(os.getenv("POSTPROCESS_MAX_CONCURRENCY", "16"))
+    POSTPROCESS_LATENCY_TARGET_SECONDS: float = float(os.getenv("POSTPROCESS_LATENCY_TARGET_SECONDS", "15"))  # 0이면 지연 기반 감소 없음
+    GENERATION_CONTEXT_TOKEN_BUDGET: int = int(os.getenv("GENERATION_CONTEXT_TOKEN_BUDGET", "6000"))  # 0이면 제한 없음
+    GENERATION_MAX_WORKERS: int = int(os.getenv("GENERATION_MAX_WORKERS", "4"))
+    PACKED_GENERATION_ENABLED: bool = os.getenv("PACKED_GENERATION_ENABLED", "true").lower() == "true"
+    PACKED_GENERATION_MAX_TARGET: int = int(os.getenv("PACKED_GENERATION_MAX_TARGET", "5"))  # 이 수 이하 카테고리만 묶음
+    PACKED_GENERATION_MAX_CATEGORIES: int = int(os.getenv("PACKED_GENERATION_MAX_CATEGORIES", "3"))
+
+    # Evaluation (단계별 평가: Faithfulness 통과 문제만 AnswerRelevancy 평가)
+    EVALUATION_STAGED: bool = os.getenv("EVALUATION_STAGED", "true").lower() == "true"
+
+    # Evaluation 사전 선별 (off | shadow | enforce)
+    PRESCREEN_MODE: str = os.getenv("PRESCREEN_MODE", "shadow")
+    PRESCREEN_FLOOR: float = float(os.getenv("PRESCREEN_FLOOR", "0"))  # 해설 용어 중 인용 청크에 등장하는 비율 하한 (0이면 미보정, enforce 불가)
+    PRESCREEN_LOG_PATH: str = os.getenv("PRESCREEN_LOG_PATH", "cache/prescreen.jsonl")
+
+    # Clova API 한도 (0이면 제한 없음)
+    CLOVA_QPM: int = int(os.getenv("CLOVA_QPM", "60"))
+    CLOVA_TPM: int = int(os.getenv("CLOVA_TPM", "120000"))
+
+    # Vector Index (pgvector ANN)
+    VECTOR_INDEX_METHOD: str = os.getenv("VECTOR_INDEX_METHOD", "hnsw")  # hnsw | ivfflat
+    HNSW_M: int = int(os.getenv("HNSW_M", "16"))
+    HNSW_EF_CONSTRUCTION: int = int(os.getenv("HNSW_EF_CONSTRUCTION", "64"))
+    HNSW_EF_SEARCH: int = int(os.getenv("HNSW_EF_SEARCH", "40"))
+    IVFFLAT_LISTS: int = int(os.getenv("IVFFLAT_LISTS", "100"))
+    IVFFLAT_PROBES: int = int(os.getenv("IVFFLAT_PROBES", "10"))
+    VECTOR_QUANTIZATION: str = os.getenv("VECTOR_QUANTIZATION", "none")  # none | halfvec | binary
+    QUANTIZED_CANDIDATE_K: int = int(os.getenv("QUANTIZED_CANDIDATE_K", "200"))  # 정밀 재정렬할 1차 후보 수
+
+    # Hybrid Search
+    HYBRID_CANDIDATE_K: int = int(os.getenv("HYBRID_CANDIDATE_K", "50"))  # 벡터/키워드 각각의 후보 수
+    HYBRID_FUSION: str = os.getenv("HYBRID_FUSION", "rrf")  # rrf | weighted
+    RRF_K: int = int(os.getenv("RRF_K", "60"))
+
+    # MMR (Reranker 전 중복 청크 제거)
+    MMR_ENABLED: bool = os.getenv("MMR_ENABLED", "false").lower() == "true"  # 실험적 (Recall 측정 전까지 기본 꺼짐)
+    MMR_TOP_K: int = int(os.getenv("MMR_TOP_K", "7"))  # Reranker로 보낼 청크 수
+    MMR_LAMBDA: float = float(os.getenv("MMR_LAMBDA", "0.7"))  # 1에 가까울수록 관련성 우선
+
+    # Reranker 샤딩 (후보가 많을 때 병렬 호출)
+    RERANKER_SHARD_MAX_CHARS: int = int(os.getenv("RERANKER_SHARD_MAX_CHARS", "0"))  # 0이면 샤딩 안 함 (인용 결과가 바뀌므로 opt-in)
+    RERANKER_MAX_WORKERS: int = int(os.getenv("RERANKER_MAX_WORKERS", "4"))
+
+    # Lexical Pre-rerank (Reranker 전 BM25 사전 정렬)
+    LEXICAL_PRERANK_ENABLED: bool = os.getenv("LEXICAL_PRERANK_ENABLED", "false").lower() == "true"  # 실험적 (Recall 측정 전까지 기본 꺼짐)
+    LEXICAL_PRERANK_TOP_K: int = int(os.getenv("LEXICAL_PRERANK_TOP_K", "6"))
+    LEXICAL_INDEX_DIR: str = os.getenv("LEXICAL_INDEX_DIR", "cache/lexical_index")
+    LEXICAL_PRERANK_LOG_PATH: str = os.getenv("LEXICAL_PRERANK_LOG_PATH", "cache/lexical_prerank.jsonl")
+
+    # Retrieval Backend
+    RETRIEVAL_BACKEND: str = os.getenv("RETRIEVAL_BACKEND", "postgres")  # postgres | local
+    LOCAL_INDEX_DIR: str = os.getenv("LOCAL_INDEX_DIR", "cache/vector_index")
+    LOCAL_INDEX_REFRESH_SECONDS: float = float(os.getenv("LOCAL_INDEX_REFRESH_SECONDS", "300"))
+
+    # HTTP Client (keep-alive 연결 풀)
+    HTTP_POOL_CONNECTIONS: int = int(os.getenv("HTTP_POOL_CONNECTIONS", "4"))
+    HTTP_POOL_MAXSIZE: int = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+
+    # Cache
+    CACHE_DIR: str = os.getenv("CACHE_DIR", "cache")
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", os.path.join(CACHE_DIR, "embeddings.sqlite3"))
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "50000"))
+    HYDE_CACHE_ENABLED: bool = os.getenv("HYDE_CACHE_ENABLED", "true").lower() == "true"
+    HYDE_CACHE_PATH: str = os.getenv("HYDE_CACHE_PATH", os.path.join(CACHE_DIR, "hyde.sqlite3"))
+    HYDE_CACHE_TTL_SECONDS: float = float(os.getenv("HYDE_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    RERANKER_CACHE_ENABLED: bool = os.getenv("RERANKER_CACHE_ENABLED", "true").lower() == "true"
+    RERANKER_CACHE_PATH: str = os.getenv("RERANKER_CACHE_PATH", os.path.join(CACHE_DIR, "reranker.sqlite3"))
+    RERANKER_CACHE_MAX_ENTRIES: int = int(os.getenv("RERANKER_CACHE_MAX_ENTRIES", "10000"))
+    CHUNK_STORE_MAX_ENTRIES: int = int(os.getenv("CHUNK_STORE_MAX_ENTRIES", "5000"))  # 프로세스 메모리 청크 본문 저장소
 
     @classmethod
     def get_db_url(cls) -> str:
@@ -0,0 +1,124 @@
+"""컨텍스트 패킹 모듈 - 생성 프롬프트에 넣을 청크의 중복 토큰 제거 및 토큰 예산 적용
+
+ETL의 split_large_chunk로 나뉜 서브청크는 모두 같은 헤더 경로("# A\\n## B")로 시작하고,
+이웃 서브청크와 최대 200자가 겹칩니다. 같은 섹션의 청크를 묶어
+- 헤더는 섹션의 첫 청크에만 남기고
+- 이웃 청크와 겹치는 앞부분은 잘라낸 뒤
+- 관련도 순서대로 토큰 예산 안에 들어가는 청크만 선택합니다.
+
+청크 ID와 본문의 대응은 그대로 유지되므로 chunk_ids 검증에 그대로 사용할 수 있습니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from token_calculator import estimate_tokens
+
+
+# 이웃 서브청크 겹침 탐색 범위 (ETL chunk_overlap=200, 문장 병합 여유 포함)
+MIN_OVERLAP_CHARS = 30
+MAX_OVERLAP_CHARS = 400
+
+
+@dataclass
+class PackedContext:
+    """패킹 결과"""
+    chunks: list[tuple[int, str]]  # [(청크 ID, 프롬프트에 넣을 내용), ...]
+    dropped_ids: list[int] = field(default_factory=list)  # 토큰 예산 초과로 제외된 청크
+    original_tokens: int = 0
+    packed_tokens: int = 0
+
+    @property
+    def chunk_ids(self) -> list[int]:
+        return [chunk_id for chunk_id, _ in self.chunks]
+
+
+def split_header(content: str) -> tuple[str, str]:
+    """청크 앞부분의 마크다운 헤더 줄과 본문 분리
+
+    Returns:
+        (헤더 텍스트, 본문) - 헤더가 없으면 ("", 원문)
+    """
+    lines = content.split("\n")
+    header_end = 0
+    while header_end < len(lines) and lines[header_end].startswith("#"):
+        header_end += 1
+    if header_end == 0:
+        return "", content
+    return "\n".join(lines[:header_end]), "\n".join(lines[header_end:]).strip()
+
+
+def _overlap_length(previous: str, current: str) -> int:
+    """previous의 끝과 current의 앞이 겹치는 길이 (없으면 0)"""
+    if len(current) < MIN_OVERLAP_CHARS:
+        return 0
+    tail = previous[-MAX_OVERLAP_CHARS:]
+    probe = current[:MIN_OVERLAP_CHARS]
+
+    start = tail.find(probe)
+    while start != -1:
+        length = len(tail) - start
+        if current.startswith(tail[start:]):
+            return length
+        start = tail.find(probe, start + 1)
+    return 0
+
+
+def pack_chunks(
+    chunks: list[tuple[int, str]],
+    token_budget: Optional[int] = None,
+) -> PackedContext:
+    """청크 리스트를 중복 제거 후 토큰 예산 안으로 패킹
+
+    Args:
+        chunks: 관련도순 (청크 ID, 청크 내용) 리스트
+        token_budget: 청크 본문 토큰 상한 (None 또는 0이면 제한 없음, 첫 청크는 항상 포함)
+
+    Returns:
+        PackedContext: 섹션별로 묶인 (청크 ID, 내용) 리스트와 토큰 통계
+    """
+    parsed = [(chunk_id, *split_header(content)) for chunk_id, content in chunks]
+
+    # 1. 관련도순으로 예산 안에 들어가는 청크 선택 (헤더는 섹션당 한 번만 계산)
+    selected: list[tuple[int, str, str]] = []
+    dropped_ids: list[int] = []
+    seen_headers: set[str] = set()
+    used_tokens = 0
+
+    for chunk_id, header, body in parsed:
+        cost = estimate_tokens(body)
+        if header not in seen_headers:
+            cost += estimate_tokens(header)
+        if token_budget and selected and used_tokens + cost > token_budget:
+            dropped_ids.append(chunk_id)
+            continue
+        selected.append((chunk_id, header, body))
+        seen_headers.add(header)
+        used_tokens += cost
+
+    # 2. 섹션별로 묶기 (섹션 순서는 가장 관련도 높은 청크 기준, 섹션 내부는 ID순 = 원문 순서)
+    sections: dict[str, list[tuple[int, str]]] = {}
+    for chunk_id, header, body in selected:
+        sections.setdefault(header, []).append((chunk_id, body))
+
+    # 3. 헤더는 섹션 첫 청크에만, 이웃 청크와의 겹침은 제거
+    packed: list[tuple[int, str]] = []
+    for header, members in sections.items():
+        previous_body = None
+        for i, (chunk_id, body) in enumerate(sorted(members)):
+            if previous_body is not None:
+                overlap = _overlap_length(previous_body, body)
+                trimmed = body[overlap:].lstrip() or body
+            else:
+                trimmed = body
+            previous_body = body
+
+            content = f"{header}\n\n{trimmed}" if header and i == 0 else trimmed
+            packed.append((chunk_id, content))
+
+    return PackedContext(
+        chunks=packed,
+        dropped_ids=dropped_ids,
+        original_tokens=sum(estimate_tokens(content) for _, content in chunks),
+        packed_tokens=sum(estimate_tokens(content) for _, content in packed),
+    )
@@ -0,0 +1,52 @@
+"""코퍼스 버전 기반 로컬 인덱스 공통 모듈
+
+document_embeddings에서 만든 로컬 인덱스(벡터 스냅샷, BM25 역색인 등)는 코퍼스 버전이 바뀌면
+다시 로드하거나 빌드해야 합니다. 버전 확인은 refresh_interval 초마다 한 번만 DB에 질의합니다.
+"""
+
+import threading
+import time
+from typing import Generic, Optional, TypeVar
+
+from config import config
+from vector_index import get_corpus_version
+
+
+T = TypeVar("T")
+
+
+class CorpusVersionedIndex(Generic[T]):
+    """코퍼스 버전별로 로드한 인덱스 데이터를 보관하고, 버전이 바뀌면 교체
+
+    하위 클래스는 _load(version)에서 해당 버전의 인덱스 데이터를 읽거나 빌드하여 반환합니다.
+    """
+
+    def __init__(self, refresh_interval: Optional[float] = None):
+        self.refresh_interval = (
+            config.LOCAL_INDEX_REFRESH_SECONDS if refresh_interval is None else refresh_interval
+        )
+        self._data: Optional[T] = None
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self, version: str) -> T:
+        raise NotImplementedError
+
+    def refresh(self) -> None:
+        """코퍼스 버전이 바뀌었으면 인덱스 데이터를 다시 로드"""
+        version = get_corpus_version()
+        if self._data is not None and self._version == version:
+            return
+
+        self._data = self._load(version)
+        self._version = version
+
+    def ensure_fresh(self) -> T:
+        """refresh_interval이 지났으면 버전 확인 후 최신 인덱스 데이터 반환"""
+        with self._lock:
+            now = time.monotonic()
+            if self._data is None or now - self._checked_at >= self.refresh_interval:
+                self.refresh()
+                self._checked_at = now
+            return self._data
@@ -1,9 +1,60 @@
+import threading
+
+import numpy as np
 import psycopg2
+from psycopg2.extensions import adapt, register_adapter
 from psycopg2.extras import RealDictCursor
+from pgvector.psycopg2 import register_vector
 from contextlib import contextmanager
 from config import config
 
 
+_vector_registered = False
+_vector_lock = threading.Lock()
+
+
+class CompactVectorAdapter:
+    """np.ndarray → pgvector 텍스트 리터럴 어댑터
+
+    psycopg2는 바이너리 파라미터를 지원하지 않으므로 텍스트로 전송하되,
+    float32를 왕복 손실 없는 최소 자릿수(9자리)로 표현해 payload와 직렬화 시간을 줄입니다.
+    """
+
+    def __init__(self, value: np.ndarray):
+        self._value = value
+
+    def getquoted(self) -> bytes:
+        values = np.asarray(self._value, dtype=np.float32).tolist()
+        text = "[" + ",".join(format(v, ".9g") for v in values) + "]"
+        return adapt(text).getquoted()
+
+
+def _register_vector_types(conn) -> None:
+    """pgvector 타입 캐스터/어댑터를 프로세스 전역으로 한 번만 등록
+
+    등록 이후 vector 컬럼은 np.ndarray(float32)로 조회되고,
+    np.ndarray 파라미터는 `%s::vector`로 바로 전달할 수 있습니다.
+    """
+    global _vector_registered
+    if _vector_registered:
+        return
+
+    with _vector_lock:
+        if _vector_registered:
+            return
+        try:
+            register_vector(conn, globally=True)
+            register_adapter(np.ndarray, CompactVectorAdapter)
+        except psycopg2.ProgrammingError as e:
+            # 확장이 아직 생성되지 않은 경우 등: 다음 연결에서 다시 시도
+            print(f"[경고] pgvector 타입 등록 실패 (다음 연결에서 재시도): {e}")
+            return
+        finally:
+            # 타입 조회로 열린 트랜잭션 종료 (이후 autocommit/set_session 변경 가능하도록)
+            conn.rollback()
+        _vector_registered = True
+
+
 @contextmanager
 def get_connection():
     conn = psycopg2.connect(
@@ -14,6 +65,7 @@ def get_connection():
         password=config.DB_PASSWORD,
     )
     try:
+        _register_vector_types(conn)
         yield conn
     finally:
         conn.close()
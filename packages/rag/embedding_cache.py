@@ -0,0 +1,105 @@
+"""임베딩 캐시 모듈 - (모델, 텍스트) 해시 기반 영속 임베딩 캐시"""
+
+from array import array
+from functools import lru_cache
+from typing import Callable, Optional
+
+from config import config
+from cache_store import SqliteCache, CacheStats, make_cache_key
+
+
+def _encode(embedding) -> bytes:
+    """임베딩 → float32 바이트"""
+    return array("f", (float(v) for v in embedding)).tobytes()
+
+
+def _decode(data: bytes) -> list[float]:
+    """float32 바이트 → 임베딩"""
+    values = array("f")
+    values.frombytes(data)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """(모델, 텍스트) 해시를 키로 하는 임베딩 캐시 (SQLite, LRU 제거)"""
+
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None):
+        self.store = SqliteCache(
+            path=path or config.EMBEDDING_CACHE_PATH,
+            table="embeddings",
+            max_entries=max_entries or config.EMBEDDING_CACHE_MAX_ENTRIES,
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.store.stats
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        return make_cache_key(model, text)
+
+    def get(self, model: str, text: str) -> Optional[list[float]]:
+        """캐시된 임베딩 조회 (없으면 None)"""
+        data = self.store.get(self.make_key(model, text))
+        return _decode(data) if data is not None else None
+
+    def get_many(self, model: str, texts: list[str]) -> dict[str, list[float]]:
+        """여러 텍스트의 캐시된 임베딩 일괄 조회
+
+        Returns:
+            적중한 텍스트만 포함하는 {텍스트: 임베딩} 딕셔너리
+        """
+        keys = {text: self.make_key(model, text) for text in texts}
+        found = self.store.get_many(list(keys.values()))
+        return {
+            text: _decode(found[key])
+            for text, key in keys.items()
+            if key in found
+        }
+
+    def put(self, model: str, text: str, embedding: list[float]) -> None:
+        """임베딩 저장"""
+        self.store.put(self.make_key(model, text), _encode(embedding))
+
+    def put_many(self, model: str, embeddings: dict[str, list[float]]) -> None:
+        """여러 임베딩 일괄 저장"""
+        self.store.put_many({
+            self.make_key(model, text): _encode(embedding)
+            for text, embedding in embeddings.items()
+        })
+
+    def warm_up(
+        self,
+        model: str,
+        texts: list[str],
+        embed_fn: Callable[[str], list[float]],
+    ) -> int:
+        """캐시에 없는 텍스트만 임베딩하여 미리 채움
+
+        Args:
+            model: 임베딩 모델 이름
+            texts: 미리 임베딩할 텍스트 리스트
+            embed_fn: 단일 텍스트 임베딩 함수 (API 호출)
+
+        Returns:
+            새로 임베딩한 텍스트 수
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        cached = self.get_many(model, unique_texts)
+        missing = [text for text in unique_texts if text not in cached]
+
+        computed = {}
+        for i, text in enumerate(missing):
+            try:
+                computed[text] = embed_fn(text)
+            except Exception as e:
+                print(f"[경고] 임베딩 warm-up 실패 ({i + 1}/{len(missing)}): {e}")
+
+        self.put_many(model, computed)
+        return len(computed)
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache() -> EmbeddingCache:
+    """프로세스 단위 임베딩 캐시 인스턴스"""
+    return EmbeddingCache()
@@ -1,14 +1,19 @@
 import json
 import warnings
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
 from datasets import Dataset
 from ragas import evaluate
 from ragas.llms import LangchainLLMWrapper
 from ragas.embeddings import LangchainEmbeddingsWrapper
 from ragas.metrics import Faithfulness, AnswerRelevancy
-from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 
 from config import config
-from db import get_connection
+from chunk_store import get_chunk_store
+from clients import get_gemini_chat, get_gemini_embeddings
+from cached_embeddings import get_cached_gemini_embeddings
 from token_calculator import (
     TokenUsage,
     get_token_usage_for_gemini,
@@ -26,49 +31,45 @@ def get_evaluator_llm():
     # Gemini-2.5-Flash (User requested)
     # 실제로는 Gemini 1.5 Flash 또는 최신 모델 매핑 필요.
     # config.GEMINI_MODEL에 "gemini-2.5-flash" 또는 유효한 모델명이 있어야 함.
-    langchain_llm = ChatGoogleGenerativeAI(
-        model=config.GEMINI_MODEL,  # e.g., "gemini-1.5-flash"
-        google_api_key=config.GEMINI_API_KEY,
-        temperature=0.0, # 평가는 Deterministic하게
-    )
+    langchain_llm = get_gemini_chat(config.GEMINI_MODEL, 0.0)  # 평가는 Deterministic하게
     return LangchainLLMWrapper(langchain_llm)
 
 
 def get_evaluator_embeddings():
-    """평가용 Gemini 임베딩 모델 초기화"""
-    langchain_embeddings = GoogleGenerativeAIEmbeddings(
-        model="models/gemini-embedding-001",
-        google_api_key=config.GEMINI_API_KEY,
-    )
+    """평가용 Gemini 임베딩 모델 초기화 (EMBEDDING_CACHE_ENABLED이면 영속 캐시 사용)"""
+    if config.EMBEDDING_CACHE_ENABLED:
+        langchain_embeddings = get_cached_gemini_embeddings("models/gemini-embedding-001")
+    else:
+        langchain_embeddings = get_gemini_embeddings("models/gemini-embedding-001")
     return LangchainEmbeddingsWrapper(langchain_embeddings)
 
 
 def get_chunk_contents(chunk_ids: list[int]) -> list[str]:
-    """청크 ID로 청크 내용 조회"""
+    """청크 ID로 청크 내용 조회 (청크 저장소 우선, 없는 청크만 DB 조회)"""
     if not chunk_ids:
         return []
 
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        placeholders = ",".join(["%s"] * len(chunk_ids))
-        query = f"SELECT content FROM document_embeddings WHERE id IN ({placeholders})"
-        cursor.execute(query, chunk_ids)
-        results = cursor.fetchall()
-        cursor.close()
-
-    return [row[0] for row in results]
+    contents = get_chunk_store().fetch(chunk_ids)
+    return [contents[chunk_id] for chunk_id in chunk_ids if chunk_id in contents]
 
 
 def prepare_evaluation_dataset(questions: list[dict]) -> Dataset:
-    """생성된 문제를 RAGAS 평가용 데이터셋으로 변환"""
+    """생성된 문제를 RAGAS 평가용 데이터셋으로 변환
+
+    모든 문제의 청크를 한 번에 조회하므로 저장소에 없는 청크가 있어도 DB 쿼리는 최대 1회입니다.
+    """
     data = {
         "user_input": [],
         "response": [],
         "retrieved_contexts": [],
     }
 
+    contents = get_chunk_store().fetch(
+        chunk_id for q in questions for chunk_id in q.get("chunk_ids", [])
+    )
+
     for q in questions:
-        chunk_contents = get_chunk_contents(q.get("chunk_ids", []))
+        chunk_contents = [contents[chunk_id] for chunk_id in q.get("chunk_ids", []) if chunk_id in contents]
         if not chunk_contents:
             continue
 
@@ -79,12 +80,88 @@ def prepare_evaluation_dataset(questions: list[dict]) -> Dataset:
     return Dataset.from_dict(data)
 
 
-def evaluate_questions(questions: list[dict], verbose: bool = False) -> tuple[dict, TokenUsage]:
+@dataclass
+class StagedEvaluationResult:
+    """단계별 평가 결과 (RAGAS EvaluationResult처럼 to_pandas()로 점수 조회)
+
+    Faithfulness 기준 미달로 AnswerRelevancy를 계산하지 않은 행은 answer_relevancy가 NaN입니다.
+    """
+    frame: pd.DataFrame
+    skipped: int = 0  # AnswerRelevancy를 생략한 행 수
+
+    def to_pandas(self) -> pd.DataFrame:
+        return self.frame.copy()
+
+
+def _evaluation_usage(results) -> TokenUsage:
+    """RAGAS 평가 결과의 토큰 사용량/비용 계산"""
+    try:
+        cost_usd = results.total_cost(
+            cost_per_input_token=GEMINI_2_0_FLASH_INPUT_COST_PER_TOKEN,
+            cost_per_output_token=GEMINI_2_0_FLASH_OUTPUT_COST_PER_TOKEN,
+        )
+        tokens = results.total_tokens()
+        rate = get_usd_to_krw_rate()
+        cost_krw = cost_usd * rate
+
+        return TokenUsage(
+            input_tokens=tokens.input_tokens,
+            output_tokens=tokens.output_tokens,
+            input_cost=tokens.input_tokens * GEMINI_2_0_FLASH_INPUT_COST_PER_TOKEN * rate,
+            output_cost=tokens.output_tokens * GEMINI_2_0_FLASH_OUTPUT_COST_PER_TOKEN * rate,
+            total_cost=cost_krw,
+        )
+    except Exception:
+        return TokenUsage()
+
+
+def _evaluate_staged(
+    dataset: Dataset,
+    faithfulness: Faithfulness,
+    answer_relevancy: AnswerRelevancy,
+    faithfulness_threshold: float,
+) -> tuple[StagedEvaluationResult, TokenUsage]:
+    """Faithfulness를 먼저 평가하고, 기준을 통과한 행만 AnswerRelevancy 평가"""
+    # 1단계: 전체 Faithfulness
+    faithfulness_results = evaluate(
+        dataset=dataset,
+        metrics=[faithfulness],
+        token_usage_parser=get_token_usage_for_gemini,
+    )
+    usage = _evaluation_usage(faithfulness_results)
+    frame = faithfulness_results.to_pandas()
+    frame["answer_relevancy"] = float("nan")
+
+    # 2단계: 통과한 행만 AnswerRelevancy
+    passed_indices = [i for i, score in enumerate(frame["faithfulness"]) if score >= faithfulness_threshold]
+    if passed_indices:
+        relevancy_results = evaluate(
+            dataset=dataset.select(passed_indices),
+            metrics=[answer_relevancy],
+            token_usage_parser=get_token_usage_for_gemini,
+        )
+        usage += _evaluation_usage(relevancy_results)
+        relevancy = relevancy_results.to_pandas()["answer_relevancy"].tolist()
+        frame.loc[passed_indices, "answer_relevancy"] = relevancy
+
+    skipped = len(frame) - len(passed_indices)
+    return StagedEvaluationResult(frame=frame, skipped=skipped), usage
+
+
+def evaluate_questions(
+    questions: list[dict],
+    verbose: bool = False,
+    faithfulness_threshold: Optional[float] = None,
+) -> tuple[dict, TokenUsage]:
     """문제 품질 평가 실행
 
+    faithfulness_threshold가 주어지고 EVALUATION_STAGED가 켜져 있으면 Faithfulness를 먼저 평가하고
+    기준을 통과한 행만 AnswerRelevancy를 평가합니다 (미달 행은 어차피 탈락하므로 호출 생략).
+
     Args:
         questions: 평가할 문제 리스트
         verbose: 상세 로그 출력 여부
+        faithfulness_threshold: 단계별 평가에 사용할 Faithfulness 합격 기준
 
     Returns:
         (평가 결과, 토큰 사용량)
@@ -103,32 +180,16 @@ def evaluate_questions(questions: list[dict], verbose: bool = False) -> tuple[di
     faithfulness = Faithfulness(llm=evaluator_llm)
     answer_relevancy = AnswerRelevancy(llm=evaluator_llm, embeddings=evaluator_embeddings)
 
-    # 4. 평가 실행 (토큰 추적 포함)
-    results = evaluate(
-        dataset=dataset,
-        metrics=[faithfulness, answer_relevancy],
-        token_usage_parser=get_token_usage_for_gemini,
-    )
-
-    # 5. 비용 계산
-    try:
-        cost_usd = results.total_cost(
-            cost_per_input_token=GEMINI_2_0_FLASH_INPUT_COST_PER_TOKEN,
-            cost_per_output_token=GEMINI_2_0_FLASH_OUTPUT_COST_PER_TOKEN,
-        )
-        tokens = results.total_tokens()
-        rate = get_usd_to_krw_rate()
-        cost_krw = cost_usd * rate
-
-        usage = TokenUsage(
-            input_tokens=tokens.input_tokens,
-            output_tokens=tokens.output_tokens,
-            input_cost=tokens.input_tokens * GEMINI_2_0_FLASH_INPUT_COST_PER_TOKEN * rate,
-            output_cost=tokens.output_tokens * GEMINI_2_0_FLASH_OUTPUT_COST_PER_TOKEN * rate,
-            total_cost=cost_krw,
+    # 4. 평가 실행 (토큰 추적 포함) + 비용 계산
+    if faithfulness_threshold is not None and config.EVALUATION_STAGED:
+        results, usage = _evaluate_staged(dataset, faithfulness, answer_relevancy, faithfulness_threshold)
+    else:
+        results = evaluate(
+            dataset=dataset,
+            metrics=[faithfulness, answer_relevancy],
+            token_usage_parser=get_token_usage_for_gemini,
         )
-    except Exception:
-        usage = TokenUsage()
+        usage = _evaluation_usage(results)
 
     if verbose:
         df = results.to_pandas()
@@ -136,6 +197,7 @@ def evaluate_questions(questions: list[dict], verbose: bool = False) -> tuple[di
 
     return results, usage
 
+
 def print_evaluation_report(results) -> None:
     """평가 결과 리포트 출력"""
     df = results.to_pandas()
@@ -0,0 +1,140 @@
+"""규칙 기반 해설 정리 모듈 - Gemini 후처리 전에 로컬에서 처리 가능한 결함 제거
+
+postprocessor.SYSTEM_PROMPT의 규칙 중 패턴으로 확실히 잡을 수 있는 것만 먼저 처리합니다.
+- 내부 참조 제거: ID가 명시된 참조("청크 3970에 따르면", "(청크 ID: 12)")나
+  "제공된/주어진" 접두어가 붙은 참조("제공된 문서에 따르면")만 제거
+  ("실행 컨텍스트에서", "HTML 문서에서" 같은 일반 기술 표현은 건드리지 않음)
+- 알려진 영어/한국어 혼합 표현 치환: "상태lessness를" → "무상태성(Statelessness)을"
+
+두 규칙은 ID가 명시된 참조와 알려진 표현만 고치므로 수정 결과를 그대로 신뢰합니다.
+정리 후에도 내부 참조로 보이는 단어나 혼합 표기("한글+영문 소문자")가 남은 해설,
+참조만 있어 비어 버린 해설만 needs_llm으로 표시하여 Gemini로 보냅니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+
+_ID_LIST = r"(?:ID\s*)?[:#]?\s*\d+(?:\s*번)?(?:\s*(?:,|및|와|과)\s*\d+(?:\s*번)?)*"
+
+# 내부 참조 표현 (문장 앞 인용구 → 괄호 참조 → 끝에 붙은 출처 순서로 제거)
+_REFERENCE_PATTERNS = [
+    # "청크 3970에 따르면", "청크 12, 15에서", "문서 3번에 의하면", "제공된 문서에 따르면", "청크 3에서 설명된 대로"
+    re.compile(
+        r"(?:(?:제공된|주어진)\s*(?:청크|문서|컨텍스트|자료)(?:\s*" + _ID_LIST + r")?"
+        r"|(?:청크|문서)\s*" + _ID_LIST + r")"
+        r"\s*(?:에\s*따르면|에\s*의하면"
+        r"|에서\s*(?:설명된\s*(?:대로|것처럼)|설명하듯이|언급된\s*(?:대로|것처럼)|보듯이)"
+        r"|에서는|에서)"
+        r"\s*,?\s*"
+    ),
+    # "(청크 3970)", "[청크 ID: 12]", "(출처: 문서 3)"
+    re.compile(r"\s*[\(\[]\s*(?:출처\s*:?\s*)?(?:청크|문서)\s*(?:ID\s*)?[:#]?\s*\d+(?:\s*[,/]\s*\d+)*\s*[\)\]]"),
+    # "출처: 청크 12" 처럼 끝에 붙은 출처 표기
+    re.compile(r"\s*(?:출처|참고)\s*:\s*(?:청크|문서)\s*(?:ID\s*)?\d+(?:\s*[,/]\s*\d+)*\.?"),
+]
+
+# 알려진 혼합 표기 → 교정 표현
+MIXED_SCRIPT_REPLACEMENTS = {
+    "상태lessness": "무상태성(Statelessness)",
+    "무상태lessness": "무상태성(Statelessness)",
+    "멱등ency": "멱등성(Idempotency)",
+    "가용ability": "가용성(Availability)",
+    "확장ability": "확장성(Scalability)",
+    "일관ency": "일관성(Consistency)",
+    "동시ency": "동시성(Concurrency)",
+    "캡슐ation": "캡슐화(Encapsulation)",
+}
+# 치환 뒤에 붙은 조사도 함께 잡아 교정 표현의 받침에 맞게 바꿈 ("상태lessness를" → "...을")
+_MIXED_SCRIPT_REPLACEMENT_PATTERN = re.compile(
+    "(" + "|".join(re.escape(term) for term in sorted(MIXED_SCRIPT_REPLACEMENTS, key=len, reverse=True)) + ")"
+    r"(을|를|은|는|이|가|과|와)?"
+)
+# (받침 있을 때, 받침 없을 때)
+_PARTICLE_PAIRS = [("을", "를"), ("은", "는"), ("이", "가"), ("과", "와")]
+
+# 정리 후에도 남아 있으면 LLM 교정이 필요한 표현
+_SUSPICIOUS_PATTERN = re.compile(r"청크|(?:문서|자료|컨텍스트)\s*(?:에\s*따르면|에\s*의하면|\d)|출처|\bID\s*[:#]?\s*\d")
+# 한글 바로 뒤에 영문 소문자 단어가 붙은 혼합 표기 ("API를"처럼 영문 뒤 조사는 정상)
+_MIXED_SCRIPT_PATTERN = re.compile(r"[가-힣][a-z]{2,}")
+
+_MULTI_SPACE_PATTERN = re.compile(r"[ \t]{2,}")
+_CONTENT_PATTERN = re.compile(r"[가-힣A-Za-z0-9]")
+
+
+@dataclass
+class CleanResult:
+    """규칙 기반 정리 결과"""
+    text: str
+    changed: bool = False
+    needs_llm: bool = False
+    reasons: list[str] = field(default_factory=list)  # LLM으로 보내는 이유 (예: "내부 참조: 청크")
+
+
+def _has_final_consonant(syllable: str) -> bool:
+    """한글 음절의 받침 유무"""
+    return "가" <= syllable <= "힣" and (ord(syllable) - ord("가")) % 28 != 0
+
+
+def _replace_mixed_script(match: re.Match) -> str:
+    """혼합 표기를 교정 표현으로 바꾸고 뒤의 조사를 받침에 맞춤"""
+    replacement = MIXED_SCRIPT_REPLACEMENTS[match.group(1)]
+    particle = match.group(2)
+    if not particle:
+        return replacement
+
+    # "무상태성(Statelessness)"의 조사는 괄호 앞 한글 단어 기준
+    head = replacement.split("(")[0]
+    batchim = _has_final_consonant(head[-1])
+    for with_batchim, without_batchim in _PARTICLE_PAIRS:
+        if particle in (with_batchim, without_batchim):
+            particle = with_batchim if batchim else without_batchim
+            break
+    return replacement + particle
+
+
+def _tidy(text: str) -> str:
+    """참조 제거 후 남은 연속 공백과 줄 앞 쉼표 정리"""
+    lines = []
+    for line in text.split("\n"):
+        line = _MULTI_SPACE_PATTERN.sub(" ", line).strip()
+        # "청크 1에 따르면, HTTP는" 에서 참조만 지워졌을 때 남는 앞 쉼표 제거 (".NET" 등은 유지)
+        line = line.lstrip(", ")
+        lines.append(line)
+    return "\n".join(lines).strip()
+
+
+def clean_explanation(explanation: str) -> CleanResult:
+    """해설에서 명시적인 내부 참조와 알려진 혼합 표기를 규칙으로 정리
+
+    Args:
+        explanation: 원본 해설
+
+    Returns:
+        CleanResult: 정리된 해설과 LLM 교정 필요 여부 (의심 표현이 남았을 때만 LLM 교정 대상)
+    """
+    text = explanation
+    for pattern in _REFERENCE_PATTERNS:
+        text = pattern.sub("", text)
+    text = _MIXED_SCRIPT_REPLACEMENT_PATTERN.sub(_replace_mixed_script, text)
+
+    text = _tidy(text) if text != explanation else explanation
+    if not _CONTENT_PATTERN.search(text):
+        # 참조만 있던 해설이면 규칙으로 판단하지 않고 LLM에 맡김
+        return CleanResult(text=explanation, needs_llm=True, reasons=["정리 후 빈 해설"])
+
+    changed = text != explanation
+    reasons = []
+    suspicious = _SUSPICIOUS_PATTERN.search(text)
+    if suspicious:
+        reasons.append(f"내부 참조: {suspicious.group(0)}")
+    mixed = _MIXED_SCRIPT_PATTERN.search(text)
+    if mixed:
+        reasons.append(f"혼합 표기: {mixed.group(0)}")
+
+    return CleanResult(
+        text=text,
+        changed=changed,
+        needs_llm=bool(reasons),
+        reasons=reasons,
+    )
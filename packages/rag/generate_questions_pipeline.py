@@ -1,19 +1,25 @@
 """문제 생성 파이프라인"""
 
 import json
+import math
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
+from typing import Optional
 
 from category_loader import get_categories_for_generation, get_questions_to_generate, CategoryInfo
 from retriever import retrieve_chunks_with_reranker
+from reranker import get_reranker_cache_stats
 from question_generator import generate_questions
-from postprocessor import postprocess_questions
+from postprocessor import StreamingPostprocessor, get_postprocess_stats
+from adaptive_concurrency import get_postprocess_concurrency
 from evaluator import evaluate_questions
+from prescreen import PRESCREEN_MODES, prescreen_scores, record_enforced_rejects, record_verdicts, get_prescreen_report
 from question_saver import save_questions_to_db
 from config import config
 from schemas import QuestionGenerationContext
 from token_calculator import TokenUsage
+from embedding_cache import get_embedding_cache
 
 
 # 품질 기준
@@ -71,19 +77,69 @@ def get_output_directory() -> Path:
     return output_dir
 
 
+def _prescreen(questions: list[dict]) -> tuple[list[dict], list[float], list[dict]]:
+    """RAGAS 평가 전 어휘 겹침 사전 선별
+
+    Returns:
+        (RAGAS로 평가할 문제 리스트, 해당 문제들의 사전 선별 점수, 사전 탈락 문제 리스트)
+    """
+    mode = config.PRESCREEN_MODE.lower()
+    if mode not in PRESCREEN_MODES:
+        raise ValueError(f"지원하지 않는 사전 선별 방식: {mode} (지원: {', '.join(PRESCREEN_MODES)})")
+    if mode == "off":
+        return questions, [], []
+    if mode == "enforce" and config.PRESCREEN_FLOOR <= 0:
+        print("[경고] PRESCREEN_FLOOR가 보정되지 않아 enforce 대신 shadow로 실행")
+        mode = "shadow"
+
+    try:
+        scores = prescreen_scores(questions)
+    except Exception as e:
+        print(f"[경고] 사전 선별 실패, 전체 평가: {e}")
+        return questions, [], []
+
+    if mode == "shadow":
+        return questions, scores, []
+
+    to_evaluate, kept_scores, rejected = [], [], []
+    for q, score in zip(questions, scores):
+        if score >= config.PRESCREEN_FLOOR:
+            to_evaluate.append(q)
+            kept_scores.append(score)
+        else:
+            q_with_scores = q.copy()
+            q_with_scores['scores'] = {'prescreen': round(score, 4)}
+            q_with_scores['rejected_at'] = datetime.now().isoformat()
+            rejected.append(q_with_scores)
+
+    record_enforced_rejects(len(rejected))
+    return to_evaluate, kept_scores, rejected
+
+
+def _score_or_none(value) -> Optional[float]:
+    """JSON에 기록할 점수 (계산되지 않은 NaN 점수는 None)"""
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
 def evaluate_and_classify(
     questions: list[dict],
 ) -> tuple[list[dict], list[dict], TokenUsage]:
-    """문제 평가 후 합격/탈락 분류
+    """문제 평가 후 합격/탈락 분류 (PRESCREEN_MODE=enforce이면 사전 탈락 문제는 LLM 평가 생략)
 
     Returns:
         (합격 문제 리스트, 탈락 문제 리스트, 토큰 사용량)
     """
-    results, usage = evaluate_questions(questions)
+    questions, screen_scores, rejected = _prescreen(questions)
+    if not questions:
+        return [], rejected, TokenUsage()
+
+    results, usage = evaluate_questions(questions, faithfulness_threshold=FAITHFULNESS_THRESHOLD)
     df = results.to_pandas()
 
     passed = []
-    rejected = []
+    evaluated = []
+    verdicts = []
 
     for q, row in zip(questions, df.itertuples()):
         faithfulness = row.faithfulness
@@ -91,15 +147,24 @@ def evaluate_and_classify(
 
         q_with_scores = q.copy()
         q_with_scores['scores'] = {
-            'faithfulness': float(faithfulness),
-            'answer_relevancy': float(answer_relevancy)
+            'faithfulness': _score_or_none(faithfulness),
+            'answer_relevancy': _score_or_none(answer_relevancy)
         }
+        if q_with_scores['scores']['answer_relevancy'] is None and faithfulness < FAITHFULNESS_THRESHOLD:
+            # 단계별 평가에서 Faithfulness 미달로 AnswerRelevancy를 계산하지 않음
+            q_with_scores['skipped_metrics'] = ['answer_relevancy']
 
-        if faithfulness >= FAITHFULNESS_THRESHOLD and answer_relevancy >= ANSWER_RELEVANCY_THRESHOLD:
+        is_passed = faithfulness >= FAITHFULNESS_THRESHOLD and answer_relevancy >= ANSWER_RELEVANCY_THRESHOLD
+        if is_passed:
             passed.append(q_with_scores)
         else:
             q_with_scores['rejected_at'] = datetime.now().isoformat()
             rejected.append(q_with_scores)
+        evaluated.append(q_with_scores)
+        verdicts.append(is_passed)
+
+    if screen_scores:
+        record_verdicts(evaluated, screen_scores, verdicts)
 
     return passed, rejected, usage
 
@@ -138,20 +203,24 @@ def process_category(
         target_question_count=retrieval.question_count,
     )
 
+    # 스트리밍으로 완성된 문제는 생성이 끝나기 전에 해설 후처리를 시작
+    postprocessor = StreamingPostprocessor()
     try:
-        questions, gen_usage = generate_questions(context)
+        questions, gen_usage = generate_questions(context, on_question=postprocessor.submit)
         if not questions:
+            postprocessor.close()
             return [], [], 0
         cost.generation += gen_usage.total_cost
         logger.log(f"문제 생성: {len(questions)}개 ({gen_usage.total_cost:.1f}원)", indent=1)
     except Exception as e:
+        postprocessor.close()
         logger.log(f"문제 생성 실패: {e}", indent=1)
         return [], [], 0
 
     # 3. 해설 후처리
     questions_dict = [q.to_dict() for q in questions]
     try:
-        questions_dict, pp_usage = postprocess_questions(questions_dict)
+        questions_dict, pp_usage = postprocessor.collect(questions_dict)
         cost.postprocess += pp_usage.total_cost
         logger.log(f"후처리: {len(questions_dict)}개 ({pp_usage.total_cost:.1f}원)", indent=1)
     except Exception as e:
@@ -248,6 +317,15 @@ def run_pipeline():
     logger.log("완료")
     logger.log(f"결과: DB 저장 {total_saved}개, 탈락 {len(all_rejected)}개", indent=1)
     logger.log(f"비용: {cost.summary()}", indent=1)
+    if config.EMBEDDING_CACHE_ENABLED:
+        logger.log(f"임베딩 캐시: {get_embedding_cache().stats.summary()}", indent=1)
+    if config.RERANKER_CACHE_ENABLED:
+        logger.log(f"Reranker 캐시: {get_reranker_cache_stats().summary()}", indent=1)
+    logger.log(f"해설 후처리: {get_postprocess_stats().summary()}", indent=1)
+    if config.PRESCREEN_MODE.lower() != "off":
+        logger.log(f"평가 사전 선별: {get_prescreen_report().summary()}", indent=1)
+    if config.POSTPROCESS_MODE.lower() == "async":
+        logger.log(f"해설 후처리 동시성 한도: {get_postprocess_concurrency().limit}", indent=1)
     logger.log(f"소요시간: {logger.elapsed()}", indent=1)
 
 
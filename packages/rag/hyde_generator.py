@@ -1,8 +1,14 @@
-from langchain_naver import ChatClovaX
+import hashlib
+import json
+from functools import lru_cache
+from typing import Optional
+
 from langchain_core.messages import SystemMessage, HumanMessage
 from config import config
+from clients import get_clova_chat
 from category_loader import CategoryInfo, get_leaf_category_with_least_questions
 from token_calculator import calculate_cost, TokenUsage
+from cache_store import SqliteCache, make_cache_key
 
 SYSTEM_PROMPT = """당신은 IT 기술 문서 검색 전문가입니다.
 주어진 주제에 대해 의미론적 검색(semantic search)에 최적화된 쿼리를 생성합니다.
@@ -14,20 +20,62 @@ SYSTEM_PROMPT = """당신은 IT 기술 문서 검색 전문가입니다.
 4. 반드시 영어(English)로 작성합니다.
 5. 100단어 이내로 작성합니다."""
 
+USER_PROMPT = """Topic: {name}
+Category Path: {path}"""
+
+# 프롬프트가 바뀌면 캐시 키가 달라져 이전 HyDE 쿼리는 자동으로 무시됨
+PROMPT_HASH = hashlib.sha256((SYSTEM_PROMPT + USER_PROMPT).encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
+def get_hyde_cache() -> SqliteCache:
+    """HyDE 쿼리 캐시 (카테고리 ID를 tag로 저장하여 카테고리 단위 무효화)"""
+    return SqliteCache(
+        path=config.HYDE_CACHE_PATH,
+        table="hyde_queries",
+        ttl_seconds=config.HYDE_CACHE_TTL_SECONDS,
+    )
+
+
+def _hyde_cache_key(category: CategoryInfo) -> str:
+    return make_cache_key(str(category.id), category.path, PROMPT_HASH, config.LLM_MODEL)
+
+
+def invalidate_hyde_cache(category_id: Optional[int] = None) -> int:
+    """HyDE 캐시 무효화
+
+    Args:
+        category_id: 무효화할 카테고리 ID (None이면 전체)
 
-def generate_hyde_query(category: CategoryInfo) -> tuple[str, TokenUsage]:
+    Returns:
+        삭제된 항목 수
+    """
+    tag = str(category_id) if category_id is not None else None
+    return get_hyde_cache().invalidate(tag)
+
+
+def generate_hyde_query(category: CategoryInfo, use_cache: Optional[bool] = None) -> tuple[str, TokenUsage]:
     """HyDE 기반 검색 최적화 쿼리 생성
 
+    (카테고리 ID, 경로, 프롬프트 해시, 모델)이 같으면 캐시된 쿼리를 재사용하며,
+    이 경우 토큰 사용량은 0입니다.
+
+    Args:
+        category: 카테고리 정보
+        use_cache: 캐시 사용 여부 (기본값 config.HYDE_CACHE_ENABLED)
+
     Returns:
         (생성된 쿼리, 토큰 사용량)
     """
-    llm = ChatClovaX(
-        model=config.LLM_MODEL,
-        temperature=config.TEMPERATURE,
-    )
+    use_cache = config.HYDE_CACHE_ENABLED if use_cache is None else use_cache
+    if use_cache:
+        cached = get_hyde_cache().get(_hyde_cache_key(category))
+        if cached is not None:
+            return json.loads(cached)["query"], TokenUsage()
 
-    user_input = f"""Topic: {category.name}
-Category Path: {category.path}"""
+    llm = get_clova_chat(config.LLM_MODEL, config.TEMPERATURE)
+
+    user_input = USER_PROMPT.format(name=category.name, path=category.path)
 
     messages = [
         SystemMessage(content=SYSTEM_PROMPT),
@@ -45,4 +93,8 @@ Category Path: {category.path}"""
     # 비용 계산 (HyDE는 config.LLM_MODEL 사용)
     usage = calculate_cost(input_tokens, output_tokens, model=config.LLM_MODEL)
 
+    if use_cache:
+        value = json.dumps({"query": response.content, "path": category.path}, ensure_ascii=False)
+        get_hyde_cache().put(_hyde_cache_key(category), value.encode("utf-8"), tag=str(category.id))
+
     return response.content, usage
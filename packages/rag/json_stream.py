@@ -0,0 +1,83 @@
+"""스트리밍 JSON 파서 모듈 - 생성 중인 응답에서 배열 원소(객체)를 완성되는 즉시 추출
+
+예: '{"questions": [{...}, {...' 까지 도착했으면 첫 번째 객체만 먼저 반환합니다.
+코드 블록(```json)이나 앞뒤 텍스트는 배열 키를 찾기 전까지 무시됩니다.
+"""
+
+import json
+import re
+from typing import Any, Callable
+
+
+class JsonArrayStreamParser:
+    """지정한 키의 JSON 배열에서 완성된 객체를 순서대로 추출하는 증분 파서
+
+    이미 검사한 위치를 기억하므로 feed 호출마다 새로 도착한 문자만 검사합니다.
+    """
+
+    def __init__(self, key: str = "questions", loads: Callable[[str], Any] = json.loads):
+        self._loads = loads
+        self._key_pattern = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._done = False
+
+        # 배열 내부 스캔 상태
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._object_start = -1
+
+    @property
+    def done(self) -> bool:
+        """배열이 닫혔는지 여부"""
+        return self._done
+
+    def feed(self, text: str) -> list[dict]:
+        """텍스트 조각 추가 후 새로 완성된 객체 리스트 반환"""
+        if self._done:
+            return []
+        self._buffer += text
+
+        if not self._in_array:
+            match = self._key_pattern.search(self._buffer)
+            if not match:
+                return []
+            self._in_array = True
+            self._pos = match.end()
+
+        completed = []
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer):
+            ch = buffer[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                if self._depth == 0 and ch == "{":
+                    self._object_start = i
+                self._depth += 1
+            elif ch in "}]":
+                if self._depth == 0 and ch == "]":
+                    self._done = True
+                    i += 1
+                    break
+                self._depth -= 1
+                if self._depth == 0 and ch == "}" and self._object_start >= 0:
+                    try:
+                        completed.append(self._loads(buffer[self._object_start:i + 1]))
+                    except json.JSONDecodeError as e:
+                        print(f"[경고] 스트리밍 객체 파싱 실패, 스킵: {e}")
+                    self._object_start = -1
+            i += 1
+
+        self._pos = i
+        return completed
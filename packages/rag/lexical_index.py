@@ -0,0 +1,218 @@
+"""어휘(BM25) 인덱스 모듈 - Reranker 전 후보 청크 사전 정렬용
+
+document_embeddings.content 전체에 대한 역색인을 코퍼스 버전별로 한 번 만들어
+파일(LEXICAL_INDEX_DIR/<버전 해시>-v<포맷>.json)에 저장하고, 검색 후보에 대해서만 BM25 점수를 계산합니다.
+파일은 JSON이므로 읽을 때 코드가 실행되지 않고, 실행 모듈(__main__ 등)과 무관하게 읽을 수 있습니다.
+
+토큰화 규칙:
+- 영문/숫자: 소문자 단어 단위 (예: "HTTP/2" → "http", "2")
+- 한글: 조사/어미가 붙어도 매칭되도록 음절 bigram (예: "트랜잭션의" → "트랜", "랜잭", "잭션", "션의")
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from config import config
+from db import get_connection, get_cursor
+from corpus_index import CorpusVersionedIndex
+from vector_index import TABLE_NAME, get_corpus_version
+
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 인덱스 파일 포맷 버전 (바뀌면 이전 파일은 무시되고 다시 빌드)
+INDEX_FORMAT = 3
+
+_LATIN_PATTERN = re.compile(r"[a-z0-9]+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """BM25용 토큰화 (영문 단어 + 한글 음절 bigram)"""
+    text = text.lower()
+    tokens = _LATIN_PATTERN.findall(text)
+    for word in _HANGUL_PATTERN.findall(text):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+@dataclass
+class _IndexData:
+    """메모리상의 역색인 (파일에는 to_dict() 결과만 저장)"""
+    version: str
+    doc_lengths: dict[int, int]
+    postings: dict[str, dict[int, int]]  # 토큰 → {청크 ID: 출현 빈도}
+    avg_doc_length: float
+
+    def to_dict(self) -> dict:
+        return {
+            "format": INDEX_FORMAT,
+            "version": self.version,
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+            "avg_doc_length": self.avg_doc_length,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "_IndexData":
+        if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT:
+            raise ValueError("어휘 인덱스 포맷 불일치")
+        # JSON 객체 키는 문자열이므로 청크 ID를 정수로 복원
+        return cls(
+            version=data["version"],
+            doc_lengths={int(chunk_id): length for chunk_id, length in data["doc_lengths"].items()},
+            postings={
+                token: {int(chunk_id): tf for chunk_id, tf in posting.items()}
+                for token, posting in data["postings"].items()
+            },
+            avg_doc_length=data["avg_doc_length"],
+        )
+
+
+def _index_path(index_dir: Path, version: str) -> Path:
+    key = hashlib.sha256(version.encode("utf-8")).hexdigest()[:16]
+    return index_dir / f"{key}-v{INDEX_FORMAT}.json"
+
+
+def _read_index(path: Path) -> _IndexData:
+    """인덱스 파일 읽기 (손상/구버전 파일이면 예외)"""
+    with open(path, encoding="utf-8") as f:
+        return _IndexData.from_dict(json.load(f))
+
+
+def build_lexical_index(index_dir: Optional[str] = None) -> Path:
+    """document_embeddings 전체로 역색인을 만들어 저장
+
+    Returns:
+        저장된 인덱스 파일 경로
+    """
+    index_dir = Path(index_dir or config.LEXICAL_INDEX_DIR)
+    index_dir.mkdir(parents=True, exist_ok=True)
+
+    doc_lengths: dict[int, int] = {}
+    postings: dict[str, dict[int, int]] = {}
+
+    with get_connection() as conn:
+        conn.set_session(isolation_level="REPEATABLE READ", readonly=True)
+
+        with get_cursor(conn) as cursor:
+            version = get_corpus_version(cursor)
+
+        path = _index_path(index_dir, version)
+        if path.exists():
+            conn.rollback()
+            return path
+
+        # 서버 사이드 커서로 스트리밍 (전체 결과를 메모리에 올리지 않음)
+        stream = conn.cursor(name="lexical_index_build")
+        stream.itersize = 1000
+        stream.execute(f"SELECT id, content FROM {TABLE_NAME} ORDER BY id")
+        for chunk_id, content in stream:
+            counts = Counter(tokenize(content))
+            doc_lengths[chunk_id] = sum(counts.values())
+            for token, tf in counts.items():
+                postings.setdefault(token, {})[chunk_id] = tf
+        stream.close()
+        conn.rollback()
+
+    data = _IndexData(
+        version=version,
+        doc_lengths=doc_lengths,
+        postings=postings,
+        avg_doc_length=(sum(doc_lengths.values()) / len(doc_lengths)) if doc_lengths else 0.0,
+    )
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+    # 이전 버전 인덱스 정리 (이전 포맷의 .pkl 파일 포함)
+    for old_path in [*index_dir.glob("*.json"), *index_dir.glob("*.pkl")]:
+        if old_path != path:
+            old_path.unlink(missing_ok=True)
+
+    return path
+
+
+class LexicalIndex(CorpusVersionedIndex[_IndexData]):
+    """BM25 역색인 (코퍼스 버전이 바뀌면 다시 로드/빌드)
+
+    코퍼스 버전 확인은 refresh_interval 초마다 한 번만 DB에 질의합니다.
+    """
+
+    def __init__(self, index_dir: Optional[str] = None, refresh_interval: Optional[float] = None):
+        super().__init__(refresh_interval)
+        self.index_dir = Path(index_dir or config.LEXICAL_INDEX_DIR)
+
+    def _load(self, version: str) -> _IndexData:
+        """해당 버전의 인덱스 파일 읽기 (없거나 읽을 수 없으면 새로 빌드)"""
+        path = _index_path(self.index_dir, version)
+        if path.exists():
+            try:
+                return _read_index(path)
+            except Exception as e:
+                print(f"[경고] 어휘 인덱스 파일을 읽을 수 없어 다시 빌드합니다: {e}")
+                path.unlink(missing_ok=True)
+        else:
+            print(f"[어휘 인덱스] 코퍼스 변경 감지, 인덱스 빌드 중... ({version})")
+
+        return _read_index(build_lexical_index(str(self.index_dir)))
+
+    def score(self, query: str, chunk_ids: list[int]) -> dict[int, float]:
+        """후보 청크들의 BM25 점수 계산
+
+        IDF는 코퍼스 전체 기준이므로 후보 집합 크기와 무관하게 점수가 안정적입니다.
+
+        Args:
+            query: 검색 쿼리
+            chunk_ids: 점수를 계산할 청크 ID 리스트
+
+        Returns:
+            {청크 ID: BM25 점수} (인덱스에 없는 청크는 0점)
+        """
+        data = self.ensure_fresh()
+        scores = {chunk_id: 0.0 for chunk_id in chunk_ids}
+        doc_count = len(data.doc_lengths)
+        if doc_count == 0 or not chunk_ids:
+            return scores
+
+        for token, query_tf in Counter(tokenize(query)).items():
+            posting = data.postings.get(token)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+
+            for chunk_id in chunk_ids:
+                tf = posting.get(chunk_id)
+                if not tf:
+                    continue
+                length_norm = 1 - BM25_B + BM25_B * data.doc_lengths[chunk_id] / data.avg_doc_length
+                scores[chunk_id] += query_tf * idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * length_norm)
+
+        return scores
+
+
+@lru_cache(maxsize=1)
+def get_lexical_index() -> LexicalIndex:
+    """프로세스 단위 어휘 인덱스 인스턴스"""
+    return LexicalIndex()
+
+
+if __name__ == "__main__":
+    built = build_lexical_index()
+    print(f"어휘 인덱스 빌드 완료: {built}")
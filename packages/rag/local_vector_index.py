@@ -0,0 +1,241 @@
+"""로컬 벡터 인덱스 모듈 - document_embeddings 스냅샷을 메모리 맵 NumPy 행렬로 검색
+
+스냅샷 구성 (LOCAL_INDEX_DIR/<버전 해시>/):
+- embeddings.npy: L2 정규화된 float32 임베딩 행렬 (N x D)
+- ids.npy: 청크 ID 배열 (int64)
+- offsets.npy: contents.bin 내 청크별 시작 오프셋 (N + 1, int64)
+- contents.bin: UTF-8 청크 본문을 이어붙인 파일
+- meta.json: 코퍼스 버전, 행 수, 차원
+
+current.json이 사용할 스냅샷을 가리키며, 파일은 mmap으로 열기 때문에
+여러 워커 프로세스가 같은 페이지 캐시를 공유합니다.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from config import config
+from db import get_connection, get_cursor
+from corpus_index import CorpusVersionedIndex
+from vector_index import TABLE_NAME, get_corpus_version
+
+
+CURRENT_FILE = "current.json"
+META_FILE = "meta.json"
+
+
+def _snapshot_key(version: str) -> str:
+    """코퍼스 버전 → 스냅샷 디렉토리 이름"""
+    return hashlib.sha256(version.encode("utf-8")).hexdigest()[:16]
+
+
+def _parse_embedding(value) -> np.ndarray:
+    """DB에서 읽은 임베딩을 float32 배열로 변환"""
+    if isinstance(value, str):
+        # pgvector 텍스트 표현 '[0.1,0.2,...]'은 JSON 배열과 호환
+        value = json.loads(value)
+    return np.asarray(value, dtype=np.float32)
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 중간 상태를 보지 않도록 함"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def build_snapshot(index_dir: Optional[str] = None) -> Path:
+    """document_embeddings 전체를 스냅샷 파일로 내보내고 current.json 갱신
+
+    REPEATABLE READ 트랜잭션 안에서 버전 조회와 전체 조회를 수행하므로
+    스냅샷 내용과 기록된 버전이 항상 일치합니다.
+
+    Returns:
+        생성(또는 재사용)된 스냅샷 디렉토리
+    """
+    index_dir = Path(index_dir or config.LOCAL_INDEX_DIR)
+    index_dir.mkdir(parents=True, exist_ok=True)
+    dim = config.EMBEDDING_DIMENSION
+
+    with get_connection() as conn:
+        conn.set_session(isolation_level="REPEATABLE READ", readonly=True)
+
+        with get_cursor(conn) as cursor:
+            version = get_corpus_version(cursor)
+            cursor.execute(f"SELECT COUNT(*) AS row_count FROM {TABLE_NAME}")
+            count = cursor.fetchone()["row_count"]
+
+        snapshot_dir = index_dir / _snapshot_key(version)
+        if not (snapshot_dir / META_FILE).exists():
+            tmp_dir = index_dir / f".{snapshot_dir.name}.{os.getpid()}.tmp"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir()
+
+            ids = np.zeros(count, dtype=np.int64)
+            offsets = np.zeros(count + 1, dtype=np.int64)
+            matrix = np.lib.format.open_memmap(
+                tmp_dir / "embeddings.npy", mode="w+", dtype=np.float32, shape=(count, dim)
+            )
+
+            # 서버 사이드 커서로 스트리밍 (전체 결과를 메모리에 올리지 않음)
+            stream = conn.cursor(name="local_vector_index_snapshot")
+            stream.itersize = 1000
+            stream.execute(f"SELECT id, content, embedding FROM {TABLE_NAME} ORDER BY id")
+
+            with open(tmp_dir / "contents.bin", "wb") as contents_file:
+                for i, (chunk_id, content, embedding) in enumerate(stream):
+                    vector = _parse_embedding(embedding)
+                    norm = np.linalg.norm(vector)
+                    matrix[i] = vector / norm if norm > 0 else vector
+                    ids[i] = chunk_id
+
+                    data = content.encode("utf-8")
+                    contents_file.write(data)
+                    offsets[i + 1] = offsets[i] + len(data)
+            stream.close()
+
+            matrix.flush()
+            del matrix
+            np.save(tmp_dir / "ids.npy", ids)
+            np.save(tmp_dir / "offsets.npy", offsets)
+            _write_json_atomic(tmp_dir / META_FILE, {
+                "version": version,
+                "count": int(count),
+                "dimension": dim,
+                "built_at": datetime.now().isoformat(),
+            })
+
+            try:
+                os.replace(tmp_dir, snapshot_dir)
+            except OSError:
+                # 다른 프로세스가 같은 버전을 먼저 만든 경우
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        conn.rollback()
+
+    _write_json_atomic(index_dir / CURRENT_FILE, {"version": version, "snapshot": snapshot_dir.name})
+
+    # 이전 스냅샷 정리 (이미 mmap으로 열린 파일은 삭제 후에도 읽기 가능)
+    for path in index_dir.iterdir():
+        if path.is_dir() and path.name != snapshot_dir.name and not path.name.startswith("."):
+            shutil.rmtree(path, ignore_errors=True)
+
+    return snapshot_dir
+
+
+@dataclass
+class _Snapshot:
+    version: str
+    ids: np.ndarray
+    matrix: np.ndarray
+    offsets: np.ndarray
+    contents: Optional[np.memmap]
+
+    def content_at(self, row: int) -> str:
+        start, end = int(self.offsets[row]), int(self.offsets[row + 1])
+        if self.contents is None or start == end:
+            # 본문이 모두 빈 코퍼스는 contents.bin이 비어 있어 mmap을 열지 않음
+            return ""
+        return bytes(self.contents[start:end]).decode("utf-8")
+
+
+def _load_snapshot(snapshot_dir: Path) -> _Snapshot:
+    """스냅샷 파일을 mmap으로 열기"""
+    with open(snapshot_dir / META_FILE, encoding="utf-8") as f:
+        meta = json.load(f)
+
+    contents_path = snapshot_dir / "contents.bin"
+    contents = (
+        np.memmap(contents_path, dtype=np.uint8, mode="r")
+        if contents_path.stat().st_size > 0 else None
+    )
+
+    return _Snapshot(
+        version=meta["version"],
+        ids=np.load(snapshot_dir / "ids.npy", mmap_mode="r"),
+        matrix=np.load(snapshot_dir / "embeddings.npy", mmap_mode="r"),
+        offsets=np.load(snapshot_dir / "offsets.npy", mmap_mode="r"),
+        contents=contents,
+    )
+
+
+class LocalVectorIndex(CorpusVersionedIndex[_Snapshot]):
+    """메모리 맵 스냅샷 기반 코사인 유사도 Top-K 검색
+
+    코퍼스 버전 확인은 refresh_interval 초마다 한 번만 DB에 질의하므로
+    그 사이의 검색은 DB 왕복 없이 처리됩니다.
+    """
+
+    def __init__(self, index_dir: Optional[str] = None, refresh_interval: Optional[float] = None):
+        super().__init__(refresh_interval)
+        self.index_dir = Path(index_dir or config.LOCAL_INDEX_DIR)
+
+    def _read_current(self) -> Optional[dict]:
+        try:
+            with open(self.index_dir / CURRENT_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _load(self, version: str) -> _Snapshot:
+        """해당 버전의 스냅샷을 열기 (없거나 current.json이 가리키는 스냅샷을 읽을 수 없으면 새로 빌드)"""
+        current = self._read_current()
+        if current and current["version"] == version:
+            snapshot_dir = self.index_dir / current["snapshot"]
+            try:
+                return _load_snapshot(snapshot_dir)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[경고] 로컬 인덱스 스냅샷을 읽을 수 없어 다시 빌드합니다: {e}")
+                shutil.rmtree(snapshot_dir, ignore_errors=True)
+        else:
+            print(f"[로컬 인덱스] 코퍼스 변경 감지, 스냅샷 빌드 중... ({version})")
+
+        return _load_snapshot(build_snapshot(str(self.index_dir)))
+
+    def search(self, query_embedding, top_k: int = 5) -> list[tuple[int, str, float, np.ndarray]]:
+        """코사인 유사도 Top-K 검색
+
+        Returns:
+            [(청크 ID, 청크 내용, 유사도, 정규화된 임베딩), ...] (유사도 내림차순)
+        """
+        snapshot = self.ensure_fresh()
+        count = len(snapshot.ids)
+        if count == 0 or top_k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+
+        # 행렬-벡터 곱 한 번으로 전체 코사인 유사도 계산 후 부분 정렬
+        scores = snapshot.matrix @ query
+        k = min(top_k, count)
+        top_rows = np.argpartition(-scores, k - 1)[:k]
+        top_rows = top_rows[np.argsort(-scores[top_rows])]
+
+        return [
+            (int(snapshot.ids[row]), snapshot.content_at(row), float(scores[row]), snapshot.matrix[row])
+            for row in top_rows
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_local_index() -> LocalVectorIndex:
+    """프로세스 단위 로컬 인덱스 인스턴스"""
+    return LocalVectorIndex()
+
+
+if __name__ == "__main__":
+    built = build_snapshot()
+    print(f"스냅샷 빌드 완료: {built}")
@@ -0,0 +1,60 @@
+"""MMR(Maximal Marginal Relevance) 모듈 - 검색 후보 중복 제거용 다양성 선택"""
+
+import numpy as np
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def mmr_select(
+    query_embedding,
+    candidate_embeddings,
+    k: int,
+    lambda_mult: float = 0.7,
+) -> list[int]:
+    """쿼리 관련성과 후보 간 중복을 함께 고려해 k개 후보 선택
+
+    score = lambda * sim(query, c) - (1 - lambda) * max(sim(c, 이미 선택된 후보))
+
+    후보 간 유사도 행렬을 한 번에 계산하고, 각 단계에서는 벡터 연산으로
+    "선택된 후보와의 최대 유사도"만 갱신합니다.
+
+    Args:
+        query_embedding: 쿼리 임베딩
+        candidate_embeddings: 후보 임베딩 리스트 (관련도순)
+        k: 선택할 후보 수
+        lambda_mult: 관련성 가중치 (1이면 관련도순 그대로, 0이면 다양성만 고려)
+
+    Returns:
+        선택된 후보 인덱스 리스트 (선택 순서)
+    """
+    candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+    if candidates.ndim != 2 or len(candidates) == 0 or k <= 0:
+        return []
+    if k >= len(candidates):
+        return list(range(len(candidates)))
+
+    candidates = _normalize_rows(candidates)
+    query = _normalize_rows(np.asarray(query_embedding, dtype=np.float32))
+
+    relevance = candidates @ query
+    pairwise = candidates @ candidates.T
+
+    first = int(np.argmax(relevance))
+    selected = [first]
+    is_selected = np.zeros(len(candidates), dtype=bool)
+    is_selected[first] = True
+    max_redundancy = pairwise[first].copy()
+
+    while len(selected) < k:
+        scores = lambda_mult * relevance - (1 - lambda_mult) * max_redundancy
+        scores[is_selected] = -np.inf
+        next_index = int(np.argmax(scores))
+
+        selected.append(next_index)
+        is_selected[next_index] = True
+        np.maximum(max_redundancy, pairwise[next_index], out=max_redundancy)
+
+    return selected
@@ -1,12 +1,21 @@
 """해설 후처리 모듈 - ChatGoogleGenerativeAI (Gemini 2.0 Flash) 사용"""
 
+import asyncio
 import json
+import math
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from config import config
+from adaptive_concurrency import AdaptiveSemaphore, get_postprocess_concurrency
+from clients import get_gemini_chat
+from explanation_cleaner import CleanResult, clean_explanation
 from token_calculator import (
     get_usd_to_krw_rate,
     GEMINI_2_0_FLASH_INPUT_COST_PER_TOKEN,
@@ -15,7 +24,7 @@ from token_calculator import (
 )
 
 
-SYSTEM_PROMPT = """당신은 기술 면접 문제의 해설을 교정하는 전문가입니다.
+CLEANING_RULES = """당신은 기술 면접 문제의 해설을 교정하는 전문가입니다.
 
 다음 규칙에 따라 해설을 수정하세요:
 
@@ -30,15 +39,128 @@ SYSTEM_PROMPT = """당신은 기술 면접 문제의 해설을 교정하는 전
 3. **의미 보존**: 기술적 내용과 의미는 반드시 유지
 
 4. **자연스러운 문장**: 면접관이 직접 설명하는 것처럼 자연스럽게 작성
+"""
 
+SYSTEM_PROMPT = CLEANING_RULES + """
 반드시 JSON 형식으로 응답하세요:
 {"cleaned_explanation": "교정된 해설"}"""
 
 
+BATCH_SYSTEM_PROMPT = CLEANING_RULES + """
+입력은 [{"index": 번호, "explanation": "해설"}, ...] 형태의 JSON 배열입니다.
+각 해설을 독립적으로 교정하고, 입력의 index를 그대로 유지하여 모든 항목을 빠짐없이 반환하세요.
+
+반드시 JSON 형식으로 응답하세요:
+{"cleaned_explanations": [{"index": 번호, "cleaned_explanation": "교정된 해설"}, ...]}"""
+
+POSTPROCESS_MODES = ("batch", "single", "async")
+
 MAX_RETRIES = 3
 RETRY_DELAY = 2.0
 
 
+@dataclass
+class PostprocessStats:
+    """해설 후처리 통계 (규칙 기반 정리로 줄인 LLM 호출 수 포함)"""
+    explanations: int = 0
+    rule_cleaned: int = 0  # 규칙으로 수정된 해설 수
+    escalated: int = 0  # 규칙 적용 후 LLM으로 보낸 해설 수
+    llm_calls: int = 0
+    llm_calls_avoided: int = 0  # 규칙 기반 정리가 없었다면 필요했을 호출 수 - 실제 필요 호출 수
+
+    def summary(self) -> str:
+        return (
+            f"해설 {self.explanations}개 중 규칙 수정 {self.rule_cleaned}개, LLM 교정 {self.escalated}개 | "
+            f"LLM 호출 {self.llm_calls}회 (절약 {self.llm_calls_avoided}회)"
+        )
+
+
+_stats = PostprocessStats()
+_stats_lock = threading.Lock()
+
+
+def get_postprocess_stats() -> PostprocessStats:
+    """프로세스 누적 후처리 통계"""
+    return _stats
+
+
+def _record(**counts: int) -> None:
+    with _stats_lock:
+        for name, value in counts.items():
+            setattr(_stats, name, getattr(_stats, name) + value)
+
+
+def _required_llm_calls(count: int, mode: str) -> int:
+    """해설 count개를 LLM으로 처리할 때 필요한 호출 수 (재시도/재처리 제외, single/async는 해설당 1회)"""
+    if mode == "batch":
+        return min(count, 1)
+    return count
+
+
+def _apply_rules(explanations: list[str]) -> list[CleanResult]:
+    """규칙 기반 정리 적용 (비활성화 시 모든 해설을 LLM으로 보냄)"""
+    if not config.POSTPROCESS_RULE_CLEANER_ENABLED:
+        return [CleanResult(text=explanation, needs_llm=True) for explanation in explanations]
+
+    results = [clean_explanation(explanation) for explanation in explanations]
+    _record(
+        rule_cleaned=sum(1 for result in results if result.changed),
+        escalated=sum(1 for result in results if result.needs_llm),
+    )
+    return results
+
+
+def _extract_json_text(text: str) -> str:
+    """JSON 블록 추출 (```json ... ``` 형태일 수 있음)"""
+    if "```json" in text:
+        return text.split("```json")[1].split("```")[0].strip()
+    if "```" in text:
+        return text.split("```")[1].split("```")[0].strip()
+    return text
+
+
+def _gemini_usage(response) -> TokenUsage:
+    """Gemini 응답의 usage_metadata로 토큰 사용량 계산"""
+    usage_meta = response.usage_metadata or {}
+    input_tokens = usage_meta.get("input_tokens", 0)
+    output_tokens = usage_meta.get("output_tokens", 0)
+
+    rate = get_usd_to_krw_rate()
+    input_cost = input_tokens * GEMINI_2_0_FLASH_INPUT_COST_PER_TOKEN * rate
+    output_cost = output_tokens * GEMINI_2_0_FLASH_OUTPUT_COST_PER_TOKEN * rate
+
+    return TokenUsage(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        input_cost=input_cost,
+        output_cost=output_cost,
+        total_cost=input_cost + output_cost,
+    )
+
+
+def _invoke_json(system_prompt: str, user_content: str) -> tuple[dict, TokenUsage]:
+    """Gemini 호출 후 JSON 응답 파싱 (429 응답은 재시도)"""
+    llm = get_gemini_chat("gemini-2.0-flash", 0.1)
+
+    messages = [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=user_content),
+    ]
+
+    _record(llm_calls=1)
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = llm.invoke(messages)
+            result = json.loads(_extract_json_text(response.content))
+            return result, _gemini_usage(response)
+
+        except Exception as e:
+            if "429" in str(e) and attempt < MAX_RETRIES - 1:
+                time.sleep(RETRY_DELAY * (attempt + 1))
+                continue
+            raise
+
+
 def postprocess_explanation(explanation: str) -> tuple[str, TokenUsage]:
     """해설 후처리 (ChatGoogleGenerativeAI - Gemini 2.0 Flash)
 
@@ -48,86 +170,295 @@ def postprocess_explanation(explanation: str) -> tuple[str, TokenUsage]:
     Returns:
         (교정된 해설, 토큰 사용량)
     """
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash",
-        google_api_key=config.GEMINI_API_KEY,
-        temperature=0.1,
-    )
+    result, usage = _invoke_json(SYSTEM_PROMPT, f"다음 해설을 교정하세요:\n\n{explanation}")
+    return result["cleaned_explanation"], usage
+
+
+async def _apostprocess_explanation(explanation: str, semaphore: AdaptiveSemaphore) -> tuple[str, TokenUsage]:
+    """해설 후처리 비동기 버전 (AIMD 동시성 한도 안에서 호출, 429/지연을 컨트롤러에 반영)"""
+    llm = get_gemini_chat("gemini-2.0-flash", 0.1)
+    controller = semaphore.controller
 
     messages = [
         SystemMessage(content=SYSTEM_PROMPT),
         HumanMessage(content=f"다음 해설을 교정하세요:\n\n{explanation}"),
     ]
 
+    _record(llm_calls=1)
     for attempt in range(MAX_RETRIES):
+        async with semaphore.slot():
+            started = time.monotonic()
+            try:
+                response = await llm.ainvoke(messages)
+            except Exception as e:
+                if "429" not in str(e):
+                    raise
+                controller.on_overload()
+                if attempt == MAX_RETRIES - 1:
+                    raise
+            else:
+                controller.on_success(time.monotonic() - started)
+                result = json.loads(_extract_json_text(response.content))
+                return result["cleaned_explanation"], _gemini_usage(response)
+
+        # 재시도 대기는 슬롯을 반납한 뒤에 수행
+        await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+
+
+@lru_cache(maxsize=1)
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """async 후처리 전용 이벤트 루프 (프로세스 단위 1개, 백그라운드 스레드에서 계속 실행)
+
+    get_gemini_chat 클라이언트는 lru_cache로 공유되고 비동기 연결은 처음 사용한 루프에 묶이므로,
+    카테고리마다 asyncio.run으로 루프를 새로 만들면 닫힌 루프의 연결을 재사용하다
+    "Event loop is closed"가 발생할 수 있습니다. 모든 async 후처리를 이 루프 하나에서 실행합니다.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="postprocess-async-loop", daemon=True).start()
+    return loop
+
+
+async def _apostprocess_questions(questions: list[dict]) -> TokenUsage:
+    """문제 딕셔너리들의 해설을 동시에 교정 (questions를 직접 수정)"""
+    semaphore = AdaptiveSemaphore(get_postprocess_concurrency())
+    results = await asyncio.gather(
+        *(_apostprocess_explanation(q["explanation"], semaphore) for q in questions),
+        return_exceptions=True,
+    )
+
+    total_usage = TokenUsage()
+    for q, result in zip(questions, results):
+        if isinstance(result, Exception):
+            # 후처리 실패 시 원본 유지 (규칙 기반 정리 결과는 유지)
+            print(f"[경고] 해설 후처리 실패: {result}")
+            continue
+        q["explanation"], usage = result
+        total_usage += usage
+
+    return total_usage
+
+
+def postprocess_explanations_batch(explanations: list[str]) -> tuple[list[Optional[str]], TokenUsage]:
+    """여러 해설을 한 번의 Gemini 호출로 후처리
+
+    응답 항목은 입력 index로 매칭하며, index가 없거나 중복/범위 밖이거나
+    해설이 비어 있는 항목은 None으로 반환합니다 (호출자가 개별 재처리).
+
+    Args:
+        explanations: 원본 해설 리스트
+
+    Returns:
+        (입력 순서와 같은 교정된 해설 리스트 (실패 항목은 None), 토큰 사용량)
+    """
+    if not explanations:
+        return [], TokenUsage()
+
+    payload = json.dumps(
+        [{"index": i, "explanation": explanation} for i, explanation in enumerate(explanations)],
+        ensure_ascii=False,
+    )
+    result, usage = _invoke_json(BATCH_SYSTEM_PROMPT, f"다음 해설들을 교정하세요:\n\n{payload}")
+
+    cleaned: list[Optional[str]] = [None] * len(explanations)
+    seen: set[int] = set()
+    items = result.get("cleaned_explanations", []) if isinstance(result, dict) else []
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        index = item.get("index")
+        text = item.get("cleaned_explanation")
+        if not isinstance(index, int) or not 0 <= index < len(explanations):
+            continue
+        if index in seen:
+            # 같은 index가 여러 번 오면 어느 쪽이 맞는지 알 수 없으므로 개별 재처리
+            cleaned[index] = None
+            continue
+        seen.add(index)
+        if isinstance(text, str) and text.strip():
+            cleaned[index] = text
+
+    misaligned = sum(1 for text in cleaned if text is None)
+    if misaligned:
+        print(f"[경고] 일괄 후처리 응답 불일치 {misaligned}/{len(explanations)}개 (개별 재처리)")
+
+    return cleaned, usage
+
+
+def _postprocess_with_llm(questions: list[dict], mode: str) -> TokenUsage:
+    """문제 딕셔너리들의 해설을 Gemini로 교정 (questions를 직접 수정)
+
+    batch 모드는 모든 해설을 한 번에 요청하고, 응답이 어긋난 항목만 개별 호출로 다시 처리합니다.
+    async 모드는 해설별 호출을 AIMD 동시성 한도 안에서 동시에 실행합니다.
+    """
+    if mode == "async":
+        # 호출 스레드에 이미 실행 중인 루프가 있어도 동작하도록 전용 루프에 제출하고 결과 대기
+        return asyncio.run_coroutine_threadsafe(_apostprocess_questions(questions), _get_async_loop()).result()
+
+    total_usage = TokenUsage()
+
+    # 1. 일괄 후처리 (실패 시 전체 개별 처리)
+    cleaned: list[Optional[str]] = [None] * len(questions)
+    if mode == "batch" and len(questions) > 1:
         try:
-            response = llm.invoke(messages)
+            cleaned, usage = postprocess_explanations_batch([q["explanation"] for q in questions])
+            total_usage += usage
+        except Exception as e:
+            print(f"[경고] 일괄 후처리 실패, 개별 처리: {e}")
 
-            # JSON 파싱
-            text = response.content
-            # JSON 블록 추출 (```json ... ``` 형태일 수 있음)
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0].strip()
-
-            result = json.loads(text)
-
-            # 토큰 사용량 계산
-            usage_meta = response.usage_metadata or {}
-            input_tokens = usage_meta.get("input_tokens", 0)
-            output_tokens = usage_meta.get("output_tokens", 0)
-
-            rate = get_usd_to_krw_rate()
-            input_cost = input_tokens * GEMINI_2_0_FLASH_INPUT_COST_PER_TOKEN * rate
-            output_cost = output_tokens * GEMINI_2_0_FLASH_OUTPUT_COST_PER_TOKEN * rate
-
-            usage = TokenUsage(
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                input_cost=input_cost,
-                output_cost=output_cost,
-                total_cost=input_cost + output_cost,
-            )
+    # 2. 남은 항목 개별 후처리
+    for i, q in enumerate(questions):
+        if cleaned[i] is not None:
+            q["explanation"] = cleaned[i]
+            continue
 
-            return result["cleaned_explanation"], usage
+        try:
+            cleaned_explanation, usage = postprocess_explanation(q["explanation"])
+            q["explanation"] = cleaned_explanation
+            total_usage += usage
 
         except Exception as e:
-            if "429" in str(e) and attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-                continue
-            raise
+            # 후처리 실패 시 원본 유지 (규칙 기반 정리 결과는 유지)
+            print(f"[경고] 해설 후처리 실패: {e}")
+
+    return total_usage
 
 
-def postprocess_questions(questions: list[dict]) -> tuple[list[dict], TokenUsage]:
+def postprocess_questions(
+    questions: list[dict],
+    mode: Optional[str] = None,
+) -> tuple[list[dict], TokenUsage]:
     """문제 리스트의 해설 일괄 후처리
 
+    규칙 기반 정리(explanation_cleaner)를 먼저 적용하고, 정리 후에도
+    내부 참조/혼합 표기가 남은 해설만 (정리된 텍스트로) Gemini 교정합니다.
+    batch 모드는 남은 해설을 한 번에 요청하고, single 모드는 해설마다 한 번씩 호출하며,
+    async 모드는 해설별 호출을 429/지연에 따라 조절되는 동시성 한도 안에서 동시에 실행합니다.
+
     Args:
         questions: 문제 딕셔너리 리스트
+        mode: "batch", "single" 또는 "async" (기본값 config.POSTPROCESS_MODE)
 
     Returns:
         (후처리된 문제 리스트, 총 토큰 사용량)
     """
-    total_usage = TokenUsage()
-    processed = []
+    mode = (mode or config.POSTPROCESS_MODE).lower()
+    if mode not in POSTPROCESS_MODES:
+        raise ValueError(f"지원하지 않는 후처리 방식: {mode} (지원: {', '.join(POSTPROCESS_MODES)})")
+
+    processed = [q.copy() for q in questions]
+
+    # 1. 규칙 기반 정리
+    results = _apply_rules([q["explanation"] for q in questions])
+    escalated = []
+    for q_copy, result in zip(processed, results):
+        q_copy["explanation"] = result.text
+        if result.needs_llm:
+            escalated.append(q_copy)
+
+    _record(
+        explanations=len(questions),
+        llm_calls_avoided=_required_llm_calls(len(questions), mode) - _required_llm_calls(len(escalated), mode),
+    )
 
-    for q in questions:
-        q_copy = q.copy()
+    # 2. 결함이 있던 해설만 LLM 교정
+    total_usage = _postprocess_with_llm(escalated, mode) if escalated else TokenUsage()
+    return processed, total_usage
 
-        try:
-            cleaned, usage = postprocess_explanation(q["explanation"])
-            q_copy["explanation"] = cleaned
 
-            total_usage.input_tokens += usage.input_tokens
-            total_usage.output_tokens += usage.output_tokens
-            total_usage.input_cost += usage.input_cost
-            total_usage.output_cost += usage.output_cost
-            total_usage.total_cost += usage.total_cost
+class StreamingPostprocessor:
+    """문제 생성 스트리밍 중 도착한 문제의 해설을 백그라운드 스레드에서 미리 후처리
 
-        except Exception as e:
-            # 후처리 실패 시 원본 유지
-            print(f"[경고] 해설 후처리 실패: {e}")
+    generate_questions(on_question=submit)으로 연결하면 생성과 후처리가 겹쳐서 진행됩니다.
+    - single 모드: LLM 교정이 필요한 해설마다 바로 호출
+    - batch 모드: LLM 교정이 필요한 해설을 모아 POSTPROCESS_STREAM_BATCH_SIZE개마다 일괄 호출
+    - async 모드: 미리 처리하지 않고 collect에서 postprocess_questions로 처리
+    """
 
-        processed.append(q_copy)
+    def __init__(self, max_workers: Optional[int] = None, batch_size: Optional[int] = None):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or config.POSTPROCESS_MAX_WORKERS)
+        self._mode = config.POSTPROCESS_MODE.lower()
+        self._batch_size = max(1, batch_size or config.POSTPROCESS_STREAM_BATCH_SIZE)
+        # 질문 텍스트 → {"explanation": 규칙 기반 정리 결과} (LLM 교정 결과로 덮어씀)
+        self._entries: dict[str, dict] = {}
+        self._pending: list[dict] = []  # batch 모드에서 아직 보내지 않은 LLM 교정 대상
+        self._jobs: list[Future] = []
+        self._escalated = 0
+
+    def submit(self, question) -> None:
+        """GeneratedQuestion의 해설 후처리 예약 (질문 텍스트 기준)"""
+        if self._mode not in ("single", "batch") or question.question in self._entries:
+            return
+
+        result = _apply_rules([question.explanation])[0]
+        entry = {"explanation": result.text}
+        self._entries[question.question] = entry
+        if not result.needs_llm:
+            return
+
+        self._escalated += 1
+        if self._mode == "single":
+            self._jobs.append(self._executor.submit(_postprocess_with_llm, [entry], "single"))
+            return
+
+        self._pending.append(entry)
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        """모아 둔 LLM 교정 대상을 한 번의 일괄 호출로 예약"""
+        if self._pending:
+            self._jobs.append(self._executor.submit(_postprocess_with_llm, self._pending, "batch"))
+            self._pending = []
+
+    def close(self) -> None:
+        """아직 시작하지 않은 후처리 취소 후 스레드 풀 종료"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def collect(self, questions: list[dict]) -> tuple[list[dict], TokenUsage]:
+        """예약된 후처리 결과를 모아 문제 리스트에 반영 (예약되지 않은 문제는 postprocess_questions로 처리)
+
+        LLM 교정이 실패한 해설은 규칙 기반 정리 결과를 유지합니다.
+
+        Returns:
+            (후처리된 문제 리스트, 총 토큰 사용량)
+        """
+        total_usage = TokenUsage()
+        processed: list[Optional[dict]] = [None] * len(questions)
+        pending_indices = []
 
-    return processed, total_usage
+        try:
+            self._flush()
+            for job in self._jobs:
+                try:
+                    total_usage += job.result()
+                except Exception as e:
+                    print(f"[경고] 해설 후처리 실패: {e}")
+
+            for i, q in enumerate(questions):
+                entry = self._entries.get(q["question"])
+                if entry is None:
+                    pending_indices.append(i)
+                    continue
+                q_copy = q.copy()
+                q_copy["explanation"] = entry["explanation"]
+                processed[i] = q_copy
+        finally:
+            self.close()
+
+        if self._entries:
+            _record(
+                explanations=len(self._entries),
+                llm_calls_avoided=(
+                    _required_llm_calls(len(self._entries), "single") - self._escalated
+                    if self._mode == "single"
+                    else math.ceil(len(self._entries) / self._batch_size) - len(self._jobs)
+                ),
+            )
+
+        if pending_indices:
+            pending, usage = postprocess_questions([questions[i] for i in pending_indices])
+            total_usage += usage
+            for i, q_copy in zip(pending_indices, pending):
+                processed[i] = q_copy
+
+        return processed, total_usage
@@ -0,0 +1,61 @@
+"""HyDE 사전 계산 배치 - 활성 leaf 카테고리의 HyDE 쿼리와 임베딩을 캐시에 미리 채움
+
+파이프라인 라운드가 HyDE 생성/임베딩 호출을 기다리지 않고 바로 검색을 시작할 수 있도록 합니다.
+
+실행: python precompute_hyde.py [--refresh]
+"""
+
+import argparse
+from typing import Optional
+
+from category_loader import CategoryInfo, get_active_leaf_categories
+from hyde_generator import generate_hyde_query, invalidate_hyde_cache
+from retriever import warm_up_query_embeddings
+from token_calculator import TokenUsage
+
+
+def precompute_hyde_queries(
+    categories: Optional[list[CategoryInfo]] = None,
+    refresh: bool = False,
+) -> tuple[int, TokenUsage]:
+    """카테고리별 HyDE 쿼리 생성 후 임베딩 캐시 warm-up
+
+    Args:
+        categories: 대상 카테고리 (기본값: 모든 활성 leaf 카테고리)
+        refresh: 기존 캐시를 무효화하고 다시 생성할지 여부
+
+    Returns:
+        (새로 임베딩한 쿼리 수, HyDE 생성 토큰 사용량)
+    """
+    if categories is None:
+        categories = get_active_leaf_categories()
+
+    total_usage = TokenUsage()
+    hyde_queries = []
+
+    for i, category in enumerate(categories):
+        if refresh:
+            invalidate_hyde_cache(category.id)
+        try:
+            hyde_query, usage = generate_hyde_query(category, use_cache=True)
+            hyde_queries.append(hyde_query)
+
+            total_usage.input_tokens += usage.input_tokens
+            total_usage.output_tokens += usage.output_tokens
+            total_usage.input_cost += usage.input_cost
+            total_usage.output_cost += usage.output_cost
+            total_usage.total_cost += usage.total_cost
+        except Exception as e:
+            print(f"[경고] HyDE 생성 실패 ({i + 1}/{len(categories)}) {category.name}: {e}")
+
+    embedded_count = warm_up_query_embeddings(hyde_queries)
+    return embedded_count, total_usage
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HyDE 쿼리/임베딩 사전 계산")
+    parser.add_argument("--refresh", action="store_true", help="기존 HyDE 캐시를 무시하고 다시 생성")
+    args = parser.parse_args()
+
+    embedded, usage = precompute_hyde_queries(refresh=args.refresh)
+    print(f"HyDE 사전 계산 완료: 신규 임베딩 {embedded}개, 생성 비용 {usage.total_cost:.2f}원")
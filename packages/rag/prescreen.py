@@ -0,0 +1,186 @@
+"""평가 사전 선별 모듈 - RAGAS(LLM) 평가 전에 해설과 인용 청크의 어휘 겹침으로 가망 없는 문제 선별
+
+Faithfulness가 낮은 문제는 대부분 해설의 핵심 용어가 인용 청크에 거의 등장하지 않습니다.
+해설은 한국어, 코퍼스는 영어이므로 한글 특징은 청크와 겹칠 수 없어 영문/기술 용어(TCP, SYN-ACK 등)만
+특징으로 사용하고, 그중 인용 청크에도 등장하는 비율(containment)을 계산합니다.
+여러 문제의 점수는 (문제 × 용어) / (청크 × 용어) 등장 행렬로 한 번에 계산합니다.
+
+PRESCREEN_MODE:
+- off: 사용하지 않음
+- shadow: 점수만 계산하고 모든 문제를 RAGAS로 평가 (RAGAS 판정과의 일치율 기록, floor 보정용)
+- enforce: floor 미만 문제는 RAGAS 평가 없이 탈락
+  (PRESCREEN_FLOOR가 0이면 보정되지 않은 것으로 보고 shadow로 실행.
+   shadow 로그의 점수 분포와 합격 최저 점수를 보고 floor를 정한 뒤 사용)
+"""
+
+import json
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from config import config
+from chunk_store import get_chunk_store
+
+
+PRESCREEN_MODES = ("off", "shadow", "enforce")
+
+_LATIN_TERM_PATTERN = re.compile(r"[a-z][a-z0-9+#.\-]*[a-z0-9+#]")
+
+
+def extract_features(text: str) -> set[str]:
+    """containment 계산용 특징 집합 (영문/기술 용어, 소문자)"""
+    return set(_LATIN_TERM_PATTERN.findall(text.lower()))
+
+
+def containment_scores(explanations: list[str], contexts: list[list[str]]) -> list[float]:
+    """문제별 해설 특징 중 인용 청크에도 등장하는 비율 (해설에 특징이 없으면 1.0)
+
+    같은 본문의 청크는 특징을 한 번만 추출하고, 문제-청크 인용 행렬과 청크-용어 등장 행렬의 곱으로
+    문제별 인용 청크 용어 집합을 한 번에 구합니다.
+
+    Args:
+        explanations: 해설 리스트
+        contexts: 해설별 인용 청크 본문 리스트
+
+    Returns:
+        해설 순서와 같은 containment 점수 리스트
+    """
+    explanation_features = [extract_features(explanation) for explanation in explanations]
+    vocabulary = {term: i for i, term in enumerate(sorted(set().union(*explanation_features)))}
+    if not vocabulary:
+        return [1.0] * len(explanations)
+
+    chunk_index: dict[str, int] = {}
+    for texts in contexts:
+        for text in texts:
+            chunk_index.setdefault(text, len(chunk_index))
+
+    # 해설 용어 등장 (문제 × 용어)
+    explanation_terms = np.zeros((len(explanations), len(vocabulary)), dtype=bool)
+    for row, features in enumerate(explanation_features):
+        explanation_terms[row, [vocabulary[term] for term in features]] = True
+
+    # 청크 용어 등장 (청크 × 용어, 해설 어휘에 있는 용어만)
+    chunk_terms = np.zeros((len(chunk_index), len(vocabulary)), dtype=np.int32)
+    for text, row in chunk_index.items():
+        columns = [vocabulary[term] for term in extract_features(text) if term in vocabulary]
+        chunk_terms[row, columns] = 1
+
+    # 문제별 인용 청크 (문제 × 청크)
+    citations = np.zeros((len(explanations), len(chunk_index)), dtype=np.int32)
+    for row, texts in enumerate(contexts):
+        citations[row, [chunk_index[text] for text in texts]] = 1
+
+    context_terms = (citations @ chunk_terms) > 0
+    totals = explanation_terms.sum(axis=1)
+    overlaps = (explanation_terms & context_terms).sum(axis=1)
+    return np.where(totals > 0, overlaps / np.maximum(totals, 1), 1.0).tolist()
+
+
+def containment_score(explanation: str, contexts: list[str]) -> float:
+    """해설 하나의 containment 점수 (containment_scores 참고)"""
+    return containment_scores([explanation], [contexts])[0]
+
+
+def prescreen_scores(questions: list[dict]) -> list[float]:
+    """문제별 containment 점수 (청크 본문은 청크 저장소에서 한 번에 조회)"""
+    contents = get_chunk_store().fetch(
+        chunk_id for q in questions for chunk_id in q.get("chunk_ids", [])
+    )
+    return containment_scores(
+        [q.get("explanation", "") for q in questions],
+        [
+            [contents[chunk_id] for chunk_id in q.get("chunk_ids", []) if chunk_id in contents]
+            for q in questions
+        ],
+    )
+
+
+@dataclass
+class PrescreenReport:
+    """사전 선별 판정과 RAGAS 판정의 일치 통계"""
+    agreed_pass: int = 0  # 사전 통과, RAGAS 합격
+    false_pass: int = 0  # 사전 통과, RAGAS 탈락
+    false_reject: int = 0  # 사전 탈락, RAGAS 합격 (shadow 모드에서만 집계)
+    agreed_reject: int = 0  # 사전 탈락, RAGAS 탈락 (shadow 모드에서만 집계)
+    enforced_rejects: int = 0  # enforce 모드에서 LLM 평가 없이 탈락시킨 수
+    min_passed_score: Optional[float] = None  # RAGAS 합격 문제의 최저 점수 (floor 상한 참고값)
+
+    @property
+    def compared(self) -> int:
+        return self.agreed_pass + self.false_pass + self.false_reject + self.agreed_reject
+
+    @property
+    def agreement(self) -> float:
+        return (self.agreed_pass + self.agreed_reject) / self.compared if self.compared else 0.0
+
+    def summary(self) -> str:
+        min_score = f"{self.min_passed_score:.3f}" if self.min_passed_score is not None else "-"
+        return (
+            f"비교 {self.compared}개 (일치율 {self.agreement:.1%}) | "
+            f"통과/합격 {self.agreed_pass}, 통과/탈락 {self.false_pass}, "
+            f"탈락/합격 {self.false_reject}, 탈락/탈락 {self.agreed_reject} | "
+            f"LLM 평가 생략 {self.enforced_rejects}개, 합격 최저 점수 {min_score}"
+        )
+
+
+_report = PrescreenReport()
+_report_lock = threading.Lock()
+
+
+def get_prescreen_report() -> PrescreenReport:
+    """프로세스 누적 사전 선별 리포트"""
+    return _report
+
+
+def record_enforced_rejects(count: int) -> None:
+    """enforce 모드에서 LLM 평가 없이 탈락시킨 문제 수 기록"""
+    with _report_lock:
+        _report.enforced_rejects += count
+
+
+def record_verdicts(questions: list[dict], scores: list[float], ragas_passed: list[bool]) -> None:
+    """RAGAS로 평가한 문제들의 사전 선별 판정과 RAGAS 판정 비교 후 JSONL 기록"""
+    floor = config.PRESCREEN_FLOOR
+    with _report_lock:
+        for score, passed in zip(scores, ragas_passed):
+            prescreen_passed = score >= floor
+            if prescreen_passed and passed:
+                _report.agreed_pass += 1
+            elif prescreen_passed:
+                _report.false_pass += 1
+            elif passed:
+                _report.false_reject += 1
+            else:
+                _report.agreed_reject += 1
+
+            if passed and (_report.min_passed_score is None or score < _report.min_passed_score):
+                _report.min_passed_score = score
+
+    record = {
+        "timestamp": datetime.now().isoformat(),
+        "mode": config.PRESCREEN_MODE,
+        "floor": floor,
+        "questions": [
+            {
+                "question": q["question"],
+                "chunk_ids": q.get("chunk_ids", []),
+                "score": round(score, 4),
+                "ragas_passed": passed,
+                "scores": q.get("scores", {}),
+            }
+            for q, score, passed in zip(questions, scores, ragas_passed)
+        ],
+    }
+    try:
+        log_path = Path(config.PRESCREEN_LOG_PATH)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"[경고] 사전 선별 로그 기록 실패: {e}")
@@ -4,7 +4,12 @@ from .multiple_choice import MULTIPLE_CHOICE_PROMPT
 from .short_answer import SHORT_ANSWER_PROMPT
 from .essay import ESSAY_PROMPT
 from .system import SYSTEM_PROMPT
-from .generation import GENERATION_PROMPT, build_generation_prompt
+from .generation import (
+    GENERATION_PROMPT,
+    PACKED_GENERATION_PROMPT,
+    build_generation_prompt,
+    build_packed_generation_prompt,
+)
 
 __all__ = [
     "SYSTEM_PROMPT",
@@ -12,5 +17,7 @@ __all__ = [
     "SHORT_ANSWER_PROMPT",
     "ESSAY_PROMPT",
     "GENERATION_PROMPT",
+    "PACKED_GENERATION_PROMPT",
     "build_generation_prompt",
+    "build_packed_generation_prompt",
 ]
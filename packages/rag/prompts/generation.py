@@ -3,40 +3,8 @@ from .multiple_choice import MULTIPLE_CHOICE_PROMPT
 from .short_answer import SHORT_ANSWER_PROMPT
 from .essay import ESSAY_PROMPT
 
-GENERATION_PROMPT = """
-## 타겟 대상 (최우선 확인사항)
-
-**취준생/신입 개발자**를 위한 면접 대비 문제입니다.
-- 모든 문제는 취준생/신입이 **면접에서 실제로 받을 수 있는 수준**이어야 합니다.
-- 현업 시니어만 아는 심화 지식, 지엽적인 세부사항은 **절대 출제 금지**입니다.
-
----
-
-## 문제 생성 요청
-
-### 카테고리 정보
-- **카테고리명**: {category_name}
-- **카테고리 경로**: {category_path}
-
-### 사용 가능한 청크 ID 목록
-
-{chunk_id_list}
-
-### 제공된 청크
-
-{chunks}
-
----
-
-## 생성 요구사항
-
-### 1. 문제 수량 (필수: 정확히 {target_count}개)
-- **반드시 {target_count}개의 문제를 생성하세요.**
-- **수량 확보 전략**:
-  1. **유형 변형**: 하나의 개념을 객관식, 단답형, 서술형으로 각각 출제
-  2. **관점 다각화**: 정의, 특징, 장단점, 사용 사례 등 다양한 각도에서 질문
-
-### 2. 언어 규칙 (필수: 한국어)
+# 카테고리 수와 무관한 공통 출제 규칙 (단일/다중 카테고리 프롬프트 공용)
+GENERATION_RULES = """### 2. 언어 규칙 (필수: 한국어)
 - **모든 텍스트(질문, 정답, 해설, 선택지)는 한국어로 작성하세요.**
 - IT 기술 용어(예: process, thread, API)는 영어 그대로 사용 가능합니다.
 
@@ -121,6 +89,41 @@ GENERATION_PROMPT = """
 **최종 확인**: 모든 문제가 '취준생/신입 개발자'가 면접에서 실제로 받을 수 있는 수준인지 점검하세요.
 """
 
+GENERATION_PROMPT = """
+## 타겟 대상 (최우선 확인사항)
+
+**취준생/신입 개발자**를 위한 면접 대비 문제입니다.
+- 모든 문제는 취준생/신입이 **면접에서 실제로 받을 수 있는 수준**이어야 합니다.
+- 현업 시니어만 아는 심화 지식, 지엽적인 세부사항은 **절대 출제 금지**입니다.
+
+---
+
+## 문제 생성 요청
+
+### 카테고리 정보
+- **카테고리명**: {category_name}
+- **카테고리 경로**: {category_path}
+
+### 사용 가능한 청크 ID 목록
+
+{chunk_id_list}
+
+### 제공된 청크
+
+{chunks}
+
+---
+
+## 생성 요구사항
+
+### 1. 문제 수량 (필수: 정확히 {target_count}개)
+- **반드시 {target_count}개의 문제를 생성하세요.**
+- **수량 확보 전략**:
+  1. **유형 변형**: 하나의 개념을 객관식, 단답형, 서술형으로 각각 출제
+  2. **관점 다각화**: 정의, 특징, 장단점, 사용 사례 등 다양한 각도에서 질문
+
+""" + GENERATION_RULES
+
 def build_generation_prompt(
     category_name: str,
     category_path: str,
@@ -156,4 +159,78 @@ def build_generation_prompt(
         multiple_choice_rules=MULTIPLE_CHOICE_PROMPT,
         short_answer_rules=SHORT_ANSWER_PROMPT,
         essay_rules=ESSAY_PROMPT,
-    )
\ No newline at end of file
+    )
+
+PACKED_GENERATION_PROMPT = """
+## 타겟 대상 (최우선 확인사항)
+
+**취준생/신입 개발자**를 위한 면접 대비 문제입니다.
+- 모든 문제는 취준생/신입이 **면접에서 실제로 받을 수 있는 수준**이어야 합니다.
+- 현업 시니어만 아는 심화 지식, 지엽적인 세부사항은 **절대 출제 금지**입니다.
+
+---
+
+## 문제 생성 요청 (여러 카테고리 일괄)
+
+아래 {category_count}개 카테고리 각각에 대해 문제를 생성하세요.
+- 각 카테고리의 문제는 **해당 카테고리에 제공된 청크만** 근거로 출제하세요.
+- 결과는 카테고리 ID를 키로 구분하여 출력하세요.
+
+{category_blocks}
+
+---
+
+## 생성 요구사항
+
+### 1. 문제 수량 (필수: 카테고리별 목표 문제 수)
+- **각 카테고리마다 명시된 목표 문제 수만큼 생성하세요.**
+- **수량 확보 전략**:
+  1. **유형 변형**: 하나의 개념을 객관식, 단답형, 서술형으로 각각 출제
+  2. **관점 다각화**: 정의, 특징, 장단점, 사용 사례 등 다양한 각도에서 질문
+
+""" + GENERATION_RULES
+
+PACKED_CATEGORY_BLOCK = """### 카테고리 ID: {category_id}
+- **카테고리명**: {category_name}
+- **카테고리 경로**: {category_path}
+- **목표 문제 수**: {target_count}개
+- **사용 가능한 청크 ID 목록**: {chunk_id_list}
+
+{chunks}"""
+
+
+def build_packed_generation_prompt(
+    categories: list[dict],
+) -> str:
+    """여러 카테고리를 한 번에 요청하는 문제 생성 프롬프트 빌드
+
+    Args:
+        categories: 카테고리별 딕셔너리 리스트
+            [{"category_id": int, "category_name": str, "category_path": str,
+              "chunks": [(chunk_id, content), ...], "target_count": int}, ...]
+
+    Returns:
+        완성된 프롬프트 문자열
+    """
+    category_blocks = "\n\n---\n\n".join(
+        PACKED_CATEGORY_BLOCK.format(
+            category_id=category["category_id"],
+            category_name=category["category_name"],
+            category_path=category["category_path"],
+            target_count=category["target_count"],
+            chunk_id_list=", ".join(str(chunk_id) for chunk_id, _ in category["chunks"]),
+            chunks="\n\n".join(
+                f"[청크 ID: {chunk_id}]\n{content}" for chunk_id, content in category["chunks"]
+            ),
+        )
+        for category in categories
+    )
+
+    return PACKED_GENERATION_PROMPT.format(
+        category_count=len(categories),
+        category_blocks=category_blocks,
+        chunk_id_list="각 카테고리에 배정된 ID만 사용, 다른 카테고리의 ID는 사용 금지",
+        multiple_choice_rules=MULTIPLE_CHOICE_PROMPT,
+        short_answer_rules=SHORT_ANSWER_PROMPT,
+        essay_rules=ESSAY_PROMPT,
+    )
@@ -1,17 +1,89 @@
 """문제 생성 모듈 - HyperCLOVA X Structured Output 활용"""
 
+import hashlib
 import json
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional
 
 from config import config
+from clients import get_http_session
+from json_stream import JsonArrayStreamParser
+from structured_output import (
+    compile_schema,
+    loads_lenient,
+    parse_structured_response,
+    repair_question_item,
+)
+from rate_limiter import get_clova_rate_limiter
 from schemas import (
     GeneratedQuestion,
     QuestionType,
     Difficulty,
     QuestionGenerationContext,
 )
-from prompts import SYSTEM_PROMPT, build_generation_prompt
-from token_calculator import calculate_cost, TokenUsage
+from prompts import SYSTEM_PROMPT, build_generation_prompt, build_packed_generation_prompt
+from context_packer import PackedContext, pack_chunks
+from token_calculator import calculate_cost, estimate_tokens, TokenUsage
+
+
+def get_question_array_schema(target_count: int = 10) -> dict:
+    """문제 수에 맞는 문제 배열 JSON 스키마"""
+    return {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "question_type": {
+                    "type": "string",
+                    "enum": ["multiple_choice", "short_answer", "essay"],
+                    "description": "문제 유형",
+                },
+                "difficulty": {
+                    "type": "integer",
+                    "enum": [1, 2, 3, 4, 5],
+                    "description": "난이도 (1=매우쉬움, 2=쉬움, 3=보통, 4=어려움, 5=매우어려움)",
+                },
+                "question": {
+                    "type": "string",
+                    "description": "질문 텍스트",
+                },
+                "answer": {
+                    "type": "string",
+                    "description": "정답 (단답형/서술형) 또는 객관식 정답 텍스트",
+                },
+                "explanation": {
+                    "type": "string",
+                    "description": "해설 (2-4문장으로 답변의 이유와 개념을 설명. 절대로 '청크', '문서', '출처' 등의 단어 사용 금지)",
+                },
+                "options": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "객관식 선택지 (4개, 객관식만 해당)",
+                },
+                "correct_index": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 3,
+                    "description": "정답 인덱스 (반드시 0-3 사이의 '정수' 하나여야 하며, [0]과 같은 배열/리스트 형태는 절대 금지)",
+                },
+                "chunk_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "참조한 청크 ID 목록",
+                },
+            },
+            "required": [
+                "question_type",
+                "difficulty",
+                "question",
+                "answer",
+                "explanation",
+                "chunk_ids",
+            ],
+        },
+        "minItems": max(3, target_count - 2),
+        "maxItems": target_count + 2,
+    }
 
 
 def get_question_schema(target_count: int = 10) -> dict:
@@ -19,86 +91,115 @@ def get_question_schema(target_count: int = 10) -> dict:
     return {
         "type": "object",
         "properties": {
-            "questions": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "question_type": {
-                            "type": "string",
-                            "enum": ["multiple_choice", "short_answer", "essay"],
-                            "description": "문제 유형",
-                        },
-                        "difficulty": {
-                            "type": "integer",
-                            "enum": [1, 2, 3, 4, 5],
-                            "description": "난이도 (1=매우쉬움, 2=쉬움, 3=보통, 4=어려움, 5=매우어려움)",
-                        },
-                        "question": {
-                            "type": "string",
-                            "description": "질문 텍스트",
-                        },
-                        "answer": {
-                            "type": "string",
-                            "description": "정답 (단답형/서술형) 또는 객관식 정답 텍스트",
-                        },
-                        "explanation": {
-                            "type": "string",
-                            "description": "해설 (2-4문장으로 답변의 이유와 개념을 설명. 절대로 '청크', '문서', '출처' 등의 단어 사용 금지)",
-                        },
-                        "options": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "객관식 선택지 (4개, 객관식만 해당)",
-                        },
-                        "correct_index": {
-                            "type": "integer",
-                            "minimum": 0,
-                            "maximum": 3,
-                            "description": "정답 인덱스 (반드시 0-3 사이의 '정수' 하나여야 하며, [0]과 같은 배열/리스트 형태는 절대 금지)",
-                        },
-                        "chunk_ids": {
-                            "type": "array",
-                            "items": {"type": "integer"},
-                            "description": "참조한 청크 ID 목록",
-                        },
-                    },
-                    "required": [
-                        "question_type",
-                        "difficulty",
-                        "question",
-                        "answer",
-                        "explanation",
-                        "chunk_ids",
-                    ],
-                },
-                "minItems": max(3, target_count - 2),
-                "maxItems": target_count + 2,
-            }
+            "questions": get_question_array_schema(target_count),
         },
         "required": ["questions"],
     }
 
 
+def get_packed_question_schema(targets: dict[int, int]) -> dict:
+    """여러 카테고리 일괄 생성용 JSON 스키마 (카테고리 ID → 문제 배열)
+
+    Args:
+        targets: {카테고리 ID: 목표 문제 수}
+    """
+    return {
+        "type": "object",
+        "properties": {
+            str(category_id): get_question_array_schema(target_count)
+            for category_id, target_count in targets.items()
+        },
+        "required": [str(category_id) for category_id in targets],
+    }
+
+
+def _read_sse_response(
+    response,
+    on_item: Optional[Callable[[dict], None]] = None,
+    item_key: str = "questions",
+) -> tuple[str, dict]:
+    """chat-completions SSE 스트림을 읽어 최종 content와 usage 반환
+
+    token 이벤트의 content를 이어붙이면서 item_key 배열의 객체가 완성될 때마다
+    on_item을 호출합니다. (thinking 내용은 content에 포함되지 않음)
+
+    Returns:
+        (전체 content, usage 딕셔너리)
+    """
+    response.encoding = "utf-8"
+    parser = JsonArrayStreamParser(item_key, loads=loads_lenient)
+    parts = []
+    result_content = None
+    usage_info = {}
+    event = ""
+
+    for line in response.iter_lines(decode_unicode=True):
+        if not line:
+            continue
+        if line.startswith("event:"):
+            event = line[len("event:"):].strip()
+            continue
+        if not line.startswith("data:"):
+            continue
+
+        data = line[len("data:"):].strip()
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError:
+            payload = None
+        if not isinstance(payload, dict):
+            # "[DONE]" 같은 종료 표시나 keep-alive 등 JSON 객체가 아닌 data 줄
+            if event == "error":
+                raise RuntimeError(f"스트리밍 응답 오류: {data}")
+            continue
+
+        if event == "token":
+            token = payload.get("message", {}).get("content", "")
+            if token:
+                parts.append(token)
+                for item in parser.feed(token):
+                    if on_item:
+                        on_item(item)
+        elif event == "result":
+            result_content = payload.get("message", {}).get("content")
+            usage_info = payload.get("usage", {})
+        elif event == "error":
+            raise RuntimeError(f"스트리밍 응답 오류: {payload}")
+
+    # result 이벤트의 전체 content를 우선 사용 (없으면 token 이벤트 누적분)
+    content = result_content if result_content is not None else "".join(parts)
+    return content, usage_info
+
+
 def call_clova_structured(
     system_prompt: str,
     user_prompt: str,
     schema: dict,
     temperature: float = 0.5,
     max_tokens: int = 8192,
+    stream: Optional[bool] = None,
+    on_item: Optional[Callable[[dict], None]] = None,
+    item_keys: tuple[str, ...] = ("questions",),
 ) -> tuple[dict, TokenUsage]:
     """HyperCLOVA X API 직접 호출 (Reasoning + JSON Prompt)
 
+    stream이 True이면 SSE로 응답을 받으며, questions 배열의 각 객체가 완성되는 즉시
+    on_item으로 전달합니다. 반환값은 스트리밍 여부와 관계없이 전체 응답 파싱 결과입니다.
+
     Args:
         system_prompt: 시스템 프롬프트
         user_prompt: 유저 프롬프트
         schema: JSON 스키마
         temperature: 온도 (기본값 0.5)
         max_tokens: 최대 토큰 수
+        stream: 스트리밍 사용 여부 (기본값 config.GENERATION_STREAMING)
+        on_item: 스트리밍 중 완성된 questions 원소를 받을 콜백
+        item_keys: 응답이 깨졌을 때 복구할 배열 키 목록
 
     Returns:
         (파싱된 JSON 응답, 토큰 사용량)
     """
+    stream = config.GENERATION_STREAMING if stream is None else stream
     url = f"https://clovastudio.stream.ntruss.com/v3/chat-completions/{config.LLM_MODEL}"
     headers = {
         "Authorization": f"Bearer {config.CLOVASTUDIO_API_KEY}",
@@ -136,25 +237,36 @@ Do not include any other text, explanations, or thinking process in the final ou
         # responseFormat 제거됨 (Reasoning 모델 사용 시 프롬프트 지시로 대체)
     }
 
-    # API 호출
-    response = requests.post(url, headers=headers, json=data, timeout=120)
-    response.raise_for_status()
+    # QPM/TPM 한도 확인 (입력 추정치 + 최대 출력 토큰을 예약 후 실제 사용량으로 정산)
+    limiter = get_clova_rate_limiter()
+    reserved_tokens = estimate_tokens(system_prompt) + estimate_tokens(final_user_prompt) + max_tokens
+    limiter.acquire(reserved_tokens)
+    usage_info = {}
 
-    result = response.json()
-    message = result["result"]["message"]
-    content = message["content"]
-    usage_info = result["result"].get("usage", {})
+    # API 호출
+    try:
+        if stream:
+            headers["Accept"] = "text/event-stream"
+            with get_http_session().post(url, headers=headers, json=data, timeout=120, stream=True) as response:
+                response.raise_for_status()
+                content, usage_info = _read_sse_response(response, on_item)
+        else:
+            response = get_http_session().post(url, headers=headers, json=data, timeout=120)
+            response.raise_for_status()
 
-    # Markdown Code Block 제거 (```json ... ```)
-    if "```" in content:
-        content = content.replace("```json", "").replace("```", "").strip()
+            result = response.json()
+            message = result["result"]["message"]
+            content = message["content"]
+            usage_info = result["result"].get("usage", {})
+    finally:
+        limiter.settle(reserved_tokens, usage_info.get("totalTokens", reserved_tokens))
 
-    # JSON 파싱 시도
+    # JSON 파싱 (잘리거나 깨진 응답이면 완성된 항목만 복구)
     try:
-        parsed_content = json.loads(content)
-    except json.JSONDecodeError as e:
-        print(f"[오류] JSON 파싱 실패. 원본 응답:\n{content}")
-        raise e
+        parsed_content = parse_structured_response(content, item_keys)
+    except ValueError as e:
+        print(f"[오류] {e}")
+        raise
 
     # 토큰 사용량 정보 (response usage 활용)
     input_tokens = usage_info.get("promptTokens", 0)
@@ -167,110 +279,316 @@ Do not include any other text, explanations, or thinking process in the final ou
     return parsed_content, usage
 
 
+# 문제 항목 스키마 검증 함수 (모듈 로드 시 한 번 컴파일)
+validate_question_item = compile_schema(get_question_schema()["properties"]["questions"]["items"])
+
+
+def _build_question(
+    q_data: dict,
+    context: QuestionGenerationContext,
+    valid_chunk_ids: set[int],
+) -> Optional[GeneratedQuestion]:
+    """응답의 문제 객체를 보정/검증하여 GeneratedQuestion으로 변환 (유효하지 않으면 None)"""
+    # 흔한 결함 보정 후 스키마 검증 (correct_index: [0], difficulty: "3" 등)
+    if not isinstance(q_data, dict):
+        print(f"[경고] 문제 형식 오류, 스킵: {str(q_data)[:50]}")
+        return None
+    q_data = repair_question_item(q_data)
+    errors = validate_question_item(q_data, "question")
+    if errors:
+        print(f"[경고] 스키마 검증 실패, 스킵: {'; '.join(errors[:3])}")
+        return None
+
+    # 청크 ID 검증: 유효한 ID만 필터링
+    raw_chunk_ids = q_data.get("chunk_ids", [])
+    filtered_chunk_ids = [cid for cid in raw_chunk_ids if cid in valid_chunk_ids]
+
+    # 청크 ID가 없거나 모두 유효하지 않으면 스킵
+    if not filtered_chunk_ids:
+        print(f"[경고] 유효하지 않은 청크 ID로 생성된 문제 스킵: {q_data.get('question', '')[:50]}...")
+        return None
+
+    try:
+        question = GeneratedQuestion(
+            question_type=QuestionType(q_data["question_type"]),
+            difficulty=Difficulty(q_data["difficulty"]),
+            question=q_data["question"],
+            answer=q_data["answer"],
+            explanation=q_data.get("explanation", ""),
+            options=q_data.get("options", []),
+            correct_index=q_data.get("correct_index", 0),
+            category_id=context.category_id,
+            category_name=context.category_name,
+            chunk_ids=filtered_chunk_ids,
+        )
+    except (ValueError, KeyError) as e:
+        print(f"[경고] 문제 파싱 실패, 스킵: {e}")
+        return None
+
+    # 유효성 검증
+    is_valid, msg = question.validate()
+    if not is_valid:
+        print(f"[경고] 문제 검증 실패: {msg}")
+        return None
+
+    return question
+
+
+def _question_key(q_data) -> str:
+    """스트리밍 항목과 전체 응답 항목을 대응시키는 키 (공백/대소문자 정규화한 문제 텍스트 해시)"""
+    if isinstance(q_data, dict) and isinstance(q_data.get("question"), str):
+        text = " ".join(q_data["question"].split()).lower()
+    else:
+        text = json.dumps(q_data, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _pack_context(context: QuestionGenerationContext) -> PackedContext:
+    """청크 데이터 준비 (ID, 내용 튜플) - 중복 헤더/겹침 제거 후 토큰 예산 적용"""
+    packed = pack_chunks(
+        list(zip(context.chunk_ids, context.chunks)),
+        token_budget=config.GENERATION_CONTEXT_TOKEN_BUDGET,
+    )
+    if packed.dropped_ids:
+        print(f"[경고] 토큰 예산 초과로 청크 {len(packed.dropped_ids)}개 제외: {packed.dropped_ids}")
+    return packed
+
+
 def generate_questions(
     context: QuestionGenerationContext,
+    on_question: Optional[Callable[[GeneratedQuestion], None]] = None,
 ) -> tuple[list[GeneratedQuestion], TokenUsage]:
     """문제 생성
 
+    스트리밍 모드(config.GENERATION_STREAMING)에서는 모델이 나머지 문제를 생성하는 동안
+    완성된 문제부터 검증하여 on_question으로 넘기므로 후처리 등 다음 단계를 먼저 시작할 수 있습니다.
+
     Args:
         context: 문제 생성 컨텍스트 (카테고리 정보 + 청크)
+        on_question: 검증을 통과한 문제를 하나씩 받을 콜백
 
     Returns:
         (생성된 문제 리스트, 토큰 사용량)
     """
-    # 청크 데이터 준비 (ID, 내용 튜플)
-    chunks_with_ids = list(zip(context.chunk_ids, context.chunks))
-    valid_chunk_ids = set(context.chunk_ids)
+    packed = _pack_context(context)
+    # 프롬프트에 실제로 포함된 청크 ID만 유효
+    valid_chunk_ids = set(packed.chunk_ids)
     target_count = context.target_question_count
 
     # 프롬프트 빌드
     user_prompt = build_generation_prompt(
         category_name=context.category_name,
         category_path=context.category_path,
-        chunks=chunks_with_ids,
+        chunks=packed.chunks,
         target_count=target_count,
     )
 
     # 동적 스키마 생성
     schema = get_question_schema(target_count)
 
+    questions = []
+    handled_keys: set[str] = set()
+
+    def handle_item(q_data: dict) -> None:
+        key = _question_key(q_data)
+        if key in handled_keys:
+            return
+        question = _build_question(q_data, context, valid_chunk_ids)
+        if question is not None:
+            # 검증을 통과한 문제만 처리 완료로 기록 (스트림에서 잘못 잘린 항목은 전체 응답에서 다시 시도)
+            handled_keys.add(key)
+            questions.append(question)
+            if on_question:
+                on_question(question)
+
     # HyperCLOVA X API 직접 호출
     response, usage = call_clova_structured(
         system_prompt=SYSTEM_PROMPT,
         user_prompt=user_prompt,
         schema=schema,
         temperature=config.TEMPERATURE,
+        on_item=handle_item,
     )
 
-    # 응답 파싱 및 변환
-    questions = []
+    # 전체 응답을 기준으로, 스트리밍 중 처리하지 못한 문제(비스트리밍 모드 포함)만 추가 처리
+    # (스트림 파서가 항목을 건너뛰거나 다르게 잘라도 위치가 아닌 문제 텍스트로 대응시킴, 중복 문제는 한 번만)
     for q_data in response.get("questions", []):
-        # 청크 ID 검증: 유효한 ID만 필터링
-        raw_chunk_ids = q_data.get("chunk_ids", [])
-        filtered_chunk_ids = [cid for cid in raw_chunk_ids if cid in valid_chunk_ids]
+        handle_item(q_data)
 
-        # 청크 ID가 없거나 모두 유효하지 않으면 스킵
-        if not filtered_chunk_ids:
-            print(f"[경고] 유효하지 않은 청크 ID로 생성된 문제 스킵: {q_data.get('question', '')[:50]}...")
-            continue
+    return questions, usage
 
-        try:
-            question = GeneratedQuestion(
-                question_type=QuestionType(q_data["question_type"]),
-                difficulty=Difficulty(q_data["difficulty"]),
-                question=q_data["question"],
-                answer=q_data["answer"],
-                explanation=q_data.get("explanation", ""),
-                options=q_data.get("options", []),
-                correct_index=q_data.get("correct_index", 0),
-                category_id=context.category_id,
-                category_name=context.category_name,
-                chunk_ids=filtered_chunk_ids,
+
+def _split_usage(
+    usage: TokenUsage,
+    input_weights: list[float],
+    output_weights: list[float],
+) -> list[TokenUsage]:
+    """한 번의 호출 사용량을 가중치 비율로 나눔 (입력/출력 각각, 가중치 합이 0이면 균등 분배)"""
+    def ratios(weights: list[float]) -> list[float]:
+        total = sum(weights)
+        return [w / total for w in weights] if total else [1 / len(weights)] * len(weights)
+
+    shares = []
+    for input_ratio, output_ratio in zip(ratios(input_weights), ratios(output_weights)):
+        input_cost = usage.input_cost * input_ratio
+        output_cost = usage.output_cost * output_ratio
+        shares.append(TokenUsage(
+            input_tokens=round(usage.input_tokens * input_ratio),
+            output_tokens=round(usage.output_tokens * output_ratio),
+            input_cost=input_cost,
+            output_cost=output_cost,
+            total_cost=input_cost + output_cost,
+        ))
+    return shares
+
+
+def generate_questions_packed(
+    contexts: list[QuestionGenerationContext],
+) -> dict[int, tuple[list[GeneratedQuestion], TokenUsage]]:
+    """여러 카테고리의 문제를 한 번의 요청으로 생성 (공통 프롬프트/스키마 비용 분산)
+
+    문제 수가 적은 카테고리는 SYSTEM_PROMPT, 출제 규칙, 스키마 같은 고정 입력이
+    토큰의 큰 비중을 차지하므로 묶어서 요청합니다. 응답은 카테고리 ID를 키로 나누고,
+    비용은 입력(카테고리별 청크 분량)과 출력(카테고리별 응답 분량) 비율로 배분합니다.
+
+    Args:
+        contexts: 문제 생성 컨텍스트 리스트
+
+    Returns:
+        {카테고리 ID: (생성된 문제 리스트, 배분된 토큰 사용량)}
+    """
+    packed_contexts = [_pack_context(context) for context in contexts]
+
+    user_prompt = build_packed_generation_prompt([
+        {
+            "category_id": context.category_id,
+            "category_name": context.category_name,
+            "category_path": context.category_path,
+            "chunks": packed.chunks,
+            "target_count": context.target_question_count,
+        }
+        for context, packed in zip(contexts, packed_contexts)
+    ])
+    schema = get_packed_question_schema({
+        context.category_id: context.target_question_count for context in contexts
+    })
+    keys = tuple(str(context.category_id) for context in contexts)
+
+    # 카테고리별 배열이 여러 개이므로 스트리밍 대신 전체 응답을 파싱
+    response, usage = call_clova_structured(
+        system_prompt=SYSTEM_PROMPT,
+        user_prompt=user_prompt,
+        schema=schema,
+        temperature=config.TEMPERATURE,
+        stream=False,
+        item_keys=keys,
+    )
+
+    questions_by_category = []
+    output_weights = []
+    for context, packed, key in zip(contexts, packed_contexts, keys):
+        items = response.get(key, [])
+        if not isinstance(items, list):
+            items = []
+        valid_chunk_ids = set(packed.chunk_ids)
+        questions = [
+            question for question in (
+                _build_question(q_data, context, valid_chunk_ids) for q_data in items
             )
-        except (ValueError, KeyError) as e:
-            print(f"[경고] 문제 파싱 실패, 스킵: {e}")
-            continue
+            if question is not None
+        ]
+        questions_by_category.append(questions)
+        output_weights.append(estimate_tokens(json.dumps(items, ensure_ascii=False)))
+
+    usages = _split_usage(
+        usage,
+        input_weights=[packed.packed_tokens for packed in packed_contexts],
+        output_weights=output_weights,
+    )
+    return {
+        context.category_id: (questions, category_usage)
+        for context, questions, category_usage in zip(contexts, questions_by_category, usages)
+    }
 
-        # 유효성 검증
-        is_valid, msg = question.validate()
-        if is_valid:
-            questions.append(question)
-        else:
-            print(f"[경고] 문제 검증 실패: {msg}")
 
-    return questions, usage
+def _group_contexts(contexts: list[QuestionGenerationContext]) -> list[list[QuestionGenerationContext]]:
+    """목표 문제 수가 적은 카테고리끼리 묶음 (나머지는 단독 요청)"""
+    if not config.PACKED_GENERATION_ENABLED:
+        return [[context] for context in contexts]
+
+    small = [c for c in contexts if c.target_question_count <= config.PACKED_GENERATION_MAX_TARGET]
+    large = [c for c in contexts if c.target_question_count > config.PACKED_GENERATION_MAX_TARGET]
+    size = max(1, config.PACKED_GENERATION_MAX_CATEGORIES)
+
+    groups = [[context] for context in large]
+    groups.extend(small[i:i + size] for i in range(0, len(small), size))
+    return groups
+
+
+def _generate_group(
+    group: list[QuestionGenerationContext],
+) -> dict[int, tuple[list[GeneratedQuestion], TokenUsage]]:
+    """컨텍스트 묶음 생성 (묶음 요청이 실패하면 카테고리별 단독 요청으로 재시도)"""
+    if len(group) > 1:
+        try:
+            return generate_questions_packed(group)
+        except Exception as e:
+            print(f"[경고] 일괄 생성 실패, 카테고리별로 재시도: {e}")
+
+    results = {}
+    for context in group:
+        try:
+            results[context.category_id] = generate_questions(context)
+        except Exception as e:
+            print(f"{context.category_name} → 실패: {e}")
+    return results
 
 
 def generate_questions_batch(
     contexts: list[QuestionGenerationContext],
+    max_workers: Optional[int] = None,
 ) -> tuple[dict[int, list[GeneratedQuestion]], TokenUsage]:
     """여러 카테고리에 대해 일괄 문제 생성
 
+    컨텍스트를 스레드 풀에서 동시에 생성하며, 호출 속도는 공용 Rate Limiter(CLOVA_QPM/TPM)가
+    제한합니다. 한 컨텍스트가 실패해도 나머지 결과에는 영향을 주지 않습니다.
+    목표 문제 수가 적은 카테고리는 PACKED_GENERATION_MAX_CATEGORIES개씩 묶어 한 번에 요청합니다.
+
     Args:
         contexts: 문제 생성 컨텍스트 리스트
+        max_workers: 동시 생성 수 (기본값 config.GENERATION_MAX_WORKERS)
 
     Returns:
         (카테고리 ID를 키로 하는 문제 리스트 딕셔너리, 총 토큰 사용량)
     """
-    results = {}
+    results = {context.category_id: [] for context in contexts}
     total_usage = TokenUsage()
-
-    for i, context in enumerate(contexts):
-        print(f"[{i+1}/{len(contexts)}] {context.category_name} 문제 생성 중...")
-        try:
-            questions, usage = generate_questions(context)
-            results[context.category_id] = questions
-
-            # 토큰 사용량 누적
-            total_usage.input_tokens += usage.input_tokens
-            total_usage.output_tokens += usage.output_tokens
-            total_usage.input_cost += usage.input_cost
-            total_usage.output_cost += usage.output_cost
-            total_usage.total_cost += usage.total_cost
-
-            print(f"  → {len(questions)}개 문제 생성 완료 (비용: {usage.total_cost:.2f}원)")
-        except Exception as e:
-            print(f"  → 실패: {e}")
-            results[context.category_id] = []
+    if not contexts:
+        return results, total_usage
+
+    groups = _group_contexts(contexts)
+    workers = min(max_workers or config.GENERATION_MAX_WORKERS, len(groups))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_generate_group, group): group for group in groups}
+        print(f"{len(contexts)}개 카테고리 문제 생성 중... (요청 {len(groups)}개, 동시 {workers}개)")
+
+        done = 0
+        for future in as_completed(futures):
+            group_results = future.result()
+            for context in futures[future]:
+                done += 1
+                if context.category_id not in group_results:
+                    continue
+                questions, usage = group_results[context.category_id]
+                results[context.category_id] = questions
+
+                # 토큰 사용량 누적
+                total_usage.input_tokens += usage.input_tokens
+                total_usage.output_tokens += usage.output_tokens
+                total_usage.input_cost += usage.input_cost
+                total_usage.output_cost += usage.output_cost
+                total_usage.total_cost += usage.total_cost
+
+                print(f"[{done}/{len(contexts)}] {context.category_name} → {len(questions)}개 문제 생성 완료 (비용: {usage.total_cost:.2f}원)")
 
     return results, total_usage
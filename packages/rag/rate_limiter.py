@@ -0,0 +1,91 @@
+"""Rate Limiter 모듈 - 분당 요청 수(QPM) / 토큰 수(TPM) 토큰 버킷"""
+
+import threading
+import time
+from functools import lru_cache
+
+from config import config
+
+
+class TokenBucket:
+    """초당 rate만큼 채워지고 최대 capacity까지 쌓이는 토큰 버킷
+
+    capacity가 0 이하이면 제한 없음으로 동작합니다.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._available = capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._available = min(self.capacity, self._available + elapsed * self.refill_per_second)
+        self._updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount를 꺼낼 수 있을 때까지 남은 시간(초)"""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        # 한 번에 capacity보다 많이 요청하면 가득 찼을 때 꺼내도록 제한
+        shortage = min(amount, self.capacity) - self._available
+        return max(0.0, shortage / self.refill_per_second)
+
+    def take(self, amount: float) -> None:
+        if not self.unlimited:
+            self._available -= amount
+
+    def give_back(self, amount: float) -> None:
+        if not self.unlimited:
+            self._available = min(self.capacity, self._available + amount)
+
+
+class RateLimiter:
+    """QPM / TPM 한도를 함께 지키는 Rate Limiter (스레드 안전)
+
+    호출 전 acquire(예상 토큰)로 예약하고, 응답 후 settle(예약 토큰, 실제 토큰)으로
+    차이를 정산합니다. 실제 사용량이 예약보다 많으면 이후 호출이 그만큼 늦춰집니다.
+    """
+
+    def __init__(self, qpm: int, tpm: int):
+        self._requests = TokenBucket(qpm, qpm / 60)
+        self._tokens = TokenBucket(tpm, tpm / 60)
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> float:
+        """요청 1회와 tokens만큼의 예산이 생길 때까지 대기 후 차감
+
+        Returns:
+            대기한 시간(초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                delay = max(self._requests.wait_time(1, now), self._tokens.wait_time(tokens, now))
+                if delay <= 0:
+                    self._requests.take(1)
+                    self._tokens.take(tokens)
+                    return waited
+            time.sleep(delay)
+            waited += delay
+
+    def settle(self, reserved_tokens: int, actual_tokens: int) -> None:
+        """예약한 토큰과 실제 사용 토큰의 차이 정산"""
+        with self._lock:
+            if actual_tokens < reserved_tokens:
+                self._tokens.give_back(reserved_tokens - actual_tokens)
+            else:
+                self._tokens.take(actual_tokens - reserved_tokens)
+
+
+@lru_cache(maxsize=1)
+def get_clova_rate_limiter() -> RateLimiter:
+    """HyperCLOVA X chat-completions 호출용 프로세스 단위 Rate Limiter"""
+    return RateLimiter(qpm=config.CLOVA_QPM, tpm=config.CLOVA_TPM)
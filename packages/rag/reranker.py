@@ -1,8 +1,16 @@
 """Clova Reranker API 모듈"""
 
-import requests
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
 from config import config
+from clients import get_http_session
+from cache_store import SqliteCache, CacheStats, make_cache_key
+from corpus_index import CorpusVersionedIndex
 from token_calculator import TokenUsage, calculate_cost
 
 
@@ -14,17 +22,65 @@ class RerankerResult:
     usage: TokenUsage
 
 
+@lru_cache(maxsize=1)
+def _get_reranker_cache() -> SqliteCache:
+    """Reranker 결과 캐시 (프로세스 단위 1개)"""
+    return SqliteCache(
+        path=config.RERANKER_CACHE_PATH,
+        table="reranker_results",
+        max_entries=config.RERANKER_CACHE_MAX_ENTRIES,
+    )
+
+
+class _RerankerCacheVersion(CorpusVersionedIndex[str]):
+    """Reranker 캐시 항목에 붙일 코퍼스 버전
+
+    로컬 인덱스와 같은 주기(refresh_interval)로 코퍼스 버전을 확인하고,
+    버전이 바뀌면 다른 버전으로 저장된 캐시 항목을 삭제합니다.
+    """
+
+    def _load(self, version: str) -> str:
+        removed = _get_reranker_cache().invalidate_except(version)
+        if removed:
+            print(f"[Reranker 캐시] 코퍼스 변경으로 {removed}개 항목 삭제")
+        return version
+
+
+@lru_cache(maxsize=1)
+def _get_reranker_cache_version() -> _RerankerCacheVersion:
+    """프로세스 단위 Reranker 캐시 버전 추적기"""
+    return _RerankerCacheVersion()
+
+
+def get_reranker_cache_stats() -> CacheStats:
+    """Reranker 캐시 적중 통계"""
+    return _get_reranker_cache().stats
+
+
+def _reranker_cache_key(query: str, documents: list[dict], max_tokens: int) -> str:
+    """쿼리 + 청크 ID/본문 해시 기반 캐시 키 (청크 순서도 포함)"""
+    documents_hash = hashlib.sha256(
+        json.dumps(documents, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    return make_cache_key(query, documents_hash, str(max_tokens))
+
+
 def rerank_chunks(
     query: str,
     chunks: list[dict],
-    max_tokens: int = 1024
+    max_tokens: int = 1024,
+    use_cache: Optional[bool] = None,
 ) -> RerankerResult:
     """Clova Reranker API 호출
 
+    (쿼리, 청크 ID/본문 목록)이 같으면 캐시된 결과를 재사용하며,
+    이 경우 토큰 사용량은 0입니다.
+
     Args:
         query: 검색 쿼리 (HyDE 쿼리)
         chunks: 검색된 청크 리스트 [{"id": int, "content": str}, ...]
         max_tokens: 최대 출력 토큰 (기본값 1024, 최대 4096)
+        use_cache: 캐시 사용 여부 (기본값 config.RERANKER_CACHE_ENABLED)
 
     Returns:
         RerankerResult: 인용된 문서 ID 목록과 토큰 사용량
@@ -41,13 +97,27 @@ def rerank_chunks(
         for chunk in chunks
     ]
 
+    use_cache = config.RERANKER_CACHE_ENABLED if use_cache is None else use_cache
+    if use_cache:
+        cache = _get_reranker_cache()
+        corpus_version = _get_reranker_cache_version().ensure_fresh()
+        cache_key = _reranker_cache_key(query, documents, max_tokens)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            cached_result = json.loads(cached)
+            return RerankerResult(
+                cited_doc_ids=cached_result["cited_doc_ids"],
+                cited_docs=cached_result["cited_docs"],
+                usage=TokenUsage(),
+            )
+
     data = {
         "documents": documents,
         "query": query,
         "maxTokens": max_tokens,
     }
 
-    response = requests.post(url, headers=headers, json=data, timeout=120)
+    response = get_http_session().post(url, headers=headers, json=data, timeout=120)
     response.raise_for_status()
 
     result = response.json()
@@ -65,6 +135,10 @@ def rerank_chunks(
         model="HCX-007"
     )
 
+    if use_cache:
+        value = json.dumps({"cited_doc_ids": cited_doc_ids, "cited_docs": cited_docs}, ensure_ascii=False)
+        cache.put(cache_key, value.encode("utf-8"), tag=corpus_version)
+
     return RerankerResult(
         cited_doc_ids=cited_doc_ids,
         cited_docs=cited_docs,
@@ -72,6 +146,81 @@ def rerank_chunks(
     )
 
 
+def split_into_shards(chunks: list[dict], max_chars: Optional[int] = None) -> list[list[dict]]:
+    """청크 본문 길이 합이 max_chars를 넘지 않도록 순서대로 묶음
+
+    단일 청크가 max_chars보다 길면 그 청크 하나로 샤드를 구성합니다.
+    max_chars가 0이면 (기본값) 나누지 않고 전체를 하나의 샤드로 반환합니다.
+    """
+    max_chars = config.RERANKER_SHARD_MAX_CHARS if max_chars is None else max_chars
+    if max_chars <= 0:
+        return [chunks] if chunks else []
+    shards: list[list[dict]] = []
+    current: list[dict] = []
+    current_chars = 0
+
+    for chunk in chunks:
+        length = len(chunk["content"])
+        if current and current_chars + length > max_chars:
+            shards.append(current)
+            current, current_chars = [], 0
+        current.append(chunk)
+        current_chars += length
+
+    if current:
+        shards.append(current)
+    return shards
+
+
+def rerank_chunks_sharded(
+    query: str,
+    chunks: list[dict],
+    max_tokens: int = 1024,
+    max_chars: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> RerankerResult:
+    """후보가 많을 때 샤드로 나눠 Reranker를 병렬 호출 후 결과 병합
+
+    각 샤드의 인용 순서(샤드 내 순위)를 기준으로 라운드 로빈으로 합치므로
+    한 샤드의 하위 인용이 다른 샤드의 상위 인용보다 앞서지 않습니다.
+    샤딩은 인용 결과(= 문제 수)를 바꿀 수 있으므로 RERANKER_SHARD_MAX_CHARS를 설정할 때만 사용하며,
+    0(기본값)이거나 샤드가 하나면 rerank_chunks와 동일합니다.
+
+    Args:
+        query: 검색 쿼리
+        chunks: 검색된 청크 리스트 [{"id": int, "content": str}, ...]
+        max_tokens: 샤드별 최대 출력 토큰
+        max_chars: 샤드별 청크 본문 길이 합 상한 (기본값 config.RERANKER_SHARD_MAX_CHARS, 0이면 샤딩 안 함)
+        max_workers: 동시 호출 수 (기본값 config.RERANKER_MAX_WORKERS)
+
+    Returns:
+        RerankerResult: 병합된 인용 문서 목록과 합산 토큰 사용량
+    """
+    shards = split_into_shards(chunks, max_chars)
+    if len(shards) <= 1:
+        return rerank_chunks(query, chunks, max_tokens)
+
+    workers = min(max_workers or config.RERANKER_MAX_WORKERS, len(shards))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda shard: rerank_chunks(query, shard, max_tokens), shards))
+
+    cited_doc_ids: list[str] = []
+    cited_docs: list[str] = []
+    seen: set[str] = set()
+    for rank in range(max(len(result.cited_doc_ids) for result in results)):
+        for result in results:
+            if rank < len(result.cited_doc_ids) and result.cited_doc_ids[rank] not in seen:
+                seen.add(result.cited_doc_ids[rank])
+                cited_doc_ids.append(result.cited_doc_ids[rank])
+                cited_docs.append(result.cited_docs[rank])
+
+    return RerankerResult(
+        cited_doc_ids=cited_doc_ids,
+        cited_docs=cited_docs,
+        usage=sum((result.usage for result in results), TokenUsage()),
+    )
+
+
 def get_question_count(cited_count: int) -> int:
     """인용된 청크 수에 따라 생성할 문제 수 결정
 
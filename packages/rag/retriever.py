@@ -1,11 +1,22 @@
-from dataclasses import dataclass
-import requests
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+import numpy as np
 from config import config
 from db import get_connection, get_cursor
+from clients import get_http_session
+from vector_index import apply_search_params, build_quantized_search_query, build_quantized_batch_search_query
+from local_vector_index import get_local_index
+from embedding_cache import get_embedding_cache
+from chunk_store import get_chunk_store
+from mmr import mmr_select
+from lexical_index import get_lexical_index
 from category_loader import get_leaf_category_with_least_questions
 from hyde_generator import generate_hyde_query
-from token_calculator import TokenUsage
-from reranker import rerank_chunks, get_question_count
+from token_calculator import TokenUsage, estimate_tokens
+from reranker import rerank_chunks, rerank_chunks_sharded, get_question_count
 
 
 @dataclass
@@ -13,9 +24,48 @@ class RetrievedChunk:
     id: int
     content: str
     similarity: float
+    embedding: Optional[np.ndarray] = field(default=None, repr=False)
+
+
+def _as_vector(embedding) -> np.ndarray:
+    """쿼리 임베딩을 np.ndarray로 변환 (pgvector 어댑터로 `%s::vector`에 전달)"""
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def _parse_embedding(value) -> Optional[np.ndarray]:
+    """DB에서 읽은 임베딩 컬럼 변환
+
+    pgvector 타입이 등록되어 있으면 이미 np.ndarray이고,
+    등록 전 텍스트 표현('[0.1,...]')은 JSON 배열로 파싱합니다.
+    """
+    if isinstance(value, str):
+        value = json.loads(value)
+    return _as_vector(value) if value is not None else None
 
 
 def get_query_embedding(query: str) -> list[float]:
+    """쿼리 임베딩 조회 (캐시 적중 시 API 호출 생략)"""
+    if not config.EMBEDDING_CACHE_ENABLED:
+        return request_query_embedding(query)
+
+    cache = get_embedding_cache()
+    embedding = cache.get(config.EMBEDDING_MODEL, query)
+    if embedding is None:
+        embedding = request_query_embedding(query)
+        cache.put(config.EMBEDDING_MODEL, query, embedding)
+    return embedding
+
+
+def warm_up_query_embeddings(queries: list[str]) -> int:
+    """여러 쿼리의 임베딩을 캐시에 미리 채움
+
+    Returns:
+        새로 임베딩한 쿼리 수
+    """
+    return get_embedding_cache().warm_up(config.EMBEDDING_MODEL, queries, request_query_embedding)
+
+
+def request_query_embedding(query: str) -> list[float]:
     """Clova Embedding v2 API로 쿼리를 임베딩 벡터로 변환"""
     url = "https://clovastudio.stream.ntruss.com/v1/api-tools/embedding/v2/"
     headers = {
@@ -24,76 +74,261 @@ def get_query_embedding(query: str) -> list[float]:
     }
     data = {"text": query}
 
-    response = requests.post(url, headers=headers, json=data, timeout=120)
+    response = get_http_session().post(url, headers=headers, json=data, timeout=120)
     response.raise_for_status()
 
     result = response.json()
     return result["result"]["embedding"]
 
 
-def retrieve_similar_chunks(query_embedding: list[float], top_k: int = 5) -> list[RetrievedChunk]:
-    """벡터 유사도 기반 Top-K 청크 검색 (Vector Only)"""
-    query = """
-    SELECT id, content, embedding <=> %s::vector AS distance
+def retrieve_similar_chunks(
+    query_embedding: list[float], top_k: int = 5, with_embeddings: bool = False
+) -> list[RetrievedChunk]:
+    """벡터 유사도 기반 Top-K 청크 검색 (Vector Only)
+
+    config.RETRIEVAL_BACKEND가 "local"이면 DB 대신 메모리 맵 로컬 인덱스에서 검색합니다.
+    config.VECTOR_QUANTIZATION이 설정되어 있으면 양자화 후보 검색 + 정밀 재정렬을 사용합니다.
+    with_embeddings가 True이면 각 청크의 임베딩도 함께 반환합니다 (MMR 등 후처리용).
+    """
+    if config.RETRIEVAL_BACKEND == "local":
+        return [
+            RetrievedChunk(
+                id=chunk_id,
+                content=content,
+                similarity=similarity,
+                embedding=embedding if with_embeddings else None,
+            )
+            for chunk_id, content, similarity, embedding in get_local_index().search(query_embedding, top_k)
+        ]
+    if config.VECTOR_QUANTIZATION != "none":
+        return retrieve_similar_chunks_quantized(query_embedding, top_k, with_embeddings=with_embeddings)
+
+    embedding_column = ", embedding" if with_embeddings else ""
+    query = f"""
+    SELECT id, content, embedding <=> %s::vector AS distance{embedding_column}
     FROM document_embeddings
     ORDER BY distance ASC
     LIMIT %s
     """
     with get_connection() as conn:
         with get_cursor(conn) as cursor:
-            cursor.execute(query, (query_embedding, top_k))
+            apply_search_params(cursor, top_k)
+            cursor.execute(query, (_as_vector(query_embedding), top_k))
+            results = cursor.fetchall()
+
+            return [
+                RetrievedChunk(
+                    id=row["id"],
+                    content=row["content"],
+                    similarity=1 - row["distance"],
+                    embedding=_parse_embedding(row.get("embedding")),
+                )
+                for row in results
+            ]
+
+
+def retrieve_similar_chunks_quantized(
+    query_embedding: list[float],
+    top_k: int = 5,
+    mode: Optional[str] = None,
+    candidate_k: Optional[int] = None,
+    with_embeddings: bool = False,
+) -> list[RetrievedChunk]:
+    """양자화 벡터(halfvec/binary) 인덱스로 후보를 뽑은 뒤 원본 벡터로 정밀 재정렬
+
+    Args:
+        query_embedding: 쿼리 임베딩
+        top_k: 최종 반환할 청크 수
+        mode: "halfvec" 또는 "binary" (기본값 config.VECTOR_QUANTIZATION)
+        candidate_k: 정밀 재정렬할 1차 후보 수 (기본값 config.QUANTIZED_CANDIDATE_K)
+        with_embeddings: 각 청크의 임베딩도 함께 반환할지 여부
+    """
+    candidate_k = max(candidate_k or config.QUANTIZED_CANDIDATE_K, top_k)
+    query = build_quantized_search_query(mode)
+
+    with get_connection() as conn:
+        with get_cursor(conn) as cursor:
+            # 양자화 인덱스는 HNSW로 생성하므로 ef_search를 후보 수 이상으로 설정
+            apply_search_params(cursor, candidate_k, "hnsw")
+            cursor.execute(query, {
+                "embedding": _as_vector(query_embedding),
+                "candidate_k": candidate_k,
+                "top_k": top_k,
+            })
             results = cursor.fetchall()
 
             return [
                 RetrievedChunk(
                     id=row["id"],
                     content=row["content"],
-                    similarity=1 - row["distance"]
+                    similarity=1 - row["distance"],
+                    embedding=_parse_embedding(row["embedding"]) if with_embeddings else None,
                 )
                 for row in results
             ]
 
 
+def retrieve_similar_chunks_batch(
+    query_embeddings: list[list[float]], top_k: int = 5, with_embeddings: bool = False
+) -> list[list[RetrievedChunk]]:
+    """여러 쿼리 임베딩의 Top-K 청크를 단일 쿼리(한 번의 DB 왕복)로 검색
+
+    unnest로 쿼리 벡터 배열을 펼친 뒤 LATERAL 서브쿼리에서 각각 ANN Top-K를 수행합니다.
+    config.VECTOR_QUANTIZATION이 설정되어 있으면 단일 쿼리 검색과 같이
+    양자화 후보 검색 + 정밀 재정렬을 쿼리별로 수행합니다.
+
+    Args:
+        query_embeddings: 쿼리 임베딩 리스트
+        top_k: 쿼리별 검색할 청크 수
+        with_embeddings: 각 청크의 임베딩도 함께 반환할지 여부
+
+    Returns:
+        입력 순서와 동일한 쿼리별 청크 리스트
+    """
+    if not query_embeddings:
+        return []
+
+    if config.RETRIEVAL_BACKEND == "local":
+        return [
+            retrieve_similar_chunks(embedding, top_k, with_embeddings)
+            for embedding in query_embeddings
+        ]
+
+    vectors = [_as_vector(embedding) for embedding in query_embeddings]
+    grouped: list[list[RetrievedChunk]] = [[] for _ in query_embeddings]
+
+    if config.VECTOR_QUANTIZATION != "none":
+        # 단일 쿼리 경로와 같은 양자화 후보 검색 + 정밀 재정렬
+        candidate_k = max(config.QUANTIZED_CANDIDATE_K, top_k)
+        query = build_quantized_batch_search_query()
+        params = {"embeddings": vectors, "candidate_k": candidate_k, "top_k": top_k}
+        search_k, search_method = candidate_k, "hnsw"
+    else:
+        embedding_column = ", d.embedding" if with_embeddings else ""
+        query = f"""
+        SELECT q.ord, c.*
+        FROM unnest(%(embeddings)s::vector[]) WITH ORDINALITY AS q(embedding, ord)
+        CROSS JOIN LATERAL (
+            SELECT d.id, d.content, d.embedding <=> q.embedding AS distance{embedding_column}
+            FROM document_embeddings d
+            ORDER BY distance ASC
+            LIMIT %(top_k)s
+        ) c
+        ORDER BY q.ord, c.distance ASC
+        """
+        params = {"embeddings": vectors, "top_k": top_k}
+        search_k, search_method = top_k, None
+
+    with get_connection() as conn:
+        with get_cursor(conn) as cursor:
+            apply_search_params(cursor, search_k, search_method)
+            cursor.execute(query, params)
+            for row in cursor.fetchall():
+                grouped[row["ord"] - 1].append(
+                    RetrievedChunk(
+                        id=row["id"],
+                        content=row["content"],
+                        similarity=1 - row["distance"],
+                        embedding=_parse_embedding(row.get("embedding")) if with_embeddings else None,
+                    )
+                )
+
+    return grouped
+
+
+HYBRID_FUSION_METHODS = ("rrf", "weighted")
+
+
 def retrieve_hybrid_chunks(
     query_embedding: list[float],
     keyword: str,
     top_k: int = 5,
-    vector_weight: float = 0.7
+    vector_weight: float = 0.7,
+    fusion: Optional[str] = None,
+    candidate_k: Optional[int] = None,
 ) -> list[RetrievedChunk]:
-    """Hybrid Search: 벡터 유사도 + 키워드 매칭"""
-    query = """
-    WITH vector_search AS (
-        SELECT id, content, embedding <=> %s::vector AS vector_distance
-        FROM document_embeddings
+    """Hybrid Search: 벡터 Top-N + 키워드 Top-N 후보를 랭크 퓨전으로 병합
+
+    벡터 후보는 ANN 인덱스, 키워드 후보는 GIN(tsvector) 인덱스에서 각각 N개만 가져오므로
+    비용이 코퍼스 크기가 아니라 N에 비례합니다.
+
+    Args:
+        query_embedding: 쿼리 임베딩
+        keyword: 키워드 검색어
+        top_k: 최종 반환할 청크 수
+        vector_weight: 벡터 점수 가중치 (weighted 퓨전에서 사용, 키워드는 1 - vector_weight)
+        fusion: "rrf" (Reciprocal Rank Fusion) 또는 "weighted" (정규화 점수 가중합),
+            기본값 config.HYBRID_FUSION
+        candidate_k: 벡터/키워드 각각의 후보 수 (기본값 config.HYBRID_CANDIDATE_K)
+    """
+    fusion = (fusion or config.HYBRID_FUSION).lower()
+    if fusion not in HYBRID_FUSION_METHODS:
+        raise ValueError(f"지원하지 않는 퓨전 방식: {fusion} (지원: {', '.join(HYBRID_FUSION_METHODS)})")
+    candidate_k = max(candidate_k or config.HYBRID_CANDIDATE_K, top_k)
+
+    if fusion == "rrf":
+        # 순위만 사용하므로 두 점수의 스케일 차이에 영향받지 않음
+        score_expr = """
+            COALESCE(1.0 / (%(rrf_k)s + v.vector_rank), 0)
+            + COALESCE(1.0 / (%(rrf_k)s + k.keyword_rank), 0)"""
+    else:
+        # 벡터: 코사인 유사도, 키워드: 후보 내 최대 ts_rank 기준 정규화
+        score_expr = """
+            %(vector_weight)s * COALESCE(1 - v.vector_distance, 0)
+            + %(keyword_weight)s * COALESCE(k.keyword_score / NULLIF(MAX(k.keyword_score) OVER (), 0), 0)"""
+
+    query = f"""
+    WITH vector_candidates AS (
+        SELECT id, vector_distance, ROW_NUMBER() OVER (ORDER BY vector_distance) AS vector_rank
+        FROM (
+            SELECT id, embedding <=> %(embedding)s::vector AS vector_distance
+            FROM document_embeddings
+            ORDER BY vector_distance ASC
+            LIMIT %(candidate_k)s
+        ) ann
+    ),
+    keyword_candidates AS (
+        SELECT id, keyword_score, ROW_NUMBER() OVER (ORDER BY keyword_score DESC) AS keyword_rank
+        FROM (
+            SELECT id, ts_rank(tsvector, plainto_tsquery('english', %(keyword)s)) AS keyword_score
+            FROM document_embeddings
+            WHERE tsvector @@ plainto_tsquery('english', %(keyword)s)
+            ORDER BY keyword_score DESC
+            LIMIT %(candidate_k)s
+        ) fts
     ),
-    keyword_search AS (
-        SELECT id, ts_rank(tsvector, plainto_tsquery('english', %s)) AS keyword_rank
-        FROM document_embeddings
-        WHERE tsvector @@ plainto_tsquery('english', %s)
+    fused AS (
+        SELECT
+            COALESCE(v.id, k.id) AS id,
+            {score_expr} AS hybrid_score
+        FROM vector_candidates v
+        FULL OUTER JOIN keyword_candidates k ON v.id = k.id
+        ORDER BY hybrid_score DESC
+        LIMIT %(top_k)s
     )
     SELECT
-        v.id,
-        v.content,
-        v.vector_distance,
-        COALESCE(k.keyword_rank, 0) AS keyword_rank,
-        v.vector_distance * %s + (1 - COALESCE(k.keyword_rank, 0)) * %s AS hybrid_score
-    FROM vector_search v
-    LEFT JOIN keyword_search k ON v.id = k.id
-    ORDER BY hybrid_score ASC
-    LIMIT %s
+        d.id,
+        d.content,
+        d.embedding <=> %(embedding)s::vector AS vector_distance,
+        f.hybrid_score
+    FROM fused f
+    JOIN document_embeddings d ON d.id = f.id
+    ORDER BY f.hybrid_score DESC
     """
-    keyword_weight = 1 - vector_weight
+    params = {
+        "embedding": _as_vector(query_embedding),
+        "keyword": keyword,
+        "candidate_k": candidate_k,
+        "top_k": top_k,
+        "rrf_k": config.RRF_K,
+        "vector_weight": vector_weight,
+        "keyword_weight": 1 - vector_weight,
+    }
 
     with get_connection() as conn:
         with get_cursor(conn) as cursor:
-            cursor.execute(query, (
-                query_embedding,
-                keyword,
-                keyword,
-                vector_weight,
-                keyword_weight,
-                top_k
-            ))
+            apply_search_params(cursor, candidate_k)
+            cursor.execute(query, params)
             results = cursor.fetchall()
 
             return [
@@ -171,21 +406,152 @@ def retrieve_chunks_with_reranker(
     query_embedding = get_query_embedding(hyde_query)
 
     # 3. Vector 유사도 검색 (넉넉하게)
-    initial_chunks = retrieve_similar_chunks(query_embedding, top_k)
+    initial_chunks = retrieve_similar_chunks(query_embedding, top_k, with_embeddings=config.MMR_ENABLED)
+
+    # 3-1. MMR로 중복 청크 제거
+    initial_chunks = diversify_chunks(query_embedding, initial_chunks)
+
+    # 4~6. Reranker 필터링 + 문제 수 결정
+    return _rerank_retrieved_chunks(category, initial_chunks, hyde_usage, hyde_query)
+
+
+def diversify_chunks(
+    query_embedding: list[float],
+    chunks: list[RetrievedChunk],
+    top_k: Optional[int] = None,
+    lambda_mult: Optional[float] = None,
+) -> list[RetrievedChunk]:
+    """MMR로 서로 겹치는 청크를 걸러 다양한 부분집합 선택 (관련도순 유지)
+
+    ETL의 청크 overlap(200자) 때문에 인접 서브청크가 함께 검색되는 경우
+    Reranker/생성 프롬프트로 중복 토큰이 전달되지 않도록 합니다.
+
+    Args:
+        query_embedding: 쿼리 임베딩
+        chunks: 임베딩이 포함된 검색 청크 리스트
+        top_k: 선택할 청크 수 (기본값 config.MMR_TOP_K)
+        lambda_mult: 관련성 가중치 (기본값 config.MMR_LAMBDA)
+    """
+    if not config.MMR_ENABLED or any(chunk.embedding is None for chunk in chunks):
+        return chunks
+
+    selected = mmr_select(
+        query_embedding,
+        [chunk.embedding for chunk in chunks],
+        k=top_k or config.MMR_TOP_K,
+        lambda_mult=config.MMR_LAMBDA if lambda_mult is None else lambda_mult,
+    )
+    return [chunks[i] for i in sorted(selected)]
+
+
+def prerank_chunks(
+    query: str,
+    chunks: list[RetrievedChunk],
+    top_k: Optional[int] = None,
+) -> tuple[list[RetrievedChunk], dict[int, float]]:
+    """벡터 순위와 BM25 순위를 RRF로 합쳐 상위 청크만 선택 (관련도순 유지)
+
+    Reranker는 전달된 청크 본문 전체에 대해 과금되므로, 어휘적으로도 쿼리와
+    관련이 적은 후보를 로컬에서 먼저 걸러 요청 토큰을 줄입니다.
+
+    Args:
+        query: BM25 쿼리 (카테고리 이름 + HyDE 쿼리)
+        chunks: 벡터 유사도순 검색 청크 리스트
+        top_k: 남길 청크 수 (기본값 config.LEXICAL_PRERANK_TOP_K)
+
+    Returns:
+        (선택된 청크 리스트, {청크 ID: BM25 점수})
+    """
+    top_k = top_k or config.LEXICAL_PRERANK_TOP_K
+    if len(chunks) <= top_k:
+        return chunks, {}
+
+    bm25_scores = get_lexical_index().score(query, [chunk.id for chunk in chunks])
+    lexical_order = sorted(range(len(chunks)), key=lambda i: -bm25_scores[chunks[i].id])
+    lexical_rank = {index: rank for rank, index in enumerate(lexical_order, start=1)}
+
+    fused = {
+        i: 1.0 / (config.RRF_K + i + 1) + 1.0 / (config.RRF_K + lexical_rank[i])
+        for i in range(len(chunks))
+    }
+    selected = sorted(sorted(fused, key=lambda i: -fused[i])[:top_k])
+    return [chunks[i] for i in selected], bm25_scores
+
+
+def _log_prerank_decision(
+    category: "CategoryInfo",
+    chunks: list[RetrievedChunk],
+    kept: list[RetrievedChunk],
+    bm25_scores: dict[int, float],
+    cited_ids: set[str],
+) -> None:
+    """사전 정렬 결과를 JSONL로 기록 (토큰 절감량 / Recall 손실 분석용)"""
+    kept_ids = {chunk.id for chunk in kept}
+    record = {
+        "timestamp": datetime.now().isoformat(),
+        "category_id": category.id,
+        "category_name": category.name,
+        "candidates": [
+            {
+                "id": chunk.id,
+                "vector_rank": rank,
+                "similarity": round(chunk.similarity, 4),
+                "bm25": round(bm25_scores.get(chunk.id, 0.0), 4),
+                "tokens": estimate_tokens(chunk.content),
+                "kept": chunk.id in kept_ids,
+                "cited": str(chunk.id) in cited_ids,
+            }
+            for rank, chunk in enumerate(chunks, start=1)
+        ],
+        "tokens_sent": sum(estimate_tokens(chunk.content) for chunk in kept),
+        "tokens_saved": sum(estimate_tokens(chunk.content) for chunk in chunks if chunk.id not in kept_ids),
+    }
+    try:
+        log_path = Path(config.LEXICAL_PRERANK_LOG_PATH)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"[경고] 사전 정렬 로그 기록 실패: {e}")
+
+
+def _rerank_retrieved_chunks(
+    category: "CategoryInfo",
+    initial_chunks: list[RetrievedChunk],
+    hyde_usage: TokenUsage,
+    hyde_query: str = "",
+) -> RetrievalResult:
+    """검색된 청크를 (BM25 사전 정렬 후) Reranker로 필터링하고 문제 수 결정"""
+    # 평가 단계에서 청크 본문을 다시 조회하지 않도록 저장
+    get_chunk_store().put_many((chunk.id, chunk.content) for chunk in initial_chunks)
+
+    # 3-2. BM25 사전 정렬로 Reranker에 보낼 후보 축소
+    candidates, bm25_scores = initial_chunks, {}
+    if config.LEXICAL_PRERANK_ENABLED:
+        try:
+            candidates, bm25_scores = prerank_chunks(f"{category.name} {hyde_query}", initial_chunks)
+        except Exception as e:
+            print(f"[경고] BM25 사전 정렬 실패, 전체 후보 사용: {e}")
 
     # 4. Reranker로 관련성 높은 청크 필터링
     chunks_for_rerank = [
         {"id": chunk.id, "content": chunk.content}
-        for chunk in initial_chunks
+        for chunk in candidates
     ]
     # Reranker에는 HyDE 쿼리 대신 카테고리 이름(주제)을 직접 사용하여 관련성 판단
-    reranker_result = rerank_chunks(category.name, chunks_for_rerank)
+    if config.RERANKER_SHARD_MAX_CHARS > 0:
+        reranker_result = rerank_chunks_sharded(category.name, chunks_for_rerank)
+    else:
+        reranker_result = rerank_chunks(category.name, chunks_for_rerank)
 
     # 5. 인용된 청크만 필터링
     cited_ids = set(reranker_result.cited_doc_ids)
+    if bm25_scores:
+        _log_prerank_decision(category, initial_chunks, candidates, bm25_scores, cited_ids)
+
     if cited_ids:
         filtered_chunks = [
-            chunk for chunk in initial_chunks
+            chunk for chunk in candidates
             if str(chunk.id) in cited_ids
         ]
     else:
@@ -201,3 +567,45 @@ def retrieve_chunks_with_reranker(
         hyde_usage=hyde_usage,
         reranker_usage=reranker_result.usage,
     )
+
+
+def retrieve_chunks_with_reranker_batch(
+    categories: list["CategoryInfo"], top_k: int = 10
+) -> list[RetrievalResult]:
+    """여러 카테고리에 대해 HyDE + Vector + Reranker 검색 (벡터 검색은 DB 왕복 1회)
+
+    다음 라운드들의 카테고리 검색을 미리 가져오는(prefetch) 용도로 사용합니다.
+
+    Args:
+        categories: 카테고리 정보 리스트
+        top_k: 카테고리별 초기 검색할 청크 수 (reranker 전)
+
+    Returns:
+        입력 순서와 동일한 카테고리별 RetrievalResult 리스트
+    """
+    # 1~2. 카테고리별 HyDE 쿼리 생성 및 임베딩
+    hyde_queries = []
+    hyde_usages = []
+    query_embeddings = []
+    for category in categories:
+        hyde_query, hyde_usage = generate_hyde_query(category)
+        hyde_queries.append(hyde_query)
+        hyde_usages.append(hyde_usage)
+        query_embeddings.append(get_query_embedding(hyde_query))
+
+    # 3. 전체 카테고리 Vector 유사도 검색 (단일 쿼리) + MMR 중복 제거
+    initial_chunks_list = [
+        diversify_chunks(query_embedding, initial_chunks)
+        for query_embedding, initial_chunks in zip(
+            query_embeddings,
+            retrieve_similar_chunks_batch(query_embeddings, top_k, with_embeddings=config.MMR_ENABLED),
+        )
+    ]
+
+    # 4~6. 카테고리별 Reranker 필터링
+    return [
+        _rerank_retrieved_chunks(category, initial_chunks, hyde_usage, hyde_query)
+        for category, initial_chunks, hyde_usage, hyde_query in zip(
+            categories, initial_chunks_list, hyde_usages, hyde_queries
+        )
+    ]
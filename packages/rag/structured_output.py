@@ -0,0 +1,255 @@
+"""구조화 응답 복구 모듈 - 잘리거나 약간 깨진 JSON 응답에서 완성된 항목 복구 및 스키마 검증
+
+- 코드 블록(```json), 앞뒤 설명 문장 무시
+- 객체/배열 끝의 trailing comma 제거
+- 응답이 중간에 잘려도 완성된 배열 원소는 모두 복구
+- JSON 스키마(get_question_schema 형식)를 한 번 컴파일한 검증 함수로 항목별 검증
+"""
+
+import json
+from typing import Any, Callable
+
+from json_stream import JsonArrayStreamParser
+
+
+def strip_code_fences(content: str) -> str:
+    """Markdown Code Block 제거 (```json ... ```)"""
+    if "```" in content:
+        content = content.replace("```json", "").replace("```", "")
+    return content.strip()
+
+
+def _strip_trailing_commas(text: str) -> str:
+    """문자열 밖에서 '}' 또는 ']' 바로 앞에 오는 쉼표 제거"""
+    result = []
+    in_string = False
+    escape = False
+    pending_comma = None  # 쉼표 이후 공백까지 보류
+
+    for ch in text:
+        if in_string:
+            result.append(ch)
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if pending_comma is not None:
+            if ch.isspace():
+                pending_comma.append(ch)
+                continue
+            if ch not in "}]":
+                result.extend(pending_comma)
+            else:
+                result.extend(pending_comma[1:])
+            pending_comma = None
+
+        if ch == ",":
+            pending_comma = [ch]
+        else:
+            result.append(ch)
+            if ch == '"':
+                in_string = True
+
+    if pending_comma is not None:
+        result.extend(pending_comma)
+    return "".join(result)
+
+
+def loads_lenient(text: str) -> Any:
+    """json.loads 실패 시 trailing comma를 제거하고 한 번 더 시도"""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json.loads(_strip_trailing_commas(text))
+
+
+def salvage_array_items(content: str, key: str) -> tuple[list[dict], bool]:
+    """응답에서 key 배열의 완성된 객체만 복구
+
+    Returns:
+        (복구된 객체 리스트, 배열이 정상적으로 닫혔는지 여부)
+    """
+    parser = JsonArrayStreamParser(key, loads=loads_lenient)
+    items = parser.feed(content)
+    return items, parser.done
+
+
+def parse_structured_response(content: str, keys: tuple[str, ...] = ("questions",)) -> dict:
+    """구조화 응답 파싱 (실패 시 keys 배열들의 완성된 원소만 복구)
+
+    Raises:
+        ValueError: 복구할 수 있는 항목이 하나도 없을 때
+
+    Returns:
+        파싱된 응답 딕셔너리 (복구 시 {key: [복구된 객체, ...]})
+    """
+    content = strip_code_fences(content)
+
+    # 1. JSON 본문만 추출하여 파싱 시도 (앞뒤 설명 문장 무시)
+    start, end = content.find("{"), content.rfind("}")
+    if start != -1 and end > start:
+        try:
+            parsed = loads_lenient(content[start:end + 1])
+            if isinstance(parsed, dict):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+
+    # 2. 잘린 응답에서 완성된 원소만 복구
+    salvaged = {}
+    all_closed = True
+    for key in keys:
+        items, closed = salvage_array_items(content, key)
+        if items:
+            salvaged[key] = items
+        all_closed = all_closed and closed
+    if not salvaged:
+        raise ValueError(f"구조화 응답 파싱 실패 (복구 가능한 항목 없음). 원본 응답:\n{content}")
+
+    state = "형식 오류" if all_closed else "응답 잘림"
+    salvaged_count = sum(len(items) for items in salvaged.values())
+    print(f"[경고] 구조화 응답 파싱 실패 ({state}), 완성된 항목 {salvaged_count}개 복구")
+    return salvaged
+
+
+# ============================================================
+# JSON 스키마 검증 (필요한 키워드만 지원하는 경량 컴파일러)
+# ============================================================
+
+Validator = Callable[[Any, str], list[str]]
+
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+}
+
+
+def compile_schema(schema: dict) -> Validator:
+    """JSON 스키마를 검증 함수로 컴파일 (type, enum, minimum, maximum,
+    properties, required, items, minItems, maxItems 지원)
+
+    스키마 해석은 컴파일 시 한 번만 수행되고, 반환된 함수는 값만 검사합니다.
+
+    Returns:
+        validate(value, path="$") -> 오류 메시지 리스트 (비어 있으면 통과)
+    """
+    checks: list[Validator] = []
+
+    expected_type = schema.get("type")
+    if expected_type is not None:
+        type_check = _TYPE_CHECKS[expected_type]
+
+        def check_type(value, path, _check=type_check, _name=expected_type):
+            return [] if _check(value) else [f"{path}: {_name} 타입이어야 함 ({type(value).__name__})"]
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value, path, _allowed=allowed):
+            return [] if value in _allowed else [f"{path}: {_allowed} 중 하나여야 함 ({value!r})"]
+        checks.append(check_enum)
+
+    if "minimum" in schema or "maximum" in schema:
+        low, high = schema.get("minimum"), schema.get("maximum")
+
+        def check_range(value, path, _low=low, _high=high):
+            if not _TYPE_CHECKS["number"](value):
+                return []
+            if (_low is not None and value < _low) or (_high is not None and value > _high):
+                return [f"{path}: {_low}~{_high} 범위를 벗어남 ({value})"]
+            return []
+        checks.append(check_range)
+
+    if "properties" in schema or "required" in schema:
+        property_validators = {
+            name: compile_schema(sub_schema)
+            for name, sub_schema in schema.get("properties", {}).items()
+        }
+        required = list(schema.get("required", []))
+
+        def check_object(value, path, _props=property_validators, _required=required):
+            if not isinstance(value, dict):
+                return []
+            errors = [f"{path}.{name}: 필수 필드 누락" for name in _required if name not in value]
+            for name, validate in _props.items():
+                if name in value:
+                    errors.extend(validate(value[name], f"{path}.{name}"))
+            return errors
+        checks.append(check_object)
+
+    if "items" in schema or "minItems" in schema or "maxItems" in schema:
+        item_validator = compile_schema(schema["items"]) if "items" in schema else None
+        min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+
+        def check_array(value, path, _item=item_validator, _min=min_items, _max=max_items):
+            if not isinstance(value, list):
+                return []
+            errors = []
+            if _min is not None and len(value) < _min:
+                errors.append(f"{path}: 최소 {_min}개 필요 ({len(value)}개)")
+            if _max is not None and len(value) > _max:
+                errors.append(f"{path}: 최대 {_max}개 허용 ({len(value)}개)")
+            if _item is not None:
+                for i, item in enumerate(value):
+                    errors.extend(_item(item, f"{path}[{i}]"))
+            return errors
+        checks.append(check_array)
+
+    def validate(value: Any, path: str = "$") -> list[str]:
+        errors = []
+        for check in checks:
+            errors.extend(check(value, path))
+        return errors
+
+    return validate
+
+
+def repair_question_item(item: dict) -> dict:
+    """자주 발생하는 문제 객체 결함 보정
+
+    - correct_index가 [0]처럼 배열이면 첫 원소 사용
+    - difficulty / correct_index가 "3"처럼 문자열이면 정수로 변환
+    - chunk_ids 원소가 문자열이면 정수로 변환
+    - question_type 대소문자/공백 정리
+    - 단답형/서술형에서 null로 오는 options는 [], correct_index는 0으로 변환
+    """
+    repaired = dict(item)
+
+    if "options" in repaired and repaired["options"] is None:
+        repaired["options"] = []
+    if "correct_index" in repaired and repaired["correct_index"] is None:
+        repaired["correct_index"] = 0
+
+    for key in ("correct_index", "difficulty"):
+        value = repaired.get(key)
+        if isinstance(value, list) and len(value) == 1:
+            value = value[0]
+        if isinstance(value, str) and value.strip().isdigit():
+            value = int(value.strip())
+        if key in repaired:
+            repaired[key] = value
+
+    chunk_ids = repaired.get("chunk_ids")
+    if isinstance(chunk_ids, (int, str)):
+        chunk_ids = [chunk_ids]
+    if isinstance(chunk_ids, list):
+        repaired["chunk_ids"] = [
+            int(cid) if isinstance(cid, str) and cid.strip().isdigit() else cid
+            for cid in chunk_ids
+        ]
+
+    question_type = repaired.get("question_type")
+    if isinstance(question_type, str):
+        repaired["question_type"] = question_type.strip().lower()
+
+    return repaired
+
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 모듈이 packages/rag 최상위에 있으므로 테스트에서 바로 import할 수 있도록 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
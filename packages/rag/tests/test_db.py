@@ -0,0 +1,31 @@
+import psycopg2
+
+import db
+
+
+class FakeConnection:
+    def __init__(self):
+        self.rollbacks = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def test_failed_vector_registration_is_retried(monkeypatch):
+    calls = []
+
+    def flaky_register_vector(conn, globally=False):
+        calls.append(conn)
+        if len(calls) == 1:
+            raise psycopg2.ProgrammingError("vector type not found in the database")
+
+    monkeypatch.setattr(db, "_vector_registered", False)
+    monkeypatch.setattr(db, "register_vector", flaky_register_vector)
+    monkeypatch.setattr(db, "register_adapter", lambda *args: None)
+
+    db._register_vector_types(FakeConnection())
+    assert db._vector_registered is False
+
+    db._register_vector_types(FakeConnection())
+    assert db._vector_registered is True
+    assert len(calls) == 2
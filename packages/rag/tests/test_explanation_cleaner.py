@@ -0,0 +1,69 @@
+import pytest
+
+from explanation_cleaner import clean_explanation
+
+
+@pytest.mark.parametrize("explanation", [
+    "실행 컨텍스트에서 this는 함수 호출 방식에 따라 결정됩니다.",
+    "HTML 문서에서 script 태그는 파싱을 중단시킬 수 있습니다.",
+    "MongoDB는 문서에서 필드를 유연하게 추가할 수 있는 스키마리스 구조입니다.",
+    ".NET은 CLR 위에서 동작하는 런타임입니다.",
+    "REST API를 사용하면 HTTP 캐싱을 활용할 수 있습니다.",
+])
+def test_technical_wording_is_left_untouched(explanation):
+    result = clean_explanation(explanation)
+
+    assert result.text == explanation
+    assert not result.changed
+    assert not result.needs_llm
+
+
+def test_dangling_reference_is_not_trusted():
+    result = clean_explanation("청크 3에서 설명된 대로.")
+
+    assert not result.text.startswith("설명된 대로")
+    assert result.needs_llm
+
+
+def test_leading_dot_survives_reference_removal():
+    result = clean_explanation("청크 1에 따르면, .NET은 CLR 위에서 동작합니다.")
+
+    assert result.text == ".NET은 CLR 위에서 동작합니다."
+    assert not result.needs_llm
+
+
+def test_mixed_script_replacement_fixes_particle():
+    result = clean_explanation("HTTP는 상태lessness를 따르므로 서버가 상태를 저장하지 않습니다.")
+
+    assert result.text == "HTTP는 무상태성(Statelessness)을 따르므로 서버가 상태를 저장하지 않습니다."
+    assert not result.needs_llm
+
+
+@pytest.mark.parametrize("explanation, expected", [
+    ("청크 3970에 따르면, TCP는 연결 지향 프로토콜입니다.", "TCP는 연결 지향 프로토콜입니다."),
+    ("제공된 문서에 따르면 TCP는 연결 지향 프로토콜입니다.", "TCP는 연결 지향 프로토콜입니다."),
+    ("TCP는 연결 지향 프로토콜입니다 (청크 ID: 12).", "TCP는 연결 지향 프로토콜입니다."),
+])
+def test_explicit_references_are_removed_without_llm(explanation, expected):
+    result = clean_explanation(explanation)
+
+    assert result.text == expected
+    assert result.changed
+    assert not result.needs_llm
+    assert result.reasons == []
+
+
+def test_remaining_reference_after_rule_edit_is_escalated():
+    result = clean_explanation("청크 3에 따르면, TCP는 문서 5의 내용처럼 연결 지향 프로토콜입니다.")
+
+    assert result.changed
+    assert result.needs_llm
+
+
+def test_reference_without_id_is_escalated_unchanged():
+    explanation = "문서에 따르면 TCP는 연결 지향 프로토콜입니다."
+
+    result = clean_explanation(explanation)
+
+    assert result.text == explanation
+    assert result.needs_llm
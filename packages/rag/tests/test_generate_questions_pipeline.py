@@ -0,0 +1,36 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("ragas")
+
+import generate_questions_pipeline as pipeline
+from token_calculator import TokenUsage
+
+
+class _Results:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def to_pandas(self):
+        return SimpleNamespace(itertuples=lambda: iter(self.rows))
+
+
+def test_skipped_answer_relevancy_is_written_as_null(monkeypatch):
+    rows = [
+        SimpleNamespace(faithfulness=0.95, answer_relevancy=0.8),
+        SimpleNamespace(faithfulness=0.4, answer_relevancy=float("nan")),
+    ]
+    monkeypatch.setattr(pipeline.config, "PRESCREEN_MODE", "off")
+    monkeypatch.setattr(pipeline, "evaluate_questions", lambda questions, faithfulness_threshold: (_Results(rows), TokenUsage()))
+    questions = [{"question": "TCP란?"}, {"question": "UDP란?"}]
+
+    passed, rejected, _ = pipeline.evaluate_and_classify(questions)
+
+    assert [q["question"] for q in passed] == ["TCP란?"]
+    assert "skipped_metrics" not in passed[0]
+    assert rejected[0]["scores"] == {"faithfulness": 0.4, "answer_relevancy": None}
+    assert rejected[0]["skipped_metrics"] == ["answer_relevancy"]
+    json.dumps(rejected, allow_nan=False)
@@ -0,0 +1,34 @@
+import json
+
+import lexical_index
+from lexical_index import LexicalIndex, _IndexData, _index_path, _read_index
+
+
+def _write_index(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data.to_dict()), encoding="utf-8")
+
+
+def test_index_file_round_trips_integer_chunk_ids(tmp_path):
+    data = _IndexData(version="v1", doc_lengths={7: 3}, postings={"http": {7: 2}}, avg_doc_length=3.0)
+    path = _index_path(tmp_path, "v1")
+    _write_index(path, data)
+
+    loaded = _read_index(path)
+
+    assert path.suffix == ".json"
+    assert loaded == data
+
+
+def test_unreadable_index_file_is_rebuilt(tmp_path, monkeypatch):
+    path = _index_path(tmp_path, "v1")
+    path.write_text("{not json", encoding="utf-8")
+    rebuilt = _IndexData(version="v1", doc_lengths={1: 1}, postings={"tcp": {1: 1}}, avg_doc_length=1.0)
+
+    def fake_build(index_dir):
+        _write_index(path, rebuilt)
+        return path
+
+    monkeypatch.setattr(lexical_index, "build_lexical_index", fake_build)
+
+    assert LexicalIndex(str(tmp_path))._load("v1") == rebuilt
@@ -0,0 +1,38 @@
+import json
+
+import numpy as np
+
+import local_vector_index
+from local_vector_index import CURRENT_FILE, LocalVectorIndex, _Snapshot
+
+
+def test_content_at_returns_empty_string_without_contents():
+    snapshot = _Snapshot(
+        version="v1",
+        ids=np.array([1], dtype=np.int64),
+        matrix=np.zeros((1, 2), dtype=np.float32),
+        offsets=np.zeros(2, dtype=np.int64),
+        contents=None,
+    )
+
+    assert snapshot.content_at(0) == ""
+
+
+def test_stale_current_pointer_rebuilds_snapshot(tmp_path, monkeypatch):
+    (tmp_path / CURRENT_FILE).write_text(json.dumps({"version": "v1", "snapshot": "deleted"}), encoding="utf-8")
+    built = []
+
+    def fake_build_snapshot(index_dir):
+        built.append(index_dir)
+        return tmp_path / "rebuilt"
+
+    def fake_load_snapshot(snapshot_dir):
+        if not snapshot_dir.exists() and snapshot_dir.name == "deleted":
+            raise FileNotFoundError(snapshot_dir)
+        return snapshot_dir.name
+
+    monkeypatch.setattr(local_vector_index, "build_snapshot", fake_build_snapshot)
+    monkeypatch.setattr(local_vector_index, "_load_snapshot", fake_load_snapshot)
+
+    assert LocalVectorIndex(str(tmp_path))._load("v1") == "rebuilt"
+    assert built == [str(tmp_path)]
@@ -0,0 +1,41 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("langchain_google_genai")
+
+import postprocessor
+
+
+class _LoopBoundChat:
+    """처음 사용한 이벤트 루프에 연결이 묶이는 비동기 클라이언트 흉내"""
+
+    def __init__(self):
+        self.loop = None
+
+    async def ainvoke(self, messages):
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        elif self.loop is not loop or self.loop.is_closed():
+            raise RuntimeError("Event loop is closed")
+        return type("Response", (), {
+            "content": json.dumps({"cleaned_explanation": "교정됨"}),
+            "usage_metadata": None,
+        })()
+
+
+def test_async_postprocess_runs_back_to_back(monkeypatch):
+    chat = _LoopBoundChat()
+    monkeypatch.setattr(postprocessor, "get_gemini_chat", lambda model, temperature: chat)
+    monkeypatch.setattr(postprocessor, "get_usd_to_krw_rate", lambda: 1400.0)
+
+    # 카테고리 두 개를 연달아 처리
+    for category in ("Transport Layer", "Network Layer"):
+        questions = [{"question": category, "explanation": "청크 1에 따르면 원본 해설"}]
+
+        postprocessor._postprocess_with_llm(questions, "async")
+
+        assert questions[0]["explanation"] == "교정됨"
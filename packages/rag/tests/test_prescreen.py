@@ -0,0 +1,39 @@
+import pytest
+
+from prescreen import containment_score, containment_scores
+
+
+TCP_CHUNK = (
+    "TCP is a connection-oriented protocol. Before data is sent, the client and server "
+    "perform a three-way handshake: the client sends SYN, the server replies with SYN-ACK, "
+    "and the client answers with ACK."
+)
+
+
+def test_korean_explanation_matches_english_chunk_terms():
+    explanation = (
+        "TCP는 연결 지향 프로토콜로, 데이터 전송 전에 클라이언트가 SYN을 보내고 "
+        "서버가 SYN-ACK로 응답한 뒤 클라이언트가 ACK를 보내는 3-way handshake를 수행합니다."
+    )
+
+    assert containment_score(explanation, [TCP_CHUNK]) >= 0.8
+
+
+def test_explanation_with_unrelated_terms_scores_low():
+    explanation = "UDP는 비연결형이며 DNS 질의에 주로 사용됩니다."
+
+    assert containment_score(explanation, [TCP_CHUNK]) == 0.0
+
+
+def test_explanation_without_terms_is_not_judged():
+    assert containment_score("연결을 수립한 뒤 데이터를 전송합니다.", [TCP_CHUNK]) == 1.0
+
+
+def test_batch_scores_match_single_scores():
+    explanations = ["TCP는 SYN으로 시작합니다.", "UDP는 비연결형입니다.", "QUIC은 UDP 위에서 동작합니다."]
+    contexts = [[TCP_CHUNK], [TCP_CHUNK], ["QUIC runs over UDP.", TCP_CHUNK]]
+
+    scores = containment_scores(explanations, contexts)
+
+    assert scores == [containment_score(e, c) for e, c in zip(explanations, contexts)]
+    assert scores == pytest.approx([1.0, 0.0, 1.0])
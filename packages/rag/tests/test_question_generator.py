@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("requests")
+
+import question_generator
+from question_generator import generate_questions
+from schemas import QuestionGenerationContext
+from token_calculator import TokenUsage
+
+
+def _item(question: str) -> dict:
+    return {
+        "question_type": "short_answer",
+        "difficulty": 2,
+        "question": question,
+        "answer": "3-way handshake",
+        "explanation": "TCP는 연결 수립 시 SYN, SYN-ACK, ACK를 주고받습니다.",
+        "chunk_ids": [1],
+    }
+
+
+def test_final_response_is_reconciled_by_question_text(monkeypatch):
+    first, second, third = (
+        _item("TCP 연결 수립 과정은?"),
+        _item("UDP와 TCP의 차이는?"),
+        _item("흐름 제어란?"),
+    )
+
+    def fake_call(system_prompt, user_prompt, schema, temperature, on_item):
+        # 스트림 파서가 첫 항목을 놓치고 두 번째 항목만 넘긴 경우 (공백/대소문자만 다름)
+        on_item({**second, "question": "  udp와 TCP의   차이는? "})
+        return {"questions": [first, second, third]}, TokenUsage()
+
+    monkeypatch.setattr(question_generator, "call_clova_structured", fake_call)
+    context = QuestionGenerationContext(
+        category_id=1,
+        category_name="Transport Layer",
+        category_path="Computer Networking > Transport Layer",
+        chunks=["TCP uses a three-way handshake."],
+        chunk_ids=[1],
+        target_question_count=3,
+    )
+    streamed = []
+
+    questions, _ = generate_questions(context, on_question=streamed.append)
+
+    assert len(streamed) == 3
+    assert sorted(q.question.split()[0].lower() for q in questions) == ["tcp", "udp와", "흐름"]
@@ -0,0 +1,58 @@
+import pytest
+
+pytest.importorskip("requests")
+
+import reranker
+from reranker import RerankerResult, rerank_chunks_sharded, split_into_shards
+from token_calculator import TokenUsage
+
+
+def _default_candidates():
+    # ETL 청크 크기(1.2~1.6k자 + 헤더)로 top_k=10 후보 구성
+    header = "# Computer Networking\n## Transport Layer\n\n"
+    return [{"id": i, "content": header + "x" * 1600} for i in range(10)]
+
+
+def test_default_candidate_set_is_one_shard():
+    candidates = _default_candidates()
+
+    assert split_into_shards(candidates) == [candidates]
+
+
+def test_default_candidate_set_is_sent_in_one_call(monkeypatch):
+    calls = []
+
+    def fake_rerank_chunks(query, chunks, max_tokens=1024):
+        calls.append(chunks)
+        return RerankerResult(cited_doc_ids=["0"], cited_docs=["x"], usage=TokenUsage())
+
+    monkeypatch.setattr(reranker, "rerank_chunks", fake_rerank_chunks)
+    candidates = _default_candidates()
+
+    rerank_chunks_sharded("TCP", candidates)
+
+    assert calls == [candidates]
+
+
+def test_explicit_max_chars_splits_candidates():
+    shards = split_into_shards(_default_candidates(), max_chars=5000)
+
+    assert [len(shard) for shard in shards] == [3, 3, 3, 1]
+
+
+def test_cache_version_follows_corpus_changes(tmp_path, monkeypatch):
+    import corpus_index
+    from cache_store import SqliteCache
+
+    cache = SqliteCache(path=str(tmp_path / "reranker.sqlite"), table="reranker_results")
+    cache.put("old", b"{}", tag="v1")
+    versions = iter(["v1", "v2"])
+    monkeypatch.setattr(reranker, "_get_reranker_cache", lambda: cache)
+    monkeypatch.setattr(corpus_index, "get_corpus_version", lambda: next(versions))
+    tracker = reranker._RerankerCacheVersion(refresh_interval=0)
+
+    assert tracker.ensure_fresh() == "v1"
+    assert cache.get("old") is not None
+
+    assert tracker.ensure_fresh() == "v2"
+    assert cache.get("old") is None
@@ -0,0 +1,46 @@
+import pytest
+
+from structured_output import compile_schema, repair_question_item
+
+
+def _null_choice_item():
+    return {
+        "question_type": "short_answer",
+        "difficulty": 2,
+        "question": "TCP 연결 수립 과정은?",
+        "answer": "3-way handshake",
+        "explanation": "SYN, SYN-ACK, ACK를 주고받습니다.",
+        "options": None,
+        "correct_index": None,
+        "chunk_ids": [1],
+    }
+
+
+def test_repair_normalizes_null_options_and_correct_index():
+    repaired = repair_question_item(_null_choice_item())
+
+    assert repaired["options"] == []
+    assert repaired["correct_index"] == 0
+
+
+def test_repaired_item_passes_generation_schema():
+    # 실제 생성 스키마로 검증 (question_generator는 requests에 의존)
+    pytest.importorskip("requests")
+    from question_generator import get_question_schema
+
+    validate = compile_schema(get_question_schema()["properties"]["questions"]["items"])
+
+    assert validate(repair_question_item(_null_choice_item())) == []
+
+
+def test_repair_keeps_missing_fields_missing():
+    repaired = repair_question_item({"question_type": "essay"})
+
+    assert "options" not in repaired
+    assert "correct_index" not in repaired
+
+
+def test_repair_unwraps_list_and_string_integers():
+    repaired = repair_question_item({"question_type": " Multiple_Choice ", "correct_index": ["2"], "chunk_ids": "7"})
+
+    assert repaired == {"question_type": "multiple_choice", "correct_index": 2, "chunk_ids": [7]}
@@ -67,6 +67,15 @@ class TokenUsage:
     output_cost: float = 0.0
     total_cost: float = 0.0
 
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            input_cost=self.input_cost + other.input_cost,
+            output_cost=self.output_cost + other.output_cost,
+            total_cost=self.total_cost + other.total_cost,
+        )
+
 
 @dataclass
 class TokenTracker:
@@ -150,6 +159,15 @@ def calculate_cost(
     )
 
 
+def estimate_tokens(text: str) -> int:
+    """API 호출 없이 대략적인 토큰 수 추정 (로그/예산 계산용)
+
+    한글은 음절당 약 1토큰, 그 외 문자는 약 4자당 1토큰으로 계산합니다.
+    """
+    hangul = sum(1 for ch in text if "가" <= ch <= "힣")
+    return hangul + (len(text) - hangul + 3) // 4
+
+
 # ============================================================
 # RAGAS용 Gemini 토큰 파서
 # ============================================================
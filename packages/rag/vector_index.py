@@ -0,0 +1,453 @@
+"""pgvector ANN 인덱스 관리 모듈 - HNSW / IVFFlat 생성, 검색 파라미터, Recall 리포트"""
+
+import argparse
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from config import config
+from db import get_connection, get_cursor
+
+
+TABLE_NAME = "document_embeddings"
+INDEX_NAME = f"{TABLE_NAME}_embedding_idx"  # ETL 노트북과 동일한 인덱스 이름
+TSVECTOR_INDEX_NAME = f"{TABLE_NAME}_tsvector_idx"
+
+SUPPORTED_METHODS = ("hnsw", "ivfflat")
+
+# 1차 후보 검색용 압축 표현 (pgvector 0.7+)
+# - halfvec: float16, 인덱스 크기 1/2
+# - binary: 부호 비트 양자화(binary_quantize), 인덱스 크기 1/32
+QUANTIZATION_MODES = ("none", "halfvec", "binary")
+
+
+def _resolve_quantization(mode: Optional[str]) -> str:
+    """양자화 방식 확인 (기본값: config.VECTOR_QUANTIZATION)"""
+    resolved = (mode or config.VECTOR_QUANTIZATION).lower()
+    if resolved not in QUANTIZATION_MODES:
+        raise ValueError(f"지원하지 않는 양자화 방식: {resolved} (지원: {', '.join(QUANTIZATION_MODES)})")
+    return resolved
+
+
+def get_quantized_index_name(mode: str) -> str:
+    return f"{TABLE_NAME}_embedding_{mode}_idx"
+
+
+def _quantized_expressions(mode: str, query_vector: str = "%(embedding)s::vector") -> tuple[str, str, str]:
+    """양자화 방식별 (인덱스 표현식, 연산자 클래스, 쿼리 거리 표현식)
+
+    쿼리의 ORDER BY 표현식이 인덱스 표현식과 정확히 같아야 인덱스를 사용합니다.
+    query_vector는 쿼리 벡터 SQL 표현식입니다 (배치 검색에서는 q.embedding).
+    """
+    dim = int(config.EMBEDDING_DIMENSION)
+    if mode == "halfvec":
+        return (
+            f"(embedding::halfvec({dim}))",
+            "halfvec_cosine_ops",
+            f"embedding::halfvec({dim}) <=> {query_vector}::halfvec({dim})",
+        )
+    return (
+        f"(binary_quantize(embedding)::bit({dim}))",
+        "bit_hamming_ops",
+        f"binary_quantize(embedding)::bit({dim}) <~> binary_quantize({query_vector})",
+    )
+
+
+def build_quantized_search_query(mode: Optional[str] = None) -> str:
+    """양자화 1차 후보 검색 + 원본 정밀도 재정렬 쿼리 생성
+
+    파라미터: embedding, candidate_k, top_k (pyformat)
+    1차 후보는 id/embedding만 읽고, 본문은 최종 top_k에 대해서만 조회합니다.
+    결과 컬럼: id, content, distance, embedding
+    """
+    mode = _resolve_quantization(mode)
+    if mode == "none":
+        raise ValueError("양자화 방식이 none이면 정밀 검색을 사용하세요")
+    _, _, distance_expr = _quantized_expressions(mode)
+
+    return f"""
+    WITH candidates AS (
+        SELECT id, embedding
+        FROM {TABLE_NAME}
+        ORDER BY {distance_expr}
+        LIMIT %(candidate_k)s
+    ),
+    reranked AS (
+        SELECT id, embedding <=> %(embedding)s::vector AS distance
+        FROM candidates
+        ORDER BY distance ASC
+        LIMIT %(top_k)s
+    )
+    SELECT d.id, d.content, r.distance, d.embedding
+    FROM reranked r
+    JOIN {TABLE_NAME} d ON d.id = r.id
+    ORDER BY r.distance ASC
+    """
+
+
+def build_quantized_batch_search_query(mode: Optional[str] = None) -> str:
+    """여러 쿼리 벡터에 대한 양자화 후보 검색 + 정밀 재정렬 쿼리 생성 (단일 DB 왕복)
+
+    build_quantized_search_query와 같은 후보/재정렬 방식을 unnest + LATERAL로 쿼리별 수행합니다.
+    파라미터: embeddings (vector[]), candidate_k, top_k (pyformat)
+    결과 컬럼: ord (1부터 시작하는 입력 순서), id, content, distance, embedding
+    """
+    mode = _resolve_quantization(mode)
+    if mode == "none":
+        raise ValueError("양자화 방식이 none이면 정밀 검색을 사용하세요")
+    _, _, distance_expr = _quantized_expressions(mode, query_vector="q.embedding")
+
+    return f"""
+    SELECT q.ord, c.*
+    FROM unnest(%(embeddings)s::vector[]) WITH ORDINALITY AS q(embedding, ord)
+    CROSS JOIN LATERAL (
+        SELECT d.id, d.content, r.distance, d.embedding
+        FROM (
+            SELECT candidates.id, candidates.embedding <=> q.embedding AS distance
+            FROM (
+                SELECT id, embedding
+                FROM {TABLE_NAME}
+                ORDER BY {distance_expr}
+                LIMIT %(candidate_k)s
+            ) candidates
+            ORDER BY distance ASC
+            LIMIT %(top_k)s
+        ) r
+        JOIN {TABLE_NAME} d ON d.id = r.id
+    ) c
+    ORDER BY q.ord, c.distance ASC
+    """
+
+
+def _resolve_method(method: Optional[str]) -> str:
+    """인덱스 방식 확인 (기본값: config.VECTOR_INDEX_METHOD)"""
+    resolved = (method or config.VECTOR_INDEX_METHOD).lower()
+    if resolved not in SUPPORTED_METHODS:
+        raise ValueError(f"지원하지 않는 인덱스 방식: {resolved} (지원: {', '.join(SUPPORTED_METHODS)})")
+    return resolved
+
+
+def get_corpus_version(cursor=None) -> str:
+    """document_embeddings 코퍼스 버전 조회 (행 수 + 최대 ID + 최근 적재 시각)
+
+    ETL 재적재(TRUNCATE 후 INSERT)나 추가 적재 시 값이 바뀌므로 스냅샷/캐시 무효화 기준으로 사용합니다.
+    """
+    query = f"""
+    SELECT COUNT(*) AS row_count, COALESCE(MAX(id), 0) AS max_id, MAX(created_at) AS updated_at
+    FROM {TABLE_NAME}
+    """
+    if cursor is not None:
+        cursor.execute(query)
+        result = cursor.fetchone()
+    else:
+        with get_connection() as conn:
+            with get_cursor(conn) as cursor:
+                cursor.execute(query)
+                result = cursor.fetchone()
+    return f"{result['row_count']}-{result['max_id']}-{result['updated_at']}"
+
+
+def get_vector_index_definition() -> Optional[str]:
+    """현재 임베딩 인덱스 정의 조회 (없으면 None)"""
+    query = """
+    SELECT indexdef
+    FROM pg_indexes
+    WHERE tablename = %s AND indexname = %s
+    """
+    with get_connection() as conn:
+        with get_cursor(conn) as cursor:
+            cursor.execute(query, (TABLE_NAME, INDEX_NAME))
+            result = cursor.fetchone()
+            return result["indexdef"] if result else None
+
+
+def create_vector_index(
+    method: Optional[str] = None,
+    m: Optional[int] = None,
+    ef_construction: Optional[int] = None,
+    lists: Optional[int] = None,
+    replace: bool = False,
+) -> str:
+    """임베딩 컬럼에 ANN 인덱스 생성 (cosine 거리)
+
+    CONCURRENTLY로 생성하므로 검색을 막지 않습니다.
+    IVFFlat은 클러스터 학습에 데이터가 필요하므로 적재 이후에 생성해야 합니다.
+
+    Args:
+        method: 인덱스 방식 ("hnsw" 또는 "ivfflat", 기본값 config.VECTOR_INDEX_METHOD)
+        m: HNSW 노드당 최대 연결 수 (기본값 config.HNSW_M)
+        ef_construction: HNSW 빌드 시 후보 리스트 크기 (기본값 config.HNSW_EF_CONSTRUCTION)
+        lists: IVFFlat 클러스터 수 (기본값 config.IVFFLAT_LISTS)
+        replace: 기존 인덱스가 있으면 삭제 후 재생성
+
+    Returns:
+        생성된 인덱스 정의
+    """
+    method = _resolve_method(method)
+
+    if method == "hnsw":
+        options = "m = %s, ef_construction = %s"
+        params = (
+            int(m or config.HNSW_M),
+            int(ef_construction or config.HNSW_EF_CONSTRUCTION),
+        )
+    else:
+        options = "lists = %s"
+        params = (int(lists or config.IVFFLAT_LISTS),)
+
+    query = f"""
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME}
+    ON {TABLE_NAME} USING {method} (embedding vector_cosine_ops)
+    WITH ({options})
+    """
+
+    with get_connection() as conn:
+        # CONCURRENTLY는 트랜잭션 블록 밖에서만 실행 가능
+        conn.autocommit = True
+        with get_cursor(conn) as cursor:
+            if replace:
+                cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+            cursor.execute(query, params)
+
+    return get_vector_index_definition() or ""
+
+
+def create_quantized_index(
+    mode: Optional[str] = None,
+    m: Optional[int] = None,
+    ef_construction: Optional[int] = None,
+) -> str:
+    """양자화 표현식에 HNSW 인덱스 생성 (1차 후보 검색용)
+
+    Args:
+        mode: "halfvec" 또는 "binary" (기본값 config.VECTOR_QUANTIZATION)
+        m: HNSW 노드당 최대 연결 수 (기본값 config.HNSW_M)
+        ef_construction: HNSW 빌드 시 후보 리스트 크기 (기본값 config.HNSW_EF_CONSTRUCTION)
+
+    Returns:
+        생성된 인덱스 이름
+    """
+    mode = _resolve_quantization(mode)
+    if mode == "none":
+        raise ValueError("양자화 방식을 지정하세요 (halfvec | binary)")
+    index_expr, opclass, _ = _quantized_expressions(mode)
+    index_name = get_quantized_index_name(mode)
+
+    with get_connection() as conn:
+        conn.autocommit = True
+        with get_cursor(conn) as cursor:
+            cursor.execute(
+                f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                ON {TABLE_NAME} USING hnsw ({index_expr} {opclass})
+                WITH (m = %s, ef_construction = %s)
+                """,
+                (int(m or config.HNSW_M), int(ef_construction or config.HNSW_EF_CONSTRUCTION)),
+            )
+
+    return index_name
+
+
+def create_text_search_index() -> None:
+    """tsvector 컬럼에 GIN 인덱스 생성 (Hybrid Search 키워드 후보 검색용)"""
+    with get_connection() as conn:
+        conn.autocommit = True
+        with get_cursor(conn) as cursor:
+            cursor.execute(f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {TSVECTOR_INDEX_NAME}
+            ON {TABLE_NAME} USING gin (tsvector)
+            """)
+
+
+def drop_vector_index() -> None:
+    """임베딩 ANN 인덱스 삭제"""
+    with get_connection() as conn:
+        conn.autocommit = True
+        with get_cursor(conn) as cursor:
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+
+
+def apply_search_params(cursor, limit: int = 0, method: Optional[str] = None) -> None:
+    """쿼리 단위 ANN 검색 파라미터 적용 (SET LOCAL, 현재 트랜잭션에만 유효)
+
+    - HNSW: hnsw.ef_search (클수록 recall↑, latency↑, LIMIT보다 작으면 결과가 잘림)
+    - IVFFlat: ivfflat.probes (클수록 recall↑, latency↑)
+
+    Args:
+        cursor: 검색 쿼리를 실행할 커서
+        limit: 검색할 Top-K (ef_search 하한으로 사용)
+        method: 인덱스 방식 (기본값 config.VECTOR_INDEX_METHOD)
+    """
+    method = _resolve_method(method)
+    if method == "hnsw":
+        ef_search = max(int(config.HNSW_EF_SEARCH), int(limit))
+        cursor.execute("SET LOCAL hnsw.ef_search = %s", (ef_search,))
+    else:
+        cursor.execute("SET LOCAL ivfflat.probes = %s", (int(config.IVFFLAT_PROBES),))
+
+
+# ============================================================
+# Recall vs Latency 리포트
+# ============================================================
+
+@dataclass
+class RecallReport:
+    """ANN 검색과 정확 검색(Exact) 비교 결과"""
+    method: str
+    top_k: int
+    sample_size: int
+    quantization: str = "none"
+    recalls: list[float] = field(default_factory=list)
+    ann_latencies_ms: list[float] = field(default_factory=list)
+    exact_latencies_ms: list[float] = field(default_factory=list)
+
+    @property
+    def mean_recall(self) -> float:
+        return sum(self.recalls) / len(self.recalls) if self.recalls else 0.0
+
+    @staticmethod
+    def _percentile(values: list[float], pct: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> str:
+        ann_p50 = self._percentile(self.ann_latencies_ms, 50)
+        ann_p95 = self._percentile(self.ann_latencies_ms, 95)
+        exact_p50 = self._percentile(self.exact_latencies_ms, 50)
+        exact_p95 = self._percentile(self.exact_latencies_ms, 95)
+        return (
+            f"[{self.method}/{self.quantization}] recall@{self.top_k}: {self.mean_recall:.4f} "
+            f"(샘플 {self.sample_size}개) | "
+            f"ANN p50 {ann_p50:.1f}ms / p95 {ann_p95:.1f}ms | "
+            f"Exact p50 {exact_p50:.1f}ms / p95 {exact_p95:.1f}ms"
+        )
+
+
+def _timed_top_k(cursor, embedding: str, top_k: int) -> tuple[list[int], float]:
+    """Top-K 검색 실행 후 (ID 목록, 소요시간 ms) 반환"""
+    query = f"""
+    SELECT id
+    FROM {TABLE_NAME}
+    ORDER BY embedding <=> %s::vector
+    LIMIT %s
+    """
+    start = time.perf_counter()
+    cursor.execute(query, (embedding, top_k))
+    rows = cursor.fetchall()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return [row["id"] for row in rows], elapsed_ms
+
+
+def _timed_quantized_top_k(cursor, embedding: str, top_k: int, mode: str) -> tuple[list[int], float]:
+    """양자화 후보 검색 + 재정렬 실행 후 (ID 목록, 소요시간 ms) 반환"""
+    query = build_quantized_search_query(mode)
+    params = {"embedding": embedding, "candidate_k": config.QUANTIZED_CANDIDATE_K, "top_k": top_k}
+    start = time.perf_counter()
+    cursor.execute(query, params)
+    rows = cursor.fetchall()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return [row["id"] for row in rows], elapsed_ms
+
+
+def benchmark_recall(
+    sample_size: int = 20,
+    top_k: int = 10,
+    method: Optional[str] = None,
+    quantization: Optional[str] = None,
+) -> RecallReport:
+    """코퍼스에서 샘플링한 임베딩을 쿼리로 ANN vs Exact recall/latency 측정
+
+    Args:
+        sample_size: 쿼리로 사용할 샘플 수
+        top_k: 비교할 Top-K
+        method: 검색 파라미터를 적용할 인덱스 방식 (기본값 config.VECTOR_INDEX_METHOD)
+        quantization: ANN 쪽에 사용할 양자화 방식 (기본값 config.VECTOR_QUANTIZATION)
+
+    Returns:
+        RecallReport
+    """
+    method = _resolve_method(method)
+    quantization = _resolve_quantization(quantization)
+    report = RecallReport(method=method, top_k=top_k, sample_size=sample_size, quantization=quantization)
+
+    with get_connection() as conn:
+        with get_cursor(conn) as cursor:
+            cursor.execute(
+                f"SELECT embedding::text AS embedding FROM {TABLE_NAME} ORDER BY random() LIMIT %s",
+                (sample_size,),
+            )
+            samples = [row["embedding"] for row in cursor.fetchall()]
+        conn.rollback()
+
+        for embedding in samples:
+            with get_cursor(conn) as cursor:
+                # Exact: 인덱스 스캔 비활성화 → 전체 스캔
+                cursor.execute("SET LOCAL enable_indexscan = off")
+                exact_ids, exact_ms = _timed_top_k(cursor, embedding, top_k)
+            conn.rollback()
+
+            with get_cursor(conn) as cursor:
+                if quantization == "none":
+                    apply_search_params(cursor, top_k, method)
+                    ann_ids, ann_ms = _timed_top_k(cursor, embedding, top_k)
+                else:
+                    apply_search_params(cursor, config.QUANTIZED_CANDIDATE_K, "hnsw")
+                    ann_ids, ann_ms = _timed_quantized_top_k(cursor, embedding, top_k, quantization)
+            conn.rollback()
+
+            if exact_ids:
+                report.recalls.append(len(set(ann_ids) & set(exact_ids)) / len(exact_ids))
+            report.exact_latencies_ms.append(exact_ms)
+            report.ann_latencies_ms.append(ann_ms)
+
+    report.sample_size = len(samples)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="document_embeddings ANN 인덱스 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create_parser = subparsers.add_parser("create", help="ANN 인덱스 생성")
+    create_parser.add_argument("--method", choices=SUPPORTED_METHODS)
+    create_parser.add_argument("--m", type=int)
+    create_parser.add_argument("--ef-construction", type=int)
+    create_parser.add_argument("--lists", type=int)
+    create_parser.add_argument("--replace", action="store_true")
+
+    quantized_parser = subparsers.add_parser("create-quantized", help="양자화 HNSW 인덱스 생성")
+    quantized_parser.add_argument("--mode", choices=QUANTIZATION_MODES[1:], required=True)
+
+    subparsers.add_parser("create-text", help="tsvector GIN 인덱스 생성")
+    subparsers.add_parser("drop", help="ANN 인덱스 삭제")
+
+    report_parser = subparsers.add_parser("report", help="Recall vs Latency 리포트")
+    report_parser.add_argument("--method", choices=SUPPORTED_METHODS)
+    report_parser.add_argument("--samples", type=int, default=20)
+    report_parser.add_argument("--top-k", type=int, default=10)
+    report_parser.add_argument("--quantization", choices=QUANTIZATION_MODES)
+
+    args = parser.parse_args()
+
+    if args.command == "create":
+        definition = create_vector_index(
+            method=args.method,
+            m=args.m,
+            ef_construction=args.ef_construction,
+            lists=args.lists,
+            replace=args.replace,
+        )
+        print(f"인덱스 생성 완료: {definition}")
+    elif args.command == "create-quantized":
+        print(f"인덱스 생성 완료: {create_quantized_index(args.mode)}")
+    elif args.command == "create-text":
+        create_text_search_index()
+        print(f"인덱스 생성 완료: {TSVECTOR_INDEX_NAME}")
+    elif args.command == "drop":
+        drop_vector_index()
+        print(f"인덱스 삭제 완료: {INDEX_NAME}")
+    else:
+        print(benchmark_recall(args.samples, args.top_k, args.method, args.quantization).summary())
@@ -0,0 +1,72 @@
+"""벡터 파라미터 직렬화 마이크로벤치마크
+
+쿼리 임베딩을 DB로 보낼 때의 클라이언트 직렬화 시간과 payload 크기를 비교합니다.
+- list[float] → ARRAY[...] 리터럴 (기존 방식, 서버에서 numeric[] 파싱 후 vector 캐스팅)
+- np.ndarray → pgvector 기본 어댑터 텍스트
+- np.ndarray → CompactVectorAdapter 텍스트 (db.py에서 등록하는 어댑터)
+- pgvector 바이너리 포맷 (psycopg2는 바이너리 파라미터 미지원, psycopg3 기준 참고값)
+
+결과 조회 쪽은 텍스트 → list[float](JSON) vs 텍스트 → np.ndarray(pgvector 캐스터)를 비교합니다.
+
+실행: python vector_serialization_benchmark.py [--repeat 1000]
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+import numpy as np
+from psycopg2.extensions import adapt
+from pgvector import Vector
+from pgvector.psycopg2.vector import VectorAdapter
+
+from config import config
+from db import CompactVectorAdapter
+
+
+def _measure(fn: Callable[[], object], repeat: int) -> tuple[float, object]:
+    """fn을 repeat번 실행한 평균 시간(us)과 마지막 결과 반환"""
+    result = fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed_us = (time.perf_counter() - start) / repeat * 1e6
+    return elapsed_us, result
+
+
+def run_benchmark(repeat: int = 1000, dimension: int = config.EMBEDDING_DIMENSION) -> None:
+    """직렬화/역직렬화 벤치마크 실행 후 결과 출력"""
+    embedding = np.random.default_rng(0).standard_normal(dimension).astype(np.float32)
+    as_list = embedding.tolist()  # Clova API 응답과 같은 list[float]
+
+    print(f"\n[벡터 직렬화 벤치마크] 차원 {dimension}, 반복 {repeat}회")
+    print(f"{'방식':<40} {'시간(us)':>10} {'크기(bytes)':>12}")
+    print("-" * 64)
+
+    send_cases = [
+        ("list[float] → ARRAY 리터럴 (기존)", lambda: adapt(as_list).getquoted()),
+        ("ndarray → pgvector 기본 텍스트", lambda: VectorAdapter(embedding).getquoted()),
+        ("ndarray → CompactVectorAdapter", lambda: CompactVectorAdapter(embedding).getquoted()),
+        ("pgvector 바이너리 (psycopg3 참고)", lambda: Vector(embedding).to_binary()),
+    ]
+    for name, fn in send_cases:
+        elapsed_us, payload = _measure(fn, repeat)
+        print(f"{name:<40} {elapsed_us:>10.1f} {len(payload):>12,}")
+
+    text = Vector(embedding).to_text()
+    print("-" * 64)
+    receive_cases = [
+        ("텍스트 → list[float] (json.loads)", lambda: json.loads(text)),
+        ("텍스트 → ndarray (pgvector 캐스터)", lambda: Vector._from_db(text)),
+    ]
+    for name, fn in receive_cases:
+        elapsed_us, _ = _measure(fn, repeat)
+        print(f"{name:<40} {elapsed_us:>10.1f} {len(text):>12,}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벡터 파라미터 직렬화 마이크로벤치마크")
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    run_benchmark(args.repeat)